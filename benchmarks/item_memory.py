@@ -0,0 +1,50 @@
+"""
+Benchmark measuring memory allocated per item, for pages creating tens of thousands of items.
+
+Run from the repository root:
+    python benchmarks/item_memory.py [number_of_items]
+"""
+
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed
+
+import pygame
+
+from pyggui.gui.container import StaticContainer
+from pyggui.gui.image import StaticImage
+from pyggui.gui.item import StaticItem
+
+
+def measure(name: str, factory, number_of_items: int) -> None:
+    """
+    Function creates number_of_items items using factory and prints memory allocated while doing so.
+
+    Args:
+        name (str): Name printed next to result.
+        factory (Callable): Function accepting the index of item, returning a new item.
+        number_of_items (int): Number of items to create.
+    """
+    tracemalloc.start()
+    items = [factory(i) for i in range(number_of_items)]
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<20} {allocated / 2 ** 20:8.2f} MiB  {allocated / len(items):8.1f} B/item  "
+          f"(peak {peak / 2 ** 20:.2f} MiB)")
+
+
+def main(number_of_items: int = 100_000) -> None:
+    pygame.init()
+    pygame.display.set_mode((720, 360))
+    tile = pygame.Surface((16, 16)).convert()  # Shared by every image item
+
+    print(f"Creating {number_of_items} items of each type")
+    measure("StaticItem", lambda i: StaticItem(position=(i % 720, i // 720), size=(16, 16)), number_of_items)
+    measure("StaticImage", lambda i: StaticImage(tile, position=(i % 720, i // 720)), number_of_items)
+    measure("StaticContainer", lambda i: StaticContainer(position=(i % 720, i // 720)), number_of_items)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -78,6 +78,7 @@ setup(
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
+        'numpy': ['numpy'],
     },
     entry_points={
         'console_scripts': [
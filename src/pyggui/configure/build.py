@@ -8,21 +8,52 @@ import os
 from pyggui.helpers import Json
 
 
-def update_config_file(dir_path: str, data: Dict) -> None:
+def create_build_directory(dir_path: str) -> str:
     """
-    Function updates the current config file in the project using this library.
-    Where config file is just a config.json file saved in the build directory on the top level of the project.
+    Function creates the build directory on the top level of the project, if it does not exist yet.
 
     Args:
         dir_path (str): Path to projects directory.
-        data (Dict): Dictionary of key, value pairs to update in the file.
+
+    Returns:
+        str: Path to build directory.
     """
     build_path = os.path.join(dir_path, "build")
     if not os.path.isdir(build_path):
         os.mkdir(build_path)
+    return build_path
+
 
+def update_config_file(dir_path: str, data: Dict) -> None:
+    """
+    Function updates the current config file in the project using this library.
+    Where config file is just a config.json file saved in the build directory on the top level of the project.
+
+    Args:
+        dir_path (str): Path to projects directory.
+        data (Dict): Dictionary of key, value pairs to update in the file.
+    """
+    build_path = create_build_directory(dir_path)
     config_file_path = os.path.join(build_path, "configure.json")
     if os.path.isfile(config_file_path):
         Json.update(config_file_path, data)
     else:
         Json.save(config_file_path, data)
+
+
+def read_config_file(dir_path: str) -> Dict:
+    """
+    Function reads the current config file in the project using this library.
+
+    Args:
+        dir_path (str): Path to projects directory.
+
+    Returns:
+        Dict: Contents of config file, None if it does not exist.
+    """
+    config_file_path = os.path.join(dir_path, "build", "configure.json")
+    if os.path.isfile(config_file_path):
+        try:
+            return Json.load(config_file_path)
+        except ValueError:  # Corrupted file, gets re-created
+            return None
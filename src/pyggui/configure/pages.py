@@ -2,6 +2,10 @@
 Module used for setting up page classes and page-holding modules throughout directory.
 Ultimately the functions used here are used for importing all modules that contain classes that inherit from one parent
 class of the _pyggui.gui.page module. This is then used by the controller class to fetch all Page type classes.
+
+Once all modules have been imported, the names of found pages and the modules they are defined in are saved into the
+build/configure.json manifest along with modification times of the page directory. On later runs, if the directory
+did not change, pages are registered from the manifest and their modules only get imported once first redirected to.
 """
 
 from typing import Dict, List
@@ -12,12 +16,53 @@ import glob
 import importlib
 import pkgutil
 
-from pyggui.configure.build import update_config_file
+from pyggui.configure.build import create_build_directory, update_config_file, read_config_file
+
+ignore_directories = ["venv", "env", "__pycache__"]
+
+# Pages registered from the manifest, key = name of page class, value = import string of module defining it
+lazy_pages: Dict[str, str] = {}
+
+
+class PageRegistry:
+    """
+    Dictionary like object holding page classes under their class names. Pages can also be registered lazily, by the
+    import string of the module defining them; the module then gets imported once the page is first accessed.
+    """
+    def __init__(self, pages: Dict[str, any] = None, lazy: Dict[str, str] = None):
+        """
+        Args:
+            pages (Dict[str, any]): Dictionary of page class name, page class pairs.
+            lazy (Dict[str, str]): Dictionary of page class name, module import string pairs.
+        """
+        self._pages = dict(pages) if pages else {}
+        self._lazy = {name: module for name, module in (lazy or {}).items() if name not in self._pages}
+
+    def __getitem__(self, name: str) -> any:
+        if name in self._lazy:  # Import module on first access
+            module = importlib.import_module(self._lazy.pop(name))
+            self._pages[name] = getattr(module, name)
+        return self._pages[name]
+
+    def __setitem__(self, name: str, page: any) -> None:
+        self._lazy.pop(name, None)
+        self._pages[name] = page
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pages or name in self._lazy
+
+    def __len__(self) -> int:
+        return len(self._pages) + len(self._lazy)
 
-ignore_directories = ["venv", "env"]
+    def __iter__(self):
+        yield from self._pages
+        yield from self._lazy
 
+    def keys(self) -> List[str]:
+        return list(self)
 
-def get_all_page_classes() -> Dict[str, any]:
+
+def get_imported_page_classes() -> Dict[str, any]:
     """
     Function returns a dictionary containing all classes that:
         Are imported and are subclasses of classes defined in the _pyggui.gui.page module
@@ -34,6 +79,17 @@ def get_all_page_classes() -> Dict[str, any]:
     return pages
 
 
+def get_all_page_classes() -> PageRegistry:
+    """
+    Function returns a registry containing all imported page classes (see get_imported_page_classes) and pages
+    registered from the manifest, whose modules have not been imported yet.
+
+    Returns:
+        PageRegistry: Where: key = str(name_of_class), value = class.
+    """
+    return PageRegistry(pages=get_imported_page_classes(), lazy=lazy_pages)
+
+
 def create_module_import_string(package_name: str, module_path: str) -> str:
     """
     Function creates a module import string (ex. foo.bar.module) based on the package name and file path of python
@@ -69,7 +125,22 @@ def get_all_page_import_strings(dir_path: str, called_from_module: str) -> List[
         dir_path (str): Directory root to import all modules from its structure.
         called_from_module (str): Absolute path of module where call originated (main module), will be ignored.
     """
-    import_strings = []
+    return list(get_page_modules(dir_path, called_from_module).values())
+
+
+def get_page_modules(dir_path: str, called_from_module: str) -> Dict[str, str]:
+    """
+    Function reads the directory structure and creates import strings of all modules in it except the
+    called_from_module.
+
+    Args:
+        dir_path (str): Directory root to import all modules from its structure.
+        called_from_module (str): Absolute path of module where call originated (main module), will be ignored.
+
+    Returns:
+        Dict[str, str]: Where: key = absolute path of module, value = module import string.
+    """
+    modules = {}
     # Get directory of module the call originated from
     package_name = os.path.basename(os.path.dirname(called_from_module))
     # Traverse directory structure, ignore some directories
@@ -81,37 +152,118 @@ def get_all_page_import_strings(dir_path: str, called_from_module: str) -> List[
                 file_path = os.path.join(root, filename)
                 # Check file is not the one where the call originated from (this would cause double imports)
                 if not os.path.samefile(file_path, called_from_module):
-                    # Create module-import string and import the module
-                    import_strings.append(create_module_import_string(package_name, os.path.join(root, filename)))
-    return import_strings
+                    # Create module-import string
+                    modules[os.path.abspath(file_path)] = create_module_import_string(package_name, file_path)
+    return modules
+
+
+def get_modification_times(dir_path: str, files: List[str], exclude: str = None) -> Dict[str, Dict[str, int]]:
+    """
+    Function fetches modification times (in ns) of every directory in the directory structure (changes when files
+    get added or removed) and of every passed file.
+
+    Args:
+        dir_path (str): Directory root.
+        files (List[str]): List of file paths.
+        exclude (str): Path of directory to leave out along with its sub-directories (the build directory, which
+            changes whenever the manifest is written). Defaults to None.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Dictionary with keys directories and files, each holding path, mtime pairs.
+    """
+    exclude = os.path.abspath(exclude) if exclude else None
+    directories = {}
+    for root, dirs, _ in os.walk(dir_path):
+        dirs[:] = [
+            d for d in dirs if d not in ignore_directories and os.path.abspath(os.path.join(root, d)) != exclude
+        ]
+        directories[os.path.abspath(root)] = os.stat(root).st_mtime_ns
+    return {
+        "directories": directories,
+        "files": {path: os.stat(path).st_mtime_ns for path in files}
+    }
+
+
+def manifest_is_valid(manifest: Dict, dir_path: str) -> bool:
+    """
+    Function checks the page manifest was created for the directory, and that no directory or module in it changed
+    since (by comparing modification times). Only directories and modules listed in the manifest get checked, added
+    files or directories change the modification time of their (listed) parent directory.
+
+    Args:
+        manifest (Dict): Contents of the configure.json file.
+        dir_path (str): Directory root pages are imported from.
+
+    Returns:
+        bool: If pages can be registered from manifest.
+    """
+    if not manifest or manifest.get("page_directory") != os.path.abspath(dir_path):
+        return False
+    try:
+        recorded = manifest["modification_times"]
+        for group in ("directories", "files"):
+            for path, mtime in recorded[group].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+    except (KeyError, AttributeError, OSError):  # Manifest from older version or a directory/module was removed
+        return False
+    return True
 
 
 def import_all_modules(dir_path: str, called_from_module: str) -> None:
     """
-    Function imports all modules in the directory structure except the called_from_module.
+    Function imports all modules in the directory structure except the called_from_module. Names of page classes and
+    modules defining them are saved into the manifest.
 
     Args:
         dir_path (str): Directory root to import all modules from its structure.
         called_from_module (str): Absolute path of module where call originated (main module), will be ignored.
     """
-    import_strings = get_all_page_import_strings(dir_path, called_from_module)
+    modules = get_page_modules(dir_path, called_from_module)
+    import_strings = list(modules.values())
 
     for import_string in import_strings:
         importlib.import_module(import_string)
 
+    # Pages defined in imported modules
+    pages = {
+        name: page.__module__ for name, page in get_imported_page_classes().items() if page.__module__ in import_strings
+    }
     # Save import strings into the config.json file located in the (newly created) build directory in the curr. proj.
-    dir_path = os.path.dirname(called_from_module)
+    # Build directory is created before modification times are recorded, as creating it changes the projects directory
+    project_path = os.path.dirname(called_from_module)
+    build_path = create_build_directory(project_path)
     config_dict = {
         "imports": import_strings,
-        "project_path": dir_path
+        "project_path": project_path,
+        "page_directory": os.path.abspath(dir_path),
+        "pages": pages,
+        "modification_times": get_modification_times(dir_path, list(modules), exclude=build_path)
     }
-    update_config_file(dir_path=dir_path, data=config_dict)
+    update_config_file(dir_path=project_path, data=config_dict)
+
+
+def register_pages(dir_path: str, called_from_module: str) -> None:
+    """
+    Function registers pages from the manifest if it is still valid, otherwise imports all modules in the directory
+    structure (which also re-creates the manifest).
+
+    Args:
+        dir_path (str): Directory root to import all modules from its structure.
+        called_from_module (str): Absolute path of module where call originated (main module), will be ignored.
+    """
+    manifest = read_config_file(dir_path=os.path.dirname(called_from_module))
+    if manifest_is_valid(manifest, dir_path):
+        lazy_pages.update(manifest["pages"])
+    else:
+        import_all_modules(dir_path=dir_path, called_from_module=called_from_module)
 
 
 def setup(call_from: inspect.FrameInfo, directory: str = None) -> None:
     """
     Function imports all modules in the directory. If directory is not passed it will import all modules in the
-    directory where the call originated from i.e. call_from modules parent directory.
+    directory where the call originated from i.e. call_from modules parent directory. If the directory did not
+    change since the last run, pages get registered from the manifest instead and no module is imported.
     Function should be used for importing modules of type page, i.e. modules containing classes that inherit from Page,
     or any other class defined in the _pyggui.gui.page module.
 
@@ -127,5 +279,5 @@ def setup(call_from: inspect.FrameInfo, directory: str = None) -> None:
     elif not os.path.isabs(directory):  # If passed as relative, join with directory of module
         directory = os.path.join(os.path.dirname(module_file), directory)
     directory = os.path.normpath(directory)  # Normalize path
-    # Import all modules except the one where the call originated from
-    import_all_modules(dir_path=directory, called_from_module=module_file)
+    # Register pages from manifest or import all modules except the one where the call originated from
+    register_pages(dir_path=directory, called_from_module=module_file)
@@ -4,21 +4,105 @@ Module containing the controller class.
 Controller class object acts as an intermediate between game wide objects, used for page redirection, game pausing, ...
 """
 
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 import traceback
 
+import pygame
+
 from pyggui.helpers.stack import Stack
+from pyggui.helpers.cache import LRUCache
+from pyggui.helpers.file_handling import ImageLoader
 from pyggui.defaults.__welcome_page import _WelcomePage
-from pyggui.configure.pages import get_all_page_classes
+from pyggui.configure.pages import get_all_page_classes, PageRegistry
 from pyggui.exceptions import RedirectionError
 from pyggui.gui.page import Page
+from pyggui.gui.tween import TweenEngine
+
+
+class PagePrefetch:
+    """
+    Class holds the state of a single page being prefetched; its images being decoded on worker threads and the
+    warmed page instance, once it gets constructed on the main thread.
+    """
+    def __init__(self, page_class: any, args: Tuple, kwargs: Dict, futures: List[Tuple[str, Future]]):
+        """
+        Args:
+            page_class (any): Class of prefetched page.
+            args (Tuple): Args passed to page class initialization.
+            kwargs (Dict): Kwargs passed to page class initialization.
+            futures (List[Tuple[str, Future]]): List of (image path, Future of its decoded surface).
+        """
+        self.page_class = page_class
+        self.args = args
+        self.kwargs = kwargs
+        self.futures = futures
+        self.page = None  # Warmed page instance
+
+    @property
+    def decoded(self) -> bool:
+        """
+        If every image of page has been decoded.
+        """
+        return all(future.done() for _, future in self.futures)
+
+    def matches(self, args: Tuple, kwargs: Dict) -> bool:
+        """
+        Method checks if the page was prefetched with the same arguments.
+
+        Args:
+            args (Tuple): Args passed to redirection.
+            kwargs (Dict): Kwargs passed to redirection.
+
+        Returns:
+            bool: If arguments match.
+        """
+        return self.args == args and self.kwargs == kwargs
+
+    def construct(self, controller: 'Controller') -> any:
+        """
+        Method constructs page on the main thread using the decoded images, waits for images still being decoded.
+
+        Args:
+            controller (Controller): Main controller object.
+
+        Returns:
+            any: Constructed page.
+        """
+        for path, future in self.futures:
+            if future.exception() is None:  # Failed images get decoded again (and raise) in page construction
+                ImageLoader.stage(path, future.result())
+        self.page = self.page_class(controller, *self.args, **self.kwargs)
+        for path, _ in self.futures:  # Remove images the page did not load
+            ImageLoader.unstage(path)
+        self.futures = []
+        return self.page
+
+    def discard(self) -> None:
+        """
+        Method drops the prefetched state; cancels pending image decodes, removes decoded images that were staged and
+        releases the warmed page instance.
+        """
+        for path, future in self.futures:
+            future.cancel()
+            ImageLoader.unstage(path)
+        self.futures = []
+        self.page = None
 
 
 class Controller:
     """
     Main object throughout the game. Mediator between game object and everything else.
     Contains page_stack attribute which is a Stack, containing visited pages.
+    Instances of pages marked as reusable are kept alive in the page_cache attribute, an LRUCache bounded by the
+    number of pages (max_items) and by their estimated memory in bytes (max_size, set by the games page_cache_size).
+    Memory of a cached page is estimated when it gets cached and again every time it is left, as pages may grow while
+    shown.
+    Prefetched pages not yet redirected to are kept in a separate LRUCache of at most max_prefetched pages, evicted
+    prefetches get discarded.
     """
+    max_prefetched: int = 4
+
     def __init__(self, game: 'Game'):
         """
         Args:
@@ -27,12 +111,24 @@ class Controller:
         self.game = game
         self._input = self.game.input  # Set input attr. Accessible through properties
         # Pages setup
-        self.pages: Dict = get_all_page_classes()
+        self.pages: PageRegistry = get_all_page_classes()  # Page modules may get imported on first access
         self.page_stack: Stack = Stack()
+        self.page_cache: LRUCache = LRUCache(
+            max_items=8,
+            max_size=game.page_cache_size,
+            size_function=lambda page: page.estimate_memory()
+        )
+        self._prefetched: LRUCache = LRUCache(
+            max_items=self.max_prefetched,
+            on_evict=lambda name, prefetch: prefetch.discard()
+        )
+        self._prefetch_executor: ThreadPoolExecutor = None  # Created once first needed
         # Overlay page and items dictionary
         self.overlay_page = Page(self)
         self.overlay_items = {}
         self._single_page = True
+        # Tweens of item properties, advanced once per frame
+        self.tweens: TweenEngine = TweenEngine()
         # Landing page setup
         # If no page was found or the default entry was left as is -> add the welcome_page from defaults
         if not bool(self.pages) or self.game.entry_page == "_WelcomePage":
@@ -73,6 +169,16 @@ class Controller:
         """
         return self.game.dt_s
 
+    @property
+    def frame_stats(self) -> 'FrameStatistics':
+        """
+        Frame time statistics of the main game loop.
+
+        Returns:
+            FrameStatistics: Statistics object
+        """
+        return self.game.frame_stats
+
     @property
     def paused(self) -> bool:
         """
@@ -83,6 +189,40 @@ class Controller:
         """
         return self.game.paused
 
+    @property
+    def busy(self) -> bool:
+        """
+        If the controller has pending work that has to run in the following frames (ex. prefetching pages), the game
+        loop does not go idle while busy (or while tweens are running).
+
+        Returns:
+            bool: If busy
+        """
+        return bool(self.tweens) or any(prefetch.page is None for prefetch in self._prefetched.values())
+
+    def next_timer(self) -> int:
+        """
+        Method returns milliseconds until the next scheduled callback of the current or overlay page is due, None if
+        there are no scheduled callbacks.
+
+        Returns:
+            int: Milliseconds, 0 if a callback is already due.
+        """
+        due = [page.scheduler.next_due() for page in (self.current_page, self.overlay_page)]
+        due = [time for time in due if time is not None]
+        if not due:
+            return None
+        return max(0, min(due) - pygame.time.get_ticks())
+
+    def wake(self, duration: int = 0) -> None:
+        """
+        Method keeps the game loop running at full rate, see Game.wake.
+
+        Args:
+            duration (int): Minimum milliseconds to stay awake for. Defaults to 0.
+        """
+        self.game.wake(duration)
+
     @property
     def current_page(self) -> any:
         """
@@ -101,7 +241,7 @@ class Controller:
         Args:
             page (any): Page to push on top of stack.
         """
-        self.page_stack.push(page(self))  # Initialize page
+        self.page_stack.push(self._get_page_instance(page))  # Initialize page
 
     @property
     def single_page(self) -> bool:
@@ -132,7 +272,7 @@ class Controller:
         Args:
             event_handler (EventHandler): EventHandler object to add.
         """
-        self.input.add_event_type_handler(event_handler)
+        self.input.add_event_handler(event_handler)
 
     def add_event_type_handler(self, event_type: int, handler: Callable):
         """
@@ -147,20 +287,134 @@ class Controller:
         # i.e. after redirection, use the pages custom event handler.
         self.input.add_event_type_handler(event_type=event_type, handler=handler)
 
+    def _get_page_instance(self, page_class: any, *args, **kwargs) -> any:
+        """
+        Method returns an instance of page class. If the page is reusable and its instance is kept alive in the page
+        cache, the cached instance is reset with args and kwargs and returned, otherwise a new instance is created.
+
+        Args:
+            page_class (any): Page class.
+            *args (any): Get passed to pages class initialization or reset method.
+            **kwargs (any): Get passed to pages class initialization or reset method.
+
+        Returns:
+            any: Page instance.
+        """
+        name = page_class.__name__
+        if page_class.reusable:
+            page = self.page_cache.get(name)
+            if page is not None:
+                page.reset(*args, **kwargs)
+                return page
+        # Use warmed instance if the page was prefetched with the same arguments, construct otherwise
+        page = None
+        prefetch = self._prefetched.pop(name, None)
+        if prefetch is not None:
+            if prefetch.matches(args, kwargs):
+                page = prefetch.page if prefetch.page is not None else prefetch.construct(self)
+            else:
+                prefetch.discard()
+        if page is None:
+            page = page_class(self, *args, **kwargs)
+        if page_class.reusable:  # Keep alive
+            self.page_cache.put(name, page)
+        return page
+
+    def prefetch_page(self, to_page: str, *args, **kwargs) -> None:
+        """
+        Method warms up a page the game is likely to redirect to next. Images listed in the pages preload_images get
+        decoded on worker threads, the page itself is then constructed on the main thread in one of the following
+        frames (see update method). The next redirect_to_page to this page with the same arguments uses the warmed
+        instance.
+
+        Args:
+            to_page (str): Page to prefetch, has to be defined in the pages dictionary.
+            *args (any): Get passed to pages class initialization.
+            **kwargs (any): Get passed to pages class initialization.
+        """
+        if to_page not in self.pages:
+            raise RedirectionError(f"Prefetching error of page {to_page}. Page does not exist.")
+        page_class = self.pages[to_page]
+        prefetch = self._prefetched.get(to_page)
+        if prefetch is not None and prefetch.matches(args, kwargs):  # Already being prefetched
+            return
+        if page_class.reusable and to_page in self.page_cache:  # Already kept alive
+            return
+        if prefetch is not None:  # Prefetched with different arguments
+            self._prefetched.pop(to_page).discard()
+        futures = []
+        if page_class.preload_images:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pyggui-prefetch")
+            futures = [
+                (path, self._prefetch_executor.submit(ImageLoader.decode, path)) for path in page_class.preload_images
+            ]
+        self._prefetched.put(to_page, PagePrefetch(page_class, args, kwargs, futures))
+
+    def update(self) -> None:
+        """
+        Method gets called once per frame by the main loop, before pages are updated. Advances every active tween,
+        then constructs at most one prefetched page whose images have all been decoded, so prefetching is spread over
+        frames.
+        """
+        self.tweens.update(self.dt)
+        for prefetch in self._prefetched.values():
+            if prefetch.page is None and prefetch.decoded:
+                prefetch.construct(self)
+                break
+
+    def dispatch_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers an event not consumed by game-wide handlers top-down; to the overlay page first, then to the
+        current page, until it gets consumed.
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        return self.overlay_page.dispatch_event(event) or self.current_page.dispatch_event(event)
+
+    def display_resized(self, size: Tuple[int, int]) -> None:
+        """
+        Method notifies the current and overlay page that the display has been re-sized. Other pages get notified
+        once they appear again.
+
+        Args:
+            size (Tuple[int, int]): New size of display.
+        """
+        self.current_page._on_display_resize(size)
+        self.overlay_page._on_display_resize(size)
+        self.wake()
+
+    def _leave_current_page(self) -> None:
+        """
+        Method calls the on-exit function of current page, and re-measures its memory if it is kept in the page cache.
+        """
+        page = self.current_page
+        page._on_exit()
+        name = type(page).__name__
+        if name in self.page_cache and self.page_cache.get(name) is page:
+            self.page_cache.put(name, page)
+
     def redirect_to_page(self, to_page: str, *args, **kwargs) -> None:
         """
-        Method redirects to page defined as a string. Args and Kwargs are passed to page class initialization.
-        Error gets displayed if page does not exist. TODO: Make custom error
+        Method redirects to page defined as a string. Args and Kwargs are passed to page class initialization, or to
+        the pages reset method if the page is reusable and its instance is still kept alive in the page cache.
+        Error gets displayed if page does not exist.
 
         Args:
             to_page (str): Page to redirect to, has to be defined in the pages dictionary.
             *args (any): Get passed to pages class initialization.
             **kwargs (any): Get passed to pages class initialization.
         """
-        if to_page in self.pages.keys():
-            self.current_page._on_exit()  # Call on-exit function
-            self.page_stack.push(self.pages[to_page](self, *args, **kwargs))  # Initialize page and push on stack
+        if to_page in self.pages:
+            self._leave_current_page()  # Call on-exit function
+            # Initialize (or re-use) page and push on stack
+            self.page_stack.push(self._get_page_instance(self.pages[to_page], *args, **kwargs))
             self.current_page._on_appearance()  # Call on appearance on new page
+            self.wake()
         else:
             traceback.print_exc()
             raise RedirectionError(f"Redirection error to page {to_page}. Page does not exist.")
@@ -170,9 +424,10 @@ class Controller:
         Method goes back one page in the page stack.
         """
         if not self.page_stack.empty():
-            self.current_page._on_exit()  # Call on-exit function
+            self._leave_current_page()  # Call on-exit function
             self.page_stack.pop()  # Remove current page
             self.current_page._on_appearance()  # Call on appearance on new page
+            self.wake()
         else:
             traceback.print_exc()
             raise RedirectionError(f"Redirection error going back. Page stack is empty.")
@@ -11,7 +11,12 @@ class Animator:
     image.
     The get method should be called for fetching current image. That method also updates the state of the animator
     object, so it should be called even if the image wont be used.
+    Class attribute active is set once any animator changes its image, the game loop uses it to stay awake.
     """
+    # If any animator changed its image since the game loop last checked, set by animators, reset by Game.run after
+    # the pages get drawn
+    active: bool = False
+
     def __init__(
         self,
         images: List['pygame.surface.Surface'],
@@ -93,5 +98,8 @@ class Animator:
         Returns:
             pygame.surface.Surface: Current image in animation loop.
         """
+        index = self.index
         self.check_index()
+        if self.index != index:
+            Animator.active = True
         return self.images[self.index]
@@ -3,21 +3,27 @@ Module for Bar classes.
 """
 
 from typing import List, Tuple
+import os
 
 import pygame
 
 from pyggui.gui.item import StaticItem, Item
 from pyggui.gui.text import Text
+from pyggui.helpers import DirectoryReader, ImageLoader
+from pyggui.helpers.surfaces import draw_rect, three_slice
 
 
 class DefaultProgressBar(StaticItem):
     """
     Default progress bar is a horizontal rectangle that gets filled up based on progress.
     The default color is white but can be changed by modifying the color attribute.
-    update_progress(float) method should be used to update the fill of bar.
+    update_progress(float) method should be used to update the fill of bar. The outline is blitted from the shared
+    shape cache, the fill rectangle only changes once the filled length in px changes.
     """
+    __slots__ = ("color", "line_width", "_progress", "progress_length", "progress_rect")
+
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  size: Tuple[int, int] = (1, 1),
                  visible: bool = True,
                  selected: bool = False,
@@ -51,13 +57,12 @@ class DefaultProgressBar(StaticItem):
             progress (float): Float representation of current progress in range [0, 1]. Progress bar is filled
                 based on this value; 0 = empty, 0.5 = half full, 1 = full.
         """
-        # First update progress rect position
-        self.progress_rect.x = self.x
-        self.progress_rect.y = self.y
         progress = min(1, max(0, progress))  # Put progress in between 0 and 1
         self._progress = progress
-        self.progress_length = int(self.width * progress)
-        self.update()
+        progress_length = int(self.width * progress)
+        if progress_length != self.progress_length:  # Fill changes only once it changes by at least a px
+            self.progress_length = progress_length
+            self.update()
 
     def update(self) -> None:
         """
@@ -70,20 +75,12 @@ class DefaultProgressBar(StaticItem):
         Method draws self to screen.
         """
         if self.visible:
+            rect = self.rect
             # Draw outline of bar
-            pygame.draw.rect(
-                self.display,
-                self.color,
-                self.rect,
-                self.line_width
-            )
-            # Draw progress filled rectangle
-            pygame.draw.rect(
-                self.display,
-                self.color,
-                self.progress_rect,
-                0
-            )  # Pass 0 width -> fill rectangle
+            draw_rect(self.display, self.color, rect, self.line_width)
+            # Draw progress filled rectangle, kept at position of bar
+            self.progress_rect.topleft = rect.topleft
+            draw_rect(self.display, self.color, self.progress_rect)
 
 
 class ProgressBar(StaticItem):
@@ -91,25 +88,134 @@ class ProgressBar(StaticItem):
     Progress bar is used for displaying progress. Passing a directory path in the argument directory_path will let
     you create a custom imaged progress bar, an DefaultProgressBar gets returned otherwise, for wich size should be
     passed.
+    Directory path for progress bar images should hold:
+        /some/path/bar/-
+                        background.png  # Bar drawn behind the fill
+                        fill.png  # Fill, shown up to current progress
+                        cap.png  # Optional, drawn at the end of the fill
+    Images are loaded once through the shared ImageLoader cache, so bars using the same directory share them.
+    Background and fill are three-sliced (edges of slice_width px keep their width, the middle gets stretched) once
+    per size of bar; every frame the fill is drawn by blitting a part of the pre-scaled fill, nothing gets scaled.
     """
+    __slots__ = ("directory_path", "fill_offset", "slice_width", "background_image", "fill_image", "cap_image",
+                 "_progress", "progress_length", "_scaled_size", "_background", "_fill")
+    surface_attributes = ("background_image", "fill_image", "cap_image", "_background", "_fill")
+
     def __new__(cls, *args, **kwargs):
-        # Check if directory_path was passed
+        # Check if directory_path was passed, either as keyword or as the first positional argument
         kwargs_copy = kwargs.copy()  # Mutate copy so all kwargs still go through
         directory_path = kwargs_copy.pop("directory_path", False)
+        if not directory_path and args and isinstance(args[0], str):
+            directory_path = args[0]
         if directory_path:
             # Created instance of self is returned
-            return super(ProgressBar, cls).__new__(cls, *args, **kwargs)
+            return super(ProgressBar, cls).__new__(cls)  # Item has default __new__ constructor, pass it only class
         else:
-            # Return default Loading Bar otherwise
-            return DefaultProgressBar(*args, **kwargs)
+            # Return default Loading Bar otherwise, without arguments of imaged bars
+            kwargs_copy.pop("fill_offset", None)
+            kwargs_copy.pop("slice_width", None)
+            return DefaultProgressBar(*args, **kwargs_copy)
 
     def __init__(
         self,
-        position: List[int] = [0, 0],
-        size: Tuple[int, int] = (1, 1),
+        directory_path: str = None,
+        position: List[int] = (0, 0),
+        size: Tuple[int, int] = None,
         visible: bool = True,
         selected: bool = False,
-
+        fill_offset: Tuple[int, int] = (0, 0),
+        slice_width: int = 0
     ):
+        """
+        Args:
+            directory_path (str): Path to a directory holding progress bar images.
+            position (List[int]): Position of bar on screen or page.
+            size (Tuple[int, int]): Total size of bar. Defaults to size of background image.
+            visible (bool): If currently visible.
+            selected (bool): If currently selected.
+            fill_offset (Tuple[int, int]): Offset of fill from the top left corner of bar, fill is kept at the same
+                offset from the bottom right corner. Defaults to (0, 0).
+            slice_width (int): Width in px of left and right edges of background and fill images, that keep their
+                width once the bar gets scaled. Defaults to 0, whole images are scaled.
+        """
+        self.directory_path = directory_path
+        self.fill_offset = fill_offset
+        self.slice_width = slice_width
+        self.image_setup()
+        if not size:
+            size = self.background_image.get_size()
         super().__init__(position, size, visible, selected)
-        # TODO: Implement Imaged progress bar
+        self._progress = 0
+        self.progress_length = 0  # Between 0 and width of fill
+        self._scaled_size = None  # Size of bar that background and fill were scaled for
+        self._background: pygame.Surface = None
+        self._fill: pygame.Surface = None
+
+    def image_setup(self) -> None:
+        """
+        Method loads background, fill and optional cap image from the passed directory_path.
+        """
+        files = {
+            os.path.splitext(name)[0]: path for name, path in DirectoryReader.get_structure(self.directory_path)
+            .get("files", [])
+        }
+        for required in ("background", "fill"):
+            if required not in files:
+                raise FileNotFoundError(f"Progress bar directory {self.directory_path} is missing a {required} image.")
+        self.background_image = ImageLoader.load_cached_image(files["background"], transparent=True)
+        self.fill_image = ImageLoader.load_cached_image(files["fill"], transparent=True)
+        self.cap_image = ImageLoader.load_cached_image(files["cap"], transparent=True) if "cap" in files else None
+
+    @property
+    def fill_width(self) -> int:
+        return max(0, self.width - 2 * self.fill_offset[0])
+
+    @property
+    def progress(self):
+        return self._progress
+
+    def update_progress(self, progress: float) -> None:
+        """
+        Args:
+            progress (float): Float representation of current progress in range [0, 1]. Progress bar is filled
+                based on this value; 0 = empty, 0.5 = half full, 1 = full.
+        """
+        progress = min(1, max(0, progress))  # Put progress in between 0 and 1
+        self._progress = progress
+        self.progress_length = int(self.fill_width * progress)
+
+    def _scale(self) -> None:
+        """
+        Method three-slices background and fill images to the current size of bar.
+        """
+        size = tuple(self.size)
+        fill_size = (self.fill_width, max(0, self.height - 2 * self.fill_offset[1]))
+        self._background = three_slice(self.background_image, size, self.slice_width)
+        self._fill = three_slice(self.fill_image, fill_size, self.slice_width)
+        self._scaled_size = size
+        self.progress_length = int(self.fill_width * self._progress)
+
+    def update(self) -> None:
+        """
+        Method updates all items attached to bar.
+        """
+        for item in self.items:
+            item.update()
+
+    def draw(self) -> None:
+        """
+        Method draws background, filled part of fill and cap on screen, along with attached items.
+        """
+        if self.visible:
+            if self._scaled_size != tuple(self.size):
+                self._scale()
+            x, y = self.position
+            self.display.blit(self._background, (x, y))
+            if self.progress_length:
+                fill_x, fill_y = x + self.fill_offset[0], y + self.fill_offset[1]
+                self.display.blit(self._fill, (fill_x, fill_y), (0, 0, self.progress_length, self._fill.get_height()))
+                if self.cap_image:
+                    cap_x = max(fill_x, fill_x + self.progress_length - self.cap_image.get_width())
+                    self.display.blit(self.cap_image, (cap_x, fill_y))
+            for item in self.items:
+                item.draw()
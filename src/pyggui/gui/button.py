@@ -2,7 +2,7 @@
 Module containing different buttons.
 """
 
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Iterator, List, Tuple, Union
 
 import pygame
 
@@ -11,16 +11,23 @@ from pyggui.gui.text import Text
 from pyggui.helpers import DirectoryReader, ImageLoader
 from pyggui.gui.animation import Animator
 from pyggui.helpers.helpers import create_object_repr
+from pyggui.helpers.surfaces import to_display_format
 
 
 class DefaultButton(Item):
     """
     Default button is used when the user hasn't specified an image for the button itself.
+    Normal and hovered states (rounded rectangle along with text) are pre-rendered onto surfaces, which get re-rendered
+    only once the size, text or colors of the button change, so drawing a button is a single blit.
     """
+    __slots__ = ("text", "_fill_color", "_border_color", "fill_color", "border_color", "_state_surfaces",
+                 "_render_key")
+    surface_attributes = ("_state_surfaces",)
+
     def __init__(
         self,
         controller: 'Controller',
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         size: Tuple[int, int] = (100, 40),
         on_click: Callable = lambda: None,
         text: Union[str, Text] = "Button",
@@ -32,7 +39,7 @@ class DefaultButton(Item):
         """
         Args:
             controller (Controller): Main controller object.
-            position (List[int]): Position of item on screen (or page). Defaults to [0, 0]
+            position (List[int]): Position of item on screen (or page). Defaults to (0, 0)
             size (Tuple[int, int]): Size of item. Defaults to (100, 40).
             on_click (Callable): Callable function gets triggered once the button is clicked. Defaults to None.
             text (Union[str, Text]): String or Text object to add as text to button. Defaults to 'Button'.
@@ -61,11 +68,13 @@ class DefaultButton(Item):
         self.fill_color = self._fill_color  # These ones get used
         self.border_color = self._border_color
 
+        # Pre-rendered (normal, hovered) surfaces, along with what they were rendered from
+        self._state_surfaces: Tuple[pygame.Surface, pygame.Surface] = None
+        self._render_key: Tuple = None
+
         # Set position of text and add object to items
         self.text.position = self.get_text_position()
-        self.items.append(
-            self.text
-        )
+        self._append_item(self.text, [self.text.x - self.x, self.text.y - self.y])
 
     def get_text_position(self) -> List[int]:
         """
@@ -79,21 +88,60 @@ class DefaultButton(Item):
         y_pos = int((self.y + (self.height * 0.5)) - (self.text.height * 0.5))
         return [x_pos, y_pos]
 
+    def _state_key(self) -> Tuple:
+        """
+        Method returns everything the pre-rendered surfaces depend on.
+        """
+        text = self.text
+        return tuple(self.size), self._fill_color, self._border_color, text.value, text.font, text.font_size
+
+    def _render_state(self, background: Tuple[int, int, int], foreground: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Method renders the button (rounded rectangle and text) onto a transparent surface of buttons size, in the
+        pixel format of the display.
+
+        Args:
+            background (Tuple[int, int, int]): Inside color.
+            foreground (Tuple[int, int, int]): Border and text color.
+
+        Returns:
+            pygame.Surface: Rendered surface.
+        """
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, background, rect, width=0, border_radius=10)
+        pygame.draw.rect(surface, foreground, rect, width=3, border_radius=10)
+        text = self.text
+        text_surface = text.font.render(text.value, True, foreground)
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+        return to_display_format(surface)
+
+    def render(self) -> None:
+        """
+        Method pre-renders normal and hovered surfaces of button, and re-centres text. Called once needed by draw,
+        call it directly after changing the font of text in place.
+        """
+        self._render_key = self._state_key()
+        self._state_surfaces = (
+            self._render_state(self._fill_color, self._border_color),  # Normal
+            self._render_state(self._border_color, self._fill_color)  # Hovered
+        )
+        self.text.position = self.get_text_position()
+
     def update(self) -> None:
         """
-        Method updates self and re-sets text position.
+        Method updates self along with attached items.
         """
         if self.visible:
-            # Call parent method
-            super(self.__class__, self).update()
-            # And then re center text
-            self.text.position = self.get_text_position()
+            super().update()
 
     def draw(self) -> None:
         """
         Method draws button along with its text on screen.
         """
         if self.visible:
+            if self._render_key != self._state_key():
+                self.render()
             # Switch colors if hovered
             if self.hovered:
                 self.border_color = self._border_color
@@ -101,27 +149,10 @@ class DefaultButton(Item):
             else:
                 self.border_color = self._fill_color
                 self.fill_color = self._border_color
-
-            pygame.draw.rect(
-                self.display,
-                self.border_color,
-                self.rect,
-                width=0,
-                border_radius=10
-            )
-            pygame.draw.rect(
-                self.display,
-                self.fill_color,
-                self.rect,
-                width=3,
-                border_radius=10
-            )
-            self.text.color = self.fill_color
-            self.text.render()
-            self.text.update()
-
+            self.display.blit(self._state_surfaces[self.hovered], self.rect)
             for item in self.items:
-                item.draw()
+                if item is not self.text:  # Text is drawn as part of pre-rendered surfaces
+                    item.draw()
 
     def __repr__(self) -> str:
         return create_object_repr(self)
@@ -145,6 +176,9 @@ class Button(Item):
     Changing animation type is also possible but should be done using Animators set_animation method, ex.:
         animated['on_click'].set_animation('loop')
     """
+    __slots__ = ("directory_path", "animation_velocity", "images", "animated", "current_state_key", "clicked",
+                 "image_size")
+
     def __new__(cls, *args, **kwargs):
         # Check if directory_path was passed
         kwargs_copy = kwargs.copy()  # Mutate copy so all kwargs still go through
@@ -160,7 +194,7 @@ class Button(Item):
         self,
         controller: 'Controller',
         directory_path: str = None,
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         size: Tuple[int, int] = None,
         on_click: Callable = None,
         movable: bool = False,
@@ -247,18 +281,18 @@ class Button(Item):
         """
         if self.visible:
             self.hovered = self.rect.collidepoint(self.controller.input.mouse_position)
-            # Check if mouse was clicked on item, in the interval of the debounce time
+            clicked, self._clicked = self._clicked, False
             if self.hovered:
                 self.current_state_key = "on_hover"
                 self.animated["normal"].reset_index()
-                # Mouse clicked in set interval
-                if self.mouse_clicked and self.debounce_time():
-                    self.current_state_key = "on_click"
-                    self.clicked = True
-                    self.on_click()
-                    self.was_pressed = True
+            # Check if item was clicked, in the interval of the debounce time
+            if clicked and self.debounce_time():
+                self.current_state_key = "on_click"
+                self.clicked = True
+                self.on_click()
+                self.was_pressed = True
             # Mouse was released
-            elif not self.mouse_clicked:
+            elif self.was_pressed and not self.controller.input.mouse_pressed:
                 self.was_pressed = False
             # If clicked the on_click animation is ongoing
             if self.clicked:
@@ -277,6 +311,35 @@ class Button(Item):
             for item in self.items:
                 item.update()
 
+    def iter_surfaces(self) -> Iterator[Tuple[str, pygame.Surface]]:
+        """
+        Method yields (name, surface) for every image of every state, see BaseItem.iter_surfaces. States without own
+        images share the list of normal images, it is only listed once.
+        """
+        seen = set()
+        for state, images in self.images.items():
+            if id(images) in seen:
+                continue
+            seen.add(id(images))
+            for i, image in enumerate(images):
+                yield "images[{}][{}]".format(state, i), image
+
+    def convert_surfaces(self, convert: Callable[[pygame.Surface], pygame.Surface]) -> int:
+        """
+        Method replaces images of every state in place, so animators (sharing the lists) use the replaced images, see
+        BaseItem.convert_surfaces.
+        """
+        replaced = 0
+        seen = set()
+        for images in self.images.values():
+            if id(images) in seen:
+                continue
+            seen.add(id(images))
+            converted = [convert(image) for image in images]
+            replaced += sum(new is not old for new, old in zip(converted, images))
+            images[:] = converted
+        return replaced
+
     def draw(self):
         """ Overwrite parent method.
         Used for drawing itself and every item attached to it.
@@ -4,10 +4,9 @@ Module containing container classes used for storing and moving grouped items.
 
 from typing import List, Tuple
 
-import pygame
-
-from pyggui.gui.item import ResizableItem, StaticItem
+from pyggui.gui.item import ResizableItem, StaticItem, visible_items
 from pyggui.exceptions import NotResizableError
+from pyggui.helpers.surfaces import draw_rect, quantise
 
 
 class StaticContainer(StaticItem):
@@ -15,8 +14,10 @@ class StaticContainer(StaticItem):
     Container object for holding items inside, items are moved with the container.
     Static container can not be resized but can still be moved.
     """
+    __slots__ = ("resizable",)
+
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  size: Tuple[int, int] = (100, 100),
                  visible: bool = False,
                  selected: bool = False,
@@ -34,8 +35,6 @@ class StaticContainer(StaticItem):
 
         self.resizable: bool = resizable
 
-        self.items_positions: list[tuple] = []  # List containing attached items positions
-
     def add_item(self, item: any, relative_position: Tuple[int, int]) -> int:
         """
         Method adds item in a position relative to self upper left corner. Item will be moved along with the
@@ -48,11 +47,7 @@ class StaticContainer(StaticItem):
         Returns:
             int: Position (index) in items list of added item.
         """
-        self.items.append(item)
-        item_position = [relative_position[0], relative_position[1]]
-        self.items_positions.append(item_position)
-        self.items[-1].position = item_position  # Update new items position
-        return len(self.items) - 1
+        return self._append_item(item, relative_position)  # Items positions list contains attached items positions
 
     def change_item_at_index(self, index: int, item: any) -> None:
         """
@@ -63,16 +58,13 @@ class StaticContainer(StaticItem):
             item (any): Item to add.
         """
         self.items[index] = item
-        self.items[index].position = self.items_positions[index]
+        self._attach(item, self.items_positions[index])
 
     def update(self) -> None:
         """
-        Updates all items and its positions relative to self.
+        Updates all items, their positions are kept relative to self once moved.
         """
-        for i, item in enumerate(self.items):
-            # Update items positions relative to current self position
-            item.position = [self.x + self.items_positions[i][0],
-                             self.y + self.items_positions[i][1]]
+        for item in self.items:
             item.selected = self.selected
             item.update()
 
@@ -81,13 +73,8 @@ class StaticContainer(StaticItem):
         Used for drawing itself and every item attached to it.
         """
         if self.visible:
-            pygame.draw.rect(
-                self.display,
-                (255, 255, 255),
-                self.rect,
-                width=1
-                )
-        for item in self.items:
+            draw_rect(self.display, (255, 255, 255), self.rect, width=1)
+        for item in visible_items(self.items, self.display.get_clip()):
             item.draw()
 
 
@@ -96,12 +83,15 @@ class ResizableContainer(ResizableItem):
     Container object can be resized along with every item contained in it. Because of this only re-sizable items can
     be added.
     """
+    __slots__ = ("resizable", "resized_items_positions", "resize_step")
+
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  size: Tuple[int, int] = (100, 100),
                  visible: bool = False,
                  selected: bool = False,
-                 resizable: bool = False
+                 resizable: bool = False,
+                 resize_step: float = 0.01
                  ):
         """
         Args:
@@ -110,12 +100,14 @@ class ResizableContainer(ResizableItem):
             visible (bool): If container boundaries rectangle should be displayed. Defaults to False.
             selected (bool): If the container is currently selected. Defaults to False.
             resizable (bool): If the container is resizable. Defaults to false.
+            resize_step (float): Re-size factors are rounded to multiples of this step before being passed to items,
+                so nearly equal factors re-use scaled images. None to use exact factors. Defaults to 0.01.
         """
         super().__init__(position, size, visible, selected)
 
         self.resizable: bool = resizable
+        self.resize_step = resize_step
 
-        self.items_positions: list[tuple] = []  # List containing attached items positions
         self.resized_items_positions: list[tuple] = []
 
     def resize(self, factor: float) -> None:
@@ -125,12 +117,44 @@ class ResizableContainer(ResizableItem):
         Args:
             factor (float): Representing scale to resize in the interval (0, inf]
         """
+        factor = quantise(factor, self.resize_step)
+        if self.is_resized and factor == self.resized_factor:  # Already at this size, nothing to re-size
+            return
         super(ResizableContainer, self).resize(factor)
         self.resized_size = [int(self.width * factor), int(self.height * factor)]
         for i, item in enumerate(self.items):  # Re-size and scale items positions based on factor
             self.resized_items_positions[i] = [int(self.items_positions[i][0] * factor),
                                                int(self.items_positions[i][1] * factor)]
             item.resize(factor)
+        self.update_items_positions()
+
+    def _resolve_offset(self, offset: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the position of an attached item with offset relative to self, scaled once re-sized.
+        """
+        if not self.is_resized:
+            return super()._resolve_offset(offset)
+        factor = self.resized_factor
+        return self.scaled_x + int(offset[0] * factor), self.scaled_y + int(offset[1] * factor)
+
+    def _local_offset(self, position: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the offset relative to self of an attached item placed in position, inverse of _resolve_offset.
+        """
+        if not self.is_resized:
+            return super()._local_offset(position)
+        factor = self.resized_factor
+        return round((position[0] - self.scaled_x) / factor), round((position[1] - self.scaled_y) / factor)
+
+    def _item_offsets(self):
+        """
+        Method yields every attached item along with its position relative to self, taking re-sizing into account.
+        """
+        if not self.is_resized:
+            return super()._item_offsets()
+        dx, dy, factor = self.moved_position[0], self.moved_position[1], self.resized_factor
+        return ((item, (dx + int(x * factor), dy + int(y * factor))) for item, (x, y) in zip(self.items,
+                                                                                         self.items_positions))
 
     def reset_size(self) -> None:
         """
@@ -140,6 +164,7 @@ class ResizableContainer(ResizableItem):
         self.size = self.initial_size  # Reset size of self rect
         for item in self.items:
             item.reset_size()
+        self.update_items_positions()
 
     def add_item(self, item: any, relative_position: Tuple[int, int]) -> int:
         """
@@ -156,12 +181,18 @@ class ResizableContainer(ResizableItem):
         if self.resizable and not hasattr(item, "is_resized"):  # If container resizable, expect only resizable items
             raise NotResizableError("Added item is not resizable; "
                                     "Container is set to be resizable and only accepts resizable items.")
-        self.items.append(item)
-        item_position = [relative_position[0], relative_position[1]]
-        self.items_positions.append(item_position)
-        self.resized_items_positions.append(item_position)
-        self.items[-1].position = item_position  # Update this items position
-        return len(self.items) - 1
+        index = self._append_item(item, relative_position)
+        self.resized_items_positions.append([int(relative_position[0] * self.resized_factor),
+                                             int(relative_position[1] * self.resized_factor)])
+        return index
+
+    def remove_item(self, item: any) -> int:
+        """
+        Method removes item from container, see BaseItem.remove_item.
+        """
+        index = super().remove_item(item)
+        del self.resized_items_positions[index]
+        return index
 
     def change_item_at_index(self, index: int, item: any) -> None:
         """
@@ -172,16 +203,13 @@ class ResizableContainer(ResizableItem):
             item (any): Item to add.
         """
         self.items[index] = item
-        self.items[index].position = self.items_positions[index]
+        self._attach(item, self.items_positions[index])
 
     def update(self) -> None:
         """
-        Updates all items and its positions relative to self.
+        Updates all items, their positions are kept relative to self (and scaled once re-sized) once moved.
         """
-        for i, item in enumerate(self.items):
-            # Update items positions relative to current self position
-            item.position = [self.scaled_x + self.resized_items_positions[i][0],
-                             self.scaled_y + self.resized_items_positions[i][1]]
+        for item in self.items:
             item.selected = self.selected
             item.update()
 
@@ -191,20 +219,11 @@ class ResizableContainer(ResizableItem):
         """
         if self.visible:
             if self.is_resized:
-                pygame.draw.rect(
-                    self.display,
-                    (255, 255, 255),
-                    [self.scaled_x, self.scaled_y, self.resized_size[0], self.resized_size[1]],
-                    width=1
-                )
+                rect = (self.scaled_x, self.scaled_y, self.resized_size[0], self.resized_size[1])
             else:
-                pygame.draw.rect(
-                    self.display,
-                    (255, 255, 255),
-                    self.rect,
-                    width=1
-                )
-        for item in self.items:
+                rect = self.rect
+            draw_rect(self.display, (255, 255, 255), rect, width=1)
+        for item in visible_items(self.items, self.display.get_clip()):
             item.draw()
 
 
@@ -226,7 +245,7 @@ class Container:
             return StaticContainer(*args, **kwargs)
 
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  size: Tuple[int, int] = (100, 100),
                  visible: bool = False,
                  selected: bool = False,
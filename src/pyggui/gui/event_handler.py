@@ -2,7 +2,7 @@
 Module containing event handler classes.
 """
 
-from typing import Union, List, Callable
+from typing import Callable, Dict, Iterator, List, Tuple, Union
 
 
 class EventHandler:
@@ -10,6 +10,8 @@ class EventHandler:
     Class stores event types and handlers for those events.
     Once one of the event types appears in the input event loop all of its handlers get called.
     Event types are Pygame specific event types.
+    A handler returning True consumes the event; remaining handlers and anything below it (pages, items) do not
+    receive it.
     """
     def __init__(self, types: Union[int, List[int]], handlers: Union[Callable, List[Callable]]):
         """
@@ -35,12 +37,118 @@ class EventHandler:
     def handlers(self):
         return self._handlers
 
-    def update(self, event: 'Event') -> None:
+    def update(self, event: 'Event') -> bool:
         """
-        Method calls all handlers set to self. Is called once on of the set event types appeared in input.
+        Method calls all handlers set to self, until one of them consumes the event. Is called once on of the set
+        event types appeared in input.
 
         Args:
             event (Event): Pygame Event object
+
+        Returns:
+            bool: If event was consumed.
         """
         for handler in self._handlers:
-            handler(event=event)
+            if handler(event=event) is True:
+                return True
+        return False
+
+
+class HandlerGroup:
+    """
+    Class stores EventHandler objects by event type, in order of adding. Handlers are kept in dictionaries keyed by
+    their identity, so adding and removing a handler is O(1) and adding the same handler twice keeps a single copy.
+    Handlers can be added and removed while an event is being dispatched; the dispatch goes over a snapshot, skipping
+    handlers removed meanwhile, added handlers receive following events.
+    The whole group can be switched off by setting its enabled attribute, pages do this while they are not shown.
+    """
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled (bool): If handlers of group get called. Defaults to True.
+        """
+        self.enabled = enabled
+        self._handlers: Dict[int, EventHandler] = {}  # id(handler) -> handler
+        self._types: Dict[int, Dict[int, EventHandler]] = {}  # Event type -> id(handler) -> handler
+        self._snapshots: Dict[int, Tuple[EventHandler, ...]] = {}  # Event type -> handlers, cleared on change
+
+    def add(self, event_handler: EventHandler) -> None:
+        """
+        Method adds event handler to group.
+
+        Args:
+            event_handler (EventHandler): EventHandler object to add.
+        """
+        self._handlers[id(event_handler)] = event_handler
+        for event_type in event_handler.types:
+            self._types.setdefault(event_type, {})[id(event_handler)] = event_handler
+            self._snapshots.pop(event_type, None)
+
+    def remove(self, event_handler: EventHandler) -> None:
+        """
+        Method removes event handler from group, if it was added.
+
+        Args:
+            event_handler (EventHandler): EventHandler object to remove.
+        """
+        if self._handlers.pop(id(event_handler), None) is None:
+            return
+        for event_type in event_handler.types:
+            handlers = self._types.get(event_type)
+            if handlers is not None:
+                handlers.pop(id(event_handler), None)
+                if not handlers:
+                    del self._types[event_type]
+                self._snapshots.pop(event_type, None)
+
+    def clear(self) -> None:
+        """
+        Method removes every event handler from group.
+        """
+        self._handlers.clear()
+        self._types.clear()
+        self._snapshots.clear()
+
+    def handlers_for(self, event_type: int) -> Tuple[EventHandler, ...]:
+        """
+        Method returns event handlers of event type, in order of adding.
+
+        Args:
+            event_type (int): Pygame event type.
+
+        Returns:
+            Tuple[EventHandler, ...]: Event handlers.
+        """
+        snapshot = self._snapshots.get(event_type)
+        if snapshot is None:
+            snapshot = tuple(self._types.get(event_type, {}).values())
+            self._snapshots[event_type] = snapshot
+        return snapshot
+
+    def dispatch(self, event: 'Event') -> bool:
+        """
+        Method calls event handlers of the events type until one of them consumes the event. Nothing is called if the
+        group is disabled.
+
+        Args:
+            event (Event): Pygame Event object
+
+        Returns:
+            bool: If event was consumed.
+        """
+        if not self.enabled:
+            return False
+        handlers = self._handlers
+        for event_handler in self.handlers_for(event.type):
+            if id(event_handler) in handlers and event_handler.update(event=event):
+                return True
+        return False
+
+    def __contains__(self, event_handler: EventHandler) -> bool:
+        return id(event_handler) in self._handlers
+
+    def __iter__(self) -> Iterator[EventHandler]:
+        return iter(list(self._handlers.values()))
+
+    def __len__(self) -> int:
+        return len(self._handlers)
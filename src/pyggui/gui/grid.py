@@ -3,52 +3,89 @@ Module containing grid definition and every addition needed for it.
 """
 
 from __future__ import annotations
-from typing import Union, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Union, List, Tuple
+from itertools import accumulate
+import functools
 
 import pygame
 
-from pyggui.gui.item import StaticItem
+from pyggui.gui.item import NO_ITEMS, StaticItem, visible_items
+from pyggui.helpers.surfaces import draw_rect
+
+
+@functools.lru_cache(maxsize=256)
+def parse_alignment(align: str = None) -> Tuple[str, ...]:
+    """
+    Function parses an alignment string (ex. "centre top") into a tuple of alignments. Results are cached as the same
+    few strings are parsed for every item added into a grid.
+
+    Args:
+        align (str): Alignments separated by a space character. None for centre.
+
+    Returns:
+        Tuple[str, ...]: Alignments, unknown ones are left out.
+    """
+    if not align:
+        return ("centre",)
+    return tuple(part for part in align.split(" ") if part in Cell.alignments)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_padding(padding: str = None) -> Tuple[Tuple[str, int], ...]:
+    """
+    Function parses a padding string (ex. "top 5, left 3") into a tuple of (side, px) pairs. Results are cached.
+
+    Args:
+        padding (str): Paddings separated by a comma, each as "side px".
+
+    Returns:
+        Tuple[Tuple[str, int], ...]: Side and px of each padding.
+    """
+    if not padding:
+        return ()
+    paddings = []
+    for pad in padding.split(","):  # Go over each padding
+        _pad = pad.strip().split(" ")  # Remove whitespace around
+        paddings.append((_pad[0], int(_pad[1])))  # Todo add exception handling
+    return tuple(paddings)
 
 
 class Cell(StaticItem):
     """
     Class for representing a single rectangle in the grid that is placed in the i, j position and has i-th rows height,
     j-th columns height. Items can be added to it, aligned and padded.
+    Cells are created by the grid on first access, see Grid.cell.
     """
+    __slots__ = ("grid", "position_in_grid", "layouts")
+
+    # Possible paddings, shared by all cells
+    _padding = MappingProxyType({
+        "top": 0,
+        "bottom": 0,
+        "left": 0,
+        "right": 0
+    })
+
     def __init__(
         self,
         grid: Grid,
         position_in_grid: Tuple,
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         size: Tuple[int, int] = (1, 1),
     ):
         """
         Args:
-            position (List[int] = [0, 0]): Position to place item on screen (or on page).
+            grid (Grid): Grid the cell belongs to.
+            position_in_grid (Tuple): Row, column index of cell in grid.
+            position (List[int] = (0, 0)): Position to place item on screen (or on page).
             size (Tuple[int, int] = (1, 1)): Size of item.
-            visible (bool): If item is currently visible.
-            selected (bool): If item is currently selected.
         """
         super().__init__(position, size, False, False)
         self.grid = grid
         self.position_in_grid = position_in_grid
-
-        # Possible alignments
-        self.alignments = {
-            "left": self._left,
-            "right": self._right,
-            "top": self._top,
-            "bottom": self._bottom,
-            "centre": self._centre,
-            None: self._centre
-        }
-        # Possible paddings
-        self._padding = {
-            "top": 0,
-            "bottom": 0,
-            "left": 0,
-            "right": 0
-        }
+        self.parent = grid
+        self.layouts: List[Tuple[str, str]] = NO_ITEMS  # Alignment and padding of each item in cell
 
     @property
     def padding(self):
@@ -98,6 +135,16 @@ class Cell(StaticItem):
         centered_y = self.position[1] + ((self.height - item.height) // 2)
         item.position = (centered_x, centered_y)
 
+    # Possible alignments, called with the cell and the item to align
+    alignments = {
+        "left": _left,
+        "right": _right,
+        "top": _top,
+        "bottom": _bottom,
+        "centre": _centre,
+        None: _centre
+    }
+
     def __pad(self, item: any, padding: str, value: int) -> None:
         """
         Method adds padding to item based on cell position and size.
@@ -118,6 +165,19 @@ class Cell(StaticItem):
             elif padding == "right":
                 item.x -= value
 
+    def _align(self, item: any, align: str = None, padding: str = None) -> None:
+        """
+        Method positions item inside cell based on passed alignment and padding, see add_item.
+        """
+        alignments = self.alignments
+        alignments["centre"](self, item)  # Align item into centre initially so it moves it into cell
+        # Handle alignment
+        for align in parse_alignment(align):
+            alignments[align](self, item)  # Align item in set way
+        # Handle padding
+        for key, value in parse_padding(padding):
+            self.__pad(item, padding=key, value=value)
+
     def add_item(self, item: any, align: str = None, padding: str = None) -> None:
         """
         Method adds item to cell, aligns and pads it base on passed values.
@@ -130,23 +190,27 @@ class Cell(StaticItem):
                 passed next to the alignment position as an integer value.
                 Example: padding = "top 5, left 3"  # 5px from top 3px from bottom
         """
-        self.items.append(item)  # Add item to item list
-        self.alignments["centre"](item)  # Align item into centre initially so it moves it into cell
-        # Handle alignment
-        if align:
-            for align in align.split(" "):  #
-                if align in self.alignments:
-                    self.alignments[align](item)  # Align item in set way
-        else:
-            self.alignments[align](item)  # Default alignment for None is centre
-        # Handle padding
-        if padding:
-            for pad in padding.split(","):  # Go over each padding
-                _pad = pad.strip()  # Remove whitespace around
-                _pad = _pad.split(" ")
-                print(_pad, pad)
-                key, value = _pad[0], int(_pad[1])  # Todo add exception handling
-                self.__pad(item, padding=key, value=value)
+        self._align(item, align, padding)
+        if self.layouts is NO_ITEMS:
+            self.layouts = []
+        self.layouts.append((align, padding))  # Kept for re-aligning once the cell changes size
+        item.parent = self
+        self._append_item(item, [item.x - self.x, item.y - self.y])  # Add item to item list
+
+    def remove_item(self, item: any) -> int:
+        """
+        Method removes item from cell, see BaseItem.remove_item.
+        """
+        index = super().remove_item(item)
+        del self.layouts[index]
+        return index
+
+    def realign(self) -> None:
+        """
+        Method re-aligns and re-pads every item in cell, used once the cell changed its size.
+        """
+        for item, (align, padding) in zip(self.items, self.layouts):
+            self._align(item, align, padding)
 
     def update(self):
         for item in self.items:
@@ -154,66 +218,66 @@ class Cell(StaticItem):
 
     def draw(self, visible: bool = False):
         if visible:  # Only draw if grid is visible
-            pygame.draw.rect(
-                self.display,
-                color=(0, 0, 0),
-                rect=self.rect,
-                width=0  # Fill this one
-            )
-            pygame.draw.rect(
-                self.display,
-                color=(255, 255, 255),
-                rect=self.rect,
-                width=2
-            )
-        for item in self.items:
+            draw_rect(self.display, (0, 0, 0), self.rect)  # Fill this one
+            draw_rect(self.display, (255, 255, 255), self.rect, width=2)
+        for item in visible_items(self.items, self.display.get_clip()):
             item.draw()
 
 
 class Row:
     """
-    Single row in Grid, is only used for grabbing items using indexing with []. Row contains cells that are in that
-    row in the grid.
+    Single row in Grid, used for grabbing and setting cells using indexing with []. Row is a view over the cells in
+    that row of the grid, cells get created by the grid once accessed. Setting, deleting, inserting and appending
+    cells changes the grid, the number of columns stays the same.
     """
-    def __init__(self, grid: Grid, data: List = None):
+    def __init__(self, grid: Grid, index: int):
         self.grid = grid
-
-        if data:
-            self._list = list(data)
-        else:
-            self._list = list()
+        self.index = index
 
     def __len__(self):
-        """ List length """
-        return len(self._list)
-
-    def __getitem__(self, i):
-        """ Get a list item """
-        return self._list[i]
-
-    def __delitem__(self, i):
-        """ Delete an item """
-        del self._list[i]
-
-    def __setitem__(self, i, val):
-        """ Set item """
-        # optional: self._acl_check(val)
-        self._list[i] = val
+        """ Number of cells in row """
+        return self.grid.number_of_columns
+
+    def __getitem__(self, j):
+        """ Get a cell """
+        return self.grid.cell(self.index, j)
+
+    def __setitem__(self, j, cell: Cell):
+        """ Set a cell, moving it into its position in grid """
+        self.grid.set_cell(self.index, j, cell)
+
+    def __delitem__(self, j):
+        """ Delete a cell, an empty one gets created once accessed again """
+        self.grid.remove_cell(self.index, j)
+
+    def insert(self, j, cell: Cell):
+        """ Insert cell at index, shifting following cells one column right. Last cell in row has to be empty """
+        grid = self.grid
+        j = grid._index(self.index, j)[1]
+        last = grid.number_of_columns - 1
+        if (self.index, last) in grid._cells:
+            raise IndexError("Row is full, last cell has to be empty for inserting.")
+        for column in range(last, j, -1):  # Shift created cells right, from the end
+            shifted = grid._cells.get((self.index, column - 1))
+            if shifted is not None:
+                grid.set_cell(self.index, column, shifted)
+        grid.set_cell(self.index, j, cell)
+
+    def append(self, cell: Cell):
+        """ Append cell into the first column not holding a created cell """
+        for j in range(self.grid.number_of_columns):
+            if (self.index, j) not in self.grid._cells:
+                self.grid.set_cell(self.index, j, cell)
+                return
+        raise IndexError("Row is full, no empty cell to append to.")
+
+    def __iter__(self) -> Iterator[Cell]:
+        """ Iterate over every cell in row, creating them if needed """
+        for j in range(self.grid.number_of_columns):
+            yield self.grid.cell(self.index, j)
 
     def __repr__(self):
-        return "<{0} {1}>".format(self.__class__.__name__, self._list)
-
-    def __str__(self):
-        return str(self._list)
-
-    def insert(self, i, val):
-        """ Insert value at index """
-        # optional: self._acl_check(val)
-        self._list.insert(i, val)
-
-    def append(self, val):
-        """ Append value at end of list """
-        self.insert(len(self._list), val)
+        return "<{0} {1} of {2}>".format(self.__class__.__name__, self.index, self.grid)
 
 
 def make_grid_line(line: List[Union[float, int]], total_size: int, number_of_items: int) -> List[int]:
@@ -231,13 +295,13 @@ def make_grid_line(line: List[Union[float, int]], total_size: int, number_of_ite
     # Check number of elements matches, add/remove otherwise
     element_number_difference = number_of_items - len(line)
     if element_number_difference < 0:  # If more were passed, remove last items
-        line = self.number_of_rows[:abs(element_number_difference)]
+        line = list(line[:number_of_items])
     elif element_number_difference > 0:  # If less were passed, add number of items (equal part)
         if isinstance(line[0], float):  # If float, parts added must be equal to 1/total_num_parts
             one_part = 1 / number_of_items
         else:  # Else add equal parts of total_size
             one_part = int(total_size / number_of_items)
-        line += [one_part for _ in range(element_number_difference)]
+        line = list(line) + [one_part for _ in range(element_number_difference)]  # Keep passed list untouched
     # Create list
     if isinstance(line[0], float):  # If decimal -> percentage
         line_sum = sum(line)
@@ -251,9 +315,21 @@ def make_grid_line(line: List[Union[float, int]], total_size: int, number_of_ite
 
 
 class Grid(StaticItem):
+    """
+    Grid of rows and columns of cells, items are added into cells. Cells are only created once accessed (by indexing
+    or adding an item into them), so memory and construction time scale with the number of used cells, not the size
+    of the grid. Cell rectangles are computed from row and column offsets.
+
+    Grids created without a size follow the size of the display; once the display gets re-sized, row and column
+    sizes are re-computed and only cells whose geometry changed get moved (and their items re-aligned). After changing
+    the size of a grid manually, call relayout.
+    """
+    __slots__ = ("_cells", "number_of_rows", "number_of_columns", "row_sizes", "column_sizes", "row_offsets",
+                 "column_offsets", "follow_display", "_row_spec", "_column_spec")
+
     def __init__(
         self,
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         rows: int = 1,
         columns: int = 1,
         row_sizes: Union[List[int], List[float]] = None,
@@ -264,7 +340,7 @@ class Grid(StaticItem):
     ):
         """
         Args:
-            position (List[int] = [0, 0]): Position to place item on screen (or on page).
+            position (List[int] = (0, 0)): Position to place item on screen (or on page).
             rows (int): An integer representing number of rows.
             columns (int): An integer representing number of columns.
             row_sizes (Union[List[int], List[float]]): List of heights for each row, heights can either (all together)
@@ -273,7 +349,8 @@ class Grid(StaticItem):
             column_sizes (Union[List[int], List[float]]): List of widths for each column, widths can either
                 (all together) be integer values (representing width of each row in px) or float numbers
                 (representing width of each row by percentage relative to grid size)
-            size (Tuple[int, int] = (1, 1)): Size of item.
+            size (Tuple[int, int] = (1, 1)): Size of item. Defaults to None, grid takes the size of the display and
+                follows it once the display gets re-sized.
             visible (bool): If item is currently visible.
             selected (bool): If item is currently selected.
 
@@ -283,69 +360,181 @@ class Grid(StaticItem):
             percentages (floats) passed).
             Adding more elements will just cut the additional ones off.
         """
+        follow_display = not size
         if not size:  # Fetch whole screen size if not passed
             size = pygame.display.get_surface().get_size()
         super().__init__(position=position, size=size, visible=visible, selected=selected)
 
-        self._list: List[Row] = []
+        self._cells: Dict[Tuple[int, int], Cell] = {}  # Created cells, keyed by (row, column)
+        self.follow_display = follow_display
         self.number_of_rows, self.number_of_columns = rows, columns
-        self.row_sizes = row_sizes
-        self.column_sizes = column_sizes
+        self._row_spec, self._column_spec = row_sizes, column_sizes  # Passed sizes, kept for re-computing
         # Make rows and columns
         self.__make_row_and_column_sizes()
-        self.__make(rows, columns)
 
     def __make_row_and_column_sizes(self) -> None:
         """
-        Method constructs heights of rows and widths of columns in px so they can be generated in the __make method.
+        Method constructs heights of rows and widths of columns in px, along with offsets of each row and column
+        relative to the grids position.
         """
         # Make rows
-        if self.row_sizes:
-            rows_sizes = make_grid_line(self.row_sizes, self.height, self.number_of_rows)
+        if self._row_spec:
+            rows_sizes = make_grid_line(self._row_spec, self.height, self.number_of_rows)
         else:
             equal_part = int(self.height / self.number_of_rows)
             rows_sizes = [equal_part for _ in range(self.number_of_rows)]
         self.row_sizes = rows_sizes
         # Make columns
-        if self.column_sizes:
-            rows_sizes = make_grid_line(self.column_sizes, self.width, self.number_of_columns)
+        if self._column_spec:
+            rows_sizes = make_grid_line(self._column_spec, self.width, self.number_of_columns)
         else:
             equal_part = int(self.width / self.number_of_columns)
             rows_sizes = [equal_part for _ in range(self.number_of_columns)]
         self.column_sizes = rows_sizes
+        # Offsets, last element is the end of the last row/column
+        self.row_offsets = [0] + list(accumulate(self.row_sizes))
+        self.column_offsets = [0] + list(accumulate(self.column_sizes))
 
-    def __make(self, number_of_rows: int, number_of_columns: int) -> None:
+    def relayout(self) -> None:
+        """
+        Method re-computes row and column sizes for the current size of grid. Created cells whose position or size
+        changed get moved, cells that changed size also re-align their items. Nothing gets re-created.
         """
-        Method creates grids list which contains rows of cells.
+        self.__make_row_and_column_sizes()
+        row_offsets, column_offsets = self.row_offsets, self.column_offsets
+        for (row, column), cell in self._cells.items():
+            offset = [column_offsets[column], row_offsets[row]]
+            size = (self.column_sizes[column], self.row_sizes[row])
+            if cell._offset != offset:
+                cell._offset[0], cell._offset[1] = offset
+                cell._dirty = True
+                cell.update_items_positions()
+            if cell.size != size:
+                cell.size = size
+                cell.realign()
+        self.invalidate_bounds()
+
+    def on_display_resize(self, size: Tuple[int, int]) -> None:
+        """
+        Method re-sizes grid to match the display if it follows it, and passes the new size on to items in cells.
 
         Args:
-            number_of_rows (int): Number of rows.
-            number_of_columns (int): Number of columns.
-        """
-        curr_x, curr_y = 0, 0
-        for i in range(number_of_rows):
-            row = Row(self)
-            for j in range(number_of_columns):
-                row.append(
-                    Cell(
-                        grid=self,
-                        position_in_grid=(i, j),
-                        position=[curr_x, curr_y],
-                        size=(self.column_sizes[j], self.row_sizes[i]),
-                    )
-                )
-                curr_x += self.column_sizes[j]
-            self._list.append(row)
-            curr_x = 0
-            curr_y += self.row_sizes[i]
+            size (Tuple[int, int]): New size of display.
+        """
+        if self.follow_display and tuple(self.size) != tuple(size):
+            self.size = size
+            self.relayout()
+        super().on_display_resize(size)
 
     @property
     def rows(self):
-        return len(self._list)
+        return self.number_of_rows
 
     @property
     def columns(self):
-        return len(self._list[0])
+        return self.number_of_columns
+
+    @property
+    def cells(self) -> List[Cell]:
+        """
+        List of cells that were created so far.
+        """
+        return list(self._cells.values())
+
+    def _index(self, row: int, column: int) -> Tuple[int, int]:
+        """
+        Method returns row, column with negative indices resolved, raises IndexError if out of the grid.
+        """
+        if row < 0:
+            row += self.number_of_rows
+        if column < 0:
+            column += self.number_of_columns
+        if not (0 <= row < self.number_of_rows and 0 <= column < self.number_of_columns):
+            raise IndexError("Grid index out of range.")
+        return row, column
+
+    def cell_rect(self, row: int, column: int) -> pygame.Rect:
+        """
+        Method returns the rectangle of cell in position row, column without creating the cell.
+
+        Args:
+            row (int): Row of cell. Starting at 0.
+            column (int): Column of cell. Starting at 0.
+
+        Returns:
+            pygame.Rect: Cells rectangle.
+        """
+        row, column = self._index(row, column)
+        return pygame.Rect(
+            self.x + self.column_offsets[column],
+            self.y + self.row_offsets[row],
+            self.column_sizes[column],
+            self.row_sizes[row]
+        )
+
+    def cell(self, row: int, column: int) -> Cell:
+        """
+        Method returns cell in position row, column, creating it on first access.
+
+        Args:
+            row (int): Row of cell. Starting at 0.
+            column (int): Column of cell. Starting at 0.
+
+        Returns:
+            Cell: Cell in position.
+        """
+        row, column = self._index(row, column)
+        cell = self._cells.get((row, column))
+        if cell is None:
+            rect = self.cell_rect(row, column)
+            cell = Cell(grid=self, position_in_grid=(row, column), position=rect.topleft, size=rect.size)
+            cell.display = self.display
+            cell._offset = [self.column_offsets[column], self.row_offsets[row]]  # Cells move with the grid
+            self._cells[(row, column)] = cell
+        return cell
+
+    def set_cell(self, row: int, column: int, cell: Cell) -> None:
+        """
+        Method places cell (ex. one taken from another position or grid) into position row, column, replacing the
+        cell there. Cell gets moved and re-sized to the position, its items get moved along and re-aligned.
+
+        Args:
+            row (int): Row of cell. Starting at 0.
+            column (int): Column of cell. Starting at 0.
+            cell (Cell): Cell to place.
+        """
+        row, column = self._index(row, column)
+        if cell.grid is not None and cell.grid._cells.get(cell.position_in_grid) is cell:  # Move from old position
+            cell.grid.remove_cell(*cell.position_in_grid)
+        if (row, column) in self._cells:  # Replaced cell
+            self.remove_cell(row, column)
+        cell.grid = cell.parent = self
+        cell.position_in_grid = (row, column)
+        cell.display = self.display
+        cell._offset = [self.column_offsets[column], self.row_offsets[row]]
+        cell._dirty = True
+        cell.update_items_positions()
+        size = (self.column_sizes[column], self.row_sizes[row])
+        if tuple(cell.size) != size:
+            cell.size = size
+            cell.realign()
+        self._cells[(row, column)] = cell
+        self.invalidate_bounds()
+
+    def remove_cell(self, row: int, column: int) -> None:
+        """
+        Method removes cell (along with its items) in position row, column from the grid. An empty cell gets created
+        once the position is accessed again.
+
+        Args:
+            row (int): Row of cell. Starting at 0.
+            column (int): Column of cell. Starting at 0.
+        """
+        cell = self._cells.pop(self._index(row, column), None)
+        if cell is not None:
+            cell.grid = cell.parent = None
+            cell._offset = None
+            self.invalidate_bounds()
 
     def add_item(self,
                  item: any,
@@ -369,43 +558,86 @@ class Grid(StaticItem):
                 bottom, left, right. Px represents an integer number of pixels to pad.
                 Ex.: padding = "top 5, left 10"
         """
-        self._list[row][column].add_item(item=item, align=alignment, padding=padding)
+        self.cell(row, column).add_item(item=item, align=align, padding=padding)
+
+    def _item_offsets(self):
+        """
+        Method yields every created cell along with its position relative to the grid, used for computing bounds.
+        """
+        for cell in self._cells.values():
+            yield cell, cell._offset
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to items in occupied cells, in reverse order of drawing (topmost first), until one of
+        them consumes it.
+        """
+        for cell in reversed(list(self._cells.values())):
+            if cell.items and cell.handle_event(event):
+                return True
+        return False
 
     def update(self):
         """ Method updates every item added to a cell in the grid. """
-        for row in self._list:
-            for cell in row:
+        for cell in self._cells.values():
+            if cell.items:
                 cell.update()
 
     def draw(self):
-        """ Method draws every item added to a cell in the grid. """
-        for row in self._list:
-            for cell in row:
-                cell.draw(visible=self.visible)  # Pass if self visible
-
-    def __iter__(self):
+        """ Method draws every item added to a cell in the grid, along with grid lines if grid is visible. """
+        if self.visible:
+            self.__draw_lines()
+        occupied_cells = (cell for cell in self._cells.values() if cell.items)
+        for cell in visible_items(occupied_cells, self.display.get_clip()):
+            cell.draw()
+
+    def __draw_lines(self) -> None:
+        """
+        Method fills the grid and draws borders of every cell.
+        """
+        draw_rect(self.display, (0, 0, 0), self.rect)
+        left, top = self.x, self.y
+        right, bottom = left + self.column_offsets[-1], top + self.row_offsets[-1]
+        for offset in self.row_offsets:
+            pygame.draw.line(self.display, (255, 255, 255), (left, top + offset), (right, top + offset), width=2)
+        for offset in self.column_offsets:
+            pygame.draw.line(self.display, (255, 255, 255), (left + offset, top), (left + offset, bottom), width=2)
+
+    def __iter__(self) -> Iterator[Row]:
         """ For iterating over grid. TODO: Decide if iterating should yield every item not row. """
-        for row in self._list:
-            yield row
+        for i in range(self.number_of_rows):
+            yield Row(self, i)
 
     def __len__(self):
-        """ List length """
-        return len(self._list)
+        """ Number of rows """
+        return self.number_of_rows
 
     def __getitem__(self, i):
-        """ Get a list item """
-        return self._list[i]
+        """ Get a row """
+        return Row(self, self._index(i, 0)[0])
+
+    def __setitem__(self, i, cells: Iterable[Cell]):
+        """ Set a row from cells (ex. another Row), cells of columns not passed get removed """
+        i = self._index(i, 0)[0]
+        cells = list(cells)
+        if len(cells) > self.number_of_columns:
+            raise IndexError("More cells than columns in grid.")
+        for j in range(self.number_of_columns):
+            if j < len(cells):
+                self.set_cell(i, j, cells[j])
+            else:
+                self.remove_cell(i, j)
 
     def __delitem__(self, i):
-        """ Delete an item """
-        del self._list[i]
-
-    def __setitem__(self, i, val):
-        """ Set item """
-        self._list[i] = val
+        """ Delete every cell in row, empty ones get created once accessed again """
+        i = self._index(i, 0)[0]
+        for j in range(self.number_of_columns):
+            self.remove_cell(i, j)
 
     def __repr__(self):
-        return "<{0} {1}>".format(self.__class__.__name__, self._list)
+        return "<{0} {1}x{2}, {3} cells created>".format(
+            self.__class__.__name__, self.number_of_rows, self.number_of_columns, len(self._cells)
+        )
 
     def __str__(self):
-        return str(self._list)
+        return self.__repr__()
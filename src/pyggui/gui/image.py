@@ -3,17 +3,20 @@ Module for classes handling images.
 """
 
 from typing import List, Tuple, Union
+import os
 
 import pygame
 
 from pyggui.gui.item import StaticItem, ResizableItem
 from pyggui.helpers.file_handling import ImageLoader
 from pyggui.helpers.helpers import create_object_repr
+from pyggui.helpers.surfaces import nine_slice, quantise, scale, to_display_format
 
 
 def fetch_image(image: Union[str, pygame.Surface], transparent: bool = False) -> pygame.Surface:
     """
-    Function loads one image and returns it as a pygame.Surface object.
+    Function loads one image and returns it as a pygame.Surface object, converted to the displays pixel format (if a
+    display exists) so blitting it does not need a conversion.
 
     Args:
         image (Union[str, pygame.Surface]): Either a path to the image (preferably relative path), or an already
@@ -25,7 +28,7 @@ def fetch_image(image: Union[str, pygame.Surface], transparent: bool = False) ->
         pygame.Surface: Image loaded into a surface,
     """
     if isinstance(image, pygame.Surface):
-        return image  # Passed image is already a pygame.Surface object
+        return to_display_format(image)  # Passed image is already a pygame.Surface object, only match display format
     else:
         if transparent:  # Load as transparent
             return ImageLoader.load_transparent_image(image)
@@ -39,10 +42,13 @@ class StaticImage(StaticItem):
     resizable images or pass 'resizable=True' to Image class constructor.
     inherits from StaticItem.
     """
+    __slots__ = ("resizable", "image", "transparent")
+    surface_attributes = ("image",)
+
     def __init__(self,
                  image: Union[str, pygame.Surface],
                  transparent: bool = False,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  visible: bool = True,
                  selected: bool = False,
                  resizable: bool = False,
@@ -100,14 +106,21 @@ class ResizableImage(ResizableItem):
     """
     Class for handling a single static image that can be moved and re-sized.
     Inherits from ResizableItem.
+    Re-size factors are rounded to multiples of resize_step and scaled images are kept in the shared scale cache, so
+    re-sizing back and forth (ex. hover effects) scales each size once, for all images loaded from the same path.
     """
+    __slots__ = ("resizable", "image", "transparent", "current_image", "smooth", "resize_step", "_source_key")
+    surface_attributes = ("image", "current_image", "resized")
+
     def __init__(self,
                  image: Union[str, pygame.Surface],
                  transparent: bool = False,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  visible: bool = True,
                  selected: bool = False,
-                 resizable: bool = True
+                 resizable: bool = True,
+                 smooth: bool = False,
+                 resize_step: float = 0.01
                  ):
         """
         Args:
@@ -119,17 +132,30 @@ class ResizableImage(ResizableItem):
             visible (bool): If image is visible at beginning. Defaults to True.
             selected (bool): If item is selected at beginning. Defaults to False.
             resizable (bool): If image object can be resized. Defaults to False.
+            smooth (bool): If images are re-sized using smoothscale (better quality, slower). Defaults to False.
+            resize_step (float): Re-size factors are rounded to multiples of this step, None to use exact factors.
+                Defaults to 0.01.
         """
         self.resizable = resizable
+        self.smooth = smooth
+        self.resize_step = resize_step
 
         self.image = fetch_image(image=image, transparent=transparent)
         self.transparent = transparent
+        # Images loaded from the same path share scaled surfaces
+        self._source_key = (os.path.abspath(image), transparent) if isinstance(image, str) else None
 
         self.current_image = self.image  # Currently used image
 
         size = tuple(self.image.get_rect()[2:])
         super().__init__(position, size, visible, selected)  # Initialize parent class with fetched size
 
+    def _scaled_image(self, factor: float) -> pygame.Surface:
+        """
+        Method returns image scaled by (an already rounded) factor, from the shared scale cache.
+        """
+        return scale(self.image, (int(self.width * factor), int(self.height * factor)), self.smooth, self._source_key)
+
     def resize(self, factor: float) -> None:
         """
         Method will re-size image and its position based on a factor passed as argument.
@@ -137,10 +163,31 @@ class ResizableImage(ResizableItem):
         Args:
             factor (float): Factor to scale item in range [0, inf]
         """
+        factor = quantise(factor, self.resize_step)
+        if self.is_resized and factor == self.resized_factor:  # Already at this size
+            return
         super(ResizableImage, self).resize(factor)
-        self.resized = pygame.transform.scale(self.image, self.resized_size)
+        self.resized = self._scaled_image(factor)
         self.current_image = self.resized
 
+    def precompute(self, low: float, high: float) -> int:
+        """
+        Method scales image by every factor between low and high (in steps of resize_step) in advance, so re-sizing
+        within that range later does not scale. Scaled images are subject to the bounds of the shared scale cache.
+
+        Args:
+            low (float): Lowest factor.
+            high (float): Highest factor.
+
+        Returns:
+            int: Number of scaled images.
+        """
+        step = self.resize_step or 0.01
+        steps = int(round((high - low) / step))
+        for i in range(steps + 1):
+            self._scaled_image(quantise(low + i * step, step))
+        return steps + 1
+
     def reset_size(self) -> None:
         """
         Method will reset images size to the initially set one.
@@ -160,6 +207,85 @@ class ResizableImage(ResizableItem):
         return create_object_repr(self)
 
 
+class NineSliceImage(ResizableItem):
+    """
+    Class for a scalable image (ex. a skinned panel or frame) drawn at any size from a single source image, using
+    nine-slice scaling; corners keep their size, borders get stretched along their length and the centre is stretched
+    in both directions. Images passed as paths are loaded once through the shared ImageLoader cache, and rendered sizes
+    are cached in a shared bounded cache keyed by the path, so panels of the same skin and size (or a panel re-sized
+    back to a previous size) are rendered only once.
+    Size can be changed by setting the size attribute, or by re-sizing by a factor as with other re-sizable items.
+    """
+    __slots__ = ("resizable", "image", "transparent", "borders", "_rendered", "_rendered_size", "_source_key")
+    surface_attributes = ("image", "_rendered")
+
+    def __init__(self,
+                 image: Union[str, pygame.Surface],
+                 borders: Union[int, Tuple[int, int, int, int]],
+                 size: Tuple[int, int] = None,
+                 transparent: bool = False,
+                 position: List[int] = (0, 0),
+                 visible: bool = True,
+                 selected: bool = False
+                 ):
+        """
+        Args:
+            image (Union[str, pygame.Surface]): Either a path to the image (preferably relative path), or an already
+                loaded image as a pygame.Surface object.
+            borders (Union[int, Tuple[int, int, int, int]]): Insets of left, top, right and bottom border of image in
+                px, or a single inset for all four borders.
+            size (Tuple[int, int]): Size to draw image at. Defaults to None, size of image.
+            transparent (bool): If image should be loaded as transparent. If image is passed as a Surface object it
+                is set as the default False.
+            position (List[int]): Position of image on screen or Page.
+            visible (bool): If image is visible at beginning. Defaults to True.
+            selected (bool): If item is selected at beginning. Defaults to False.
+        """
+        self.resizable = True
+        if isinstance(image, str):  # Shared with other instances using the same image, it is never drawn on
+            self.image = ImageLoader.load_cached_image(image, transparent)
+            self._source_key = (os.path.abspath(image), transparent)
+        else:
+            self.image = fetch_image(image=image)
+            self._source_key = None
+        self.transparent = transparent
+        if isinstance(borders, int):
+            borders = (borders, borders, borders, borders)
+        width, height = self.image.get_size()
+        left, top, right, bottom = borders
+        if min(borders) < 0 or left + right >= width or top + bottom >= height:
+            raise ValueError(f"Borders {borders} do not fit inside image of size {(width, height)}.")
+        self.borders: Tuple[int, int, int, int] = tuple(borders)
+        self._rendered: pygame.Surface = None  # Last rendered surface, along with the size it was rendered at
+        self._rendered_size: Tuple[int, int] = None
+        super().__init__(position, size if size else (width, height), visible, selected)
+
+    def get(self) -> pygame.Surface:
+        """
+        Method returns image rendered at current (or re-sized) size.
+
+        Returns:
+            pygame.Surface: Rendered surface.
+        """
+        size = tuple(self.resized_size) if self.is_resized else tuple(self.size)
+        if size != self._rendered_size:
+            self._rendered = nine_slice(self.image, size, self.borders, self._source_key)
+            self._rendered_size = size
+        return self._rendered
+
+    def draw(self) -> None:
+        """
+        Method will draw itself and every item attached to it.
+        """
+        if self.visible:
+            self.display.blit(self.get(), self.scaled_position if self.is_resized else self.position)
+        for item in self.items:
+            item.draw()
+
+    def __repr__(self) -> str:
+        return create_object_repr(self)
+
+
 class Image:
     """
     Class for creating image objects and place them on screen or page.
@@ -180,7 +306,7 @@ class Image:
     def __init__(self,
                  image: Union[str, pygame.Surface],
                  transparent: bool = False,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  visible: bool = True,
                  selected: bool = False,
                  resizable: bool = True
@@ -2,39 +2,100 @@
 Module containing Item base classes.
 """
 
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
 
 import pygame
 
 from pyggui.helpers.helpers import create_object_repr
 
+# Shared immutable default for items and items_positions of items without attached items
+NO_ITEMS: Tuple = ()
+
+
+def visible_items(items: Iterable[any], area: pygame.Rect) -> Iterator[any]:
+    """
+    Function yields items whose bounds intersect area, usually the clip area of the display they get drawn on.
+    Items without bounds are always yielded.
+
+    Args:
+        items (Iterable[any]): Items to filter.
+        area (pygame.Rect): Area items should intersect.
+
+    Returns:
+        Iterator[any]: Items to draw.
+    """
+    for item in items:
+        bounds = getattr(item, "bounds", None)
+        if bounds is None or area.colliderect(bounds):
+            yield item
+
 
 class BaseItem:
     """
     Base class for all items.
+    Items define __slots__ to keep per-instance memory low, subclasses should define their own __slots__ for any new
+    attributes (subclasses without __slots__ still work, but get a per-instance __dict__).
+    Lists holding attached items are only allocated once the first item gets attached, until then items and
+    items_positions point to a shared empty tuple. Attach items using add_item (or _append_item in subclasses).
+
+    Attached items store their position as an offset relative to the item they are attached to (the same list object
+    is kept in the parents items_positions). Moving an item only marks its attached items (and theirs) as dirty, their
+    positions get re-computed from the offsets once accessed. Setting the position of an attached item changes its
+    offset, so it keeps its place relative to the parent.
+
+    Bounds of the item along with every attached item are cached relative to the items position, and are used for
+    skipping the drawing of items outside the displays clip area. Cached bounds get invalidated once the item (or an
+    attached item) changes size, moves relative to its parent or gets items attached.
+
+    Surfaces held by the item are listed through iter_surfaces and replaced through convert_surfaces, used by pages
+    for estimating memory and keeping surfaces in the displays pixel format. By default both handle the attributes
+    named in surface_attributes, each holding a surface or a list (or tuple) of surfaces.
     """
+    __slots__ = ("display", "initial_position", "_rect", "items", "items_positions", "visible", "selected", "parent",
+                 "_bounds", "_offset", "_dirty")
+    surface_attributes: Tuple[str, ...] = ()  # Names of attributes holding surfaces (or lists of surfaces)
+
     def __init__(self, position: List[int], size: Tuple[int, int], visible: bool = True, selected: bool = False):
         self.display = pygame.display.get_surface()
 
         self.initial_position = position  # Save initial position
-        self.rect = pygame.Rect(position[0], position[1], size[0], size[1])
+        self._rect = pygame.Rect(position[0], position[1], size[0], size[1])
 
-        self.items: List[any] = []  # List of items attached to self
-        self.items_positions: List[Tuple[int, int]] = []
+        self.items: List[any] = NO_ITEMS  # List of items attached to self, allocated on first attached item
+        self.items_positions: List[Tuple[int, int]] = NO_ITEMS
 
         self.visible = visible
         self.selected: bool = selected
 
         self.parent = None  # This points to the item where this one is contained at
+        self._bounds = None  # Cached bounds of self and attached items, relative to own position
+        self._offset = None  # Position relative to parent if attached to an item, None otherwise
+        self._dirty = False  # If position has to be re-computed from offset
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        Rectangle of item on screen or page, position is re-computed from the offset if an ancestor moved.
+        """
+        if self._dirty:
+            self._rect.topleft = self.parent._resolve_offset(self._offset)
+            self._dirty = False
+        return self._rect
 
     @property
     def position(self) -> List[int]:
-        return [self.rect.x, self.rect.y]
+        rect = self.rect
+        return [rect.x, rect.y]
 
     @position.setter
     def position(self, pos: List[int]):
-        self.rect.x = pos[0]
-        self.rect.y = pos[1]
+        if self._offset is not None:  # Attached, store position as offset relative to parent
+            self._offset[0], self._offset[1] = self.parent._local_offset(pos)
+            self.parent.invalidate_bounds()
+        self._rect.x = pos[0]
+        self._rect.y = pos[1]
+        self._dirty = False
+        self.update_items_positions()
 
     @property
     def x(self) -> int:
@@ -42,7 +103,7 @@ class BaseItem:
 
     @x.setter
     def x(self, new_x: int):
-        self.rect.x = new_x
+        self.position = (new_x, self.rect.y)
 
     @property
     def y(self) -> int:
@@ -50,31 +111,34 @@ class BaseItem:
 
     @y.setter
     def y(self, new_y: int):
-        self.rect.y = new_y
+        self.position = (self.rect.x, new_y)
 
     @property
     def size(self) -> Tuple[int, int]:
-        return self.rect.size
+        return self._rect.size
 
     @size.setter
     def size(self, new_size: Tuple[int, int]):
-        self.rect.size = new_size
+        self._rect.size = new_size
+        self.invalidate_bounds()
 
     @property
     def width(self) -> int:
-        return self.rect.width
+        return self._rect.width
 
     @width.setter
     def width(self, new_width: int) -> None:
-        self.rect.width = new_width
+        self._rect.width = new_width
+        self.invalidate_bounds()
 
     @property
     def height(self) -> int:
-        return self.rect.height
+        return self._rect.height
 
     @height.setter
     def height(self, new_height: int) -> None:
-        self.rect.height = new_height
+        self._rect.height = new_height
+        self.invalidate_bounds()
 
     def reset_position(self) -> None:
         """
@@ -82,12 +146,29 @@ class BaseItem:
         """
         self.position = self.initial_position
 
+    def _resolve_offset(self, offset: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the position of an attached item with offset relative to self.
+        """
+        rect = self.rect
+        return rect.x + offset[0], rect.y + offset[1]
+
+    def _local_offset(self, position: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the offset relative to self of an attached item placed in position, inverse of _resolve_offset.
+        """
+        rect = self.rect
+        return position[0] - rect.x, position[1] - rect.y
+
     def update_items_positions(self) -> None:
         """
-        Method updates every attached items position relative to self.
+        Method marks every attached item (and items attached to them) as moved, their positions get re-computed
+        relative to self once accessed.
         """
-        for i, item in enumerate(self.items):
-            item.position = [self.x + self.items_positions[i][0], self.y + self.items_positions[i][1]]
+        for item, _ in self._item_offsets():
+            if not getattr(item, "_dirty", True):  # Already dirty items have dirty attached items as well
+                item._dirty = True
+                item.update_items_positions()
 
     def move(self, change: Union[Tuple[int, int], List[int]]) -> None:
         """
@@ -97,7 +178,6 @@ class BaseItem:
             change (Union[Tuple[int, int], List[int]]): dx, dy to move item in each direction.
         """
         self.position = [self.x + change[0], self.y + change[1]]
-        self.update_items_positions()
 
     def move_to(self, point: Union[List[int], Tuple[int, int]]) -> None:
         """
@@ -107,7 +187,6 @@ class BaseItem:
             point (Union[List[int], Tuple[int, int]]): x, y point to move item to on screen or page.
         """
         self.position = point
-        self.update_items_positions()
 
     def add_item(self, item: any, relative_position: Union[Tuple[int, int], List[int]] = None) -> None:
         """
@@ -122,10 +201,216 @@ class BaseItem:
         """
         if not relative_position:
             relative_position = [item.x - self.x, item.y - self.y]
-        item.position = [self.x + relative_position[0], self.y + relative_position[1]]
-        item.parent = self  # Point to self as parent
+        self._append_item(item, relative_position)
+
+    def _append_item(self, item: any, relative_position: Union[Tuple[int, int], List[int]]) -> int:
+        """
+        Method appends item and its relative position to the items lists, allocating the lists on first use.
+        Item gets attached to self, its position is from now on kept relative to self.
+
+        Args:
+            item (any): Item to append.
+            relative_position (Union[Tuple[int, int], List[int]]): Position of item relative to self.
+
+        Returns:
+            int: Position (index) in items list of appended item.
+        """
+        if self.items is NO_ITEMS:
+            self.items = []
+            self.items_positions = []
+        offset = [relative_position[0], relative_position[1]]
         self.items.append(item)
-        self.items_positions.append(relative_position)
+        self.items_positions.append(offset)
+        self._attach(item, offset)
+        return len(self.items) - 1
+
+    def remove_item(self, item: any) -> int:
+        """
+        Method removes item (along with its relative position) from the items lists and detaches it from self, item
+        keeps its current position. Subclasses keeping other per-item lists should override it (calling the super
+        method).
+
+        Args:
+            item (any): Attached item to remove.
+
+        Returns:
+            int: Position (index) the item had in items list.
+        """
+        for index, attached in enumerate(self.items):
+            if attached is item:
+                break
+        else:
+            raise ValueError("Item is not attached to {}.".format(self))
+        position = item.position  # Resolved while still attached
+        del self.items[index]
+        del self.items_positions[index]
+        item.parent = None
+        if isinstance(item, BaseItem):
+            item._offset = None
+            item._dirty = False
+            item._rect.topleft = position
+        self.invalidate_bounds()
+        return index
+
+    def _attach(self, item: any, offset: List[int]) -> None:
+        """
+        Method attaches item to self with passed offset (list object shared with items_positions).
+
+        Args:
+            item (any): Item to attach.
+            offset (List[int]): Position of item relative to self.
+        """
+        item.parent = self
+        if isinstance(item, BaseItem):
+            item._offset = offset
+            item._dirty = False
+            item.update_items_positions()
+            item._dirty = True
+        else:  # Items not based on BaseItem get positioned once
+            item.position = self._resolve_offset(offset)
+        self.invalidate_bounds()
+
+    def iter_surfaces(self) -> Iterator[Tuple[str, pygame.Surface]]:
+        """
+        Method yields (name, surface) for every surface held by self (not by attached items). Items holding surfaces
+        in other structures should override it along with convert_surfaces.
+
+        Returns:
+            Iterator[Tuple[str, pygame.Surface]]: Name of attribute (with index for lists) and surface.
+        """
+        for name in self.surface_attributes:
+            value = getattr(self, name, None)
+            if isinstance(value, pygame.Surface):
+                yield name, value
+            elif isinstance(value, (list, tuple)):
+                for i, surface in enumerate(value):
+                    if isinstance(surface, pygame.Surface):
+                        yield "{}[{}]".format(name, i), surface
+
+    def convert_surfaces(self, convert: Callable[[pygame.Surface], pygame.Surface]) -> int:
+        """
+        Method replaces every surface held by self (see iter_surfaces) with the one returned by convert, if it differs.
+        Lists are changed in place, so objects sharing them (ex. animators) use the replaced surfaces as well.
+
+        Args:
+            convert (Callable[[pygame.Surface], pygame.Surface]): Function returning the surface to use instead of the
+                passed one (or the passed one).
+
+        Returns:
+            int: Number of replaced surfaces.
+        """
+        replaced = 0
+        for name in self.surface_attributes:
+            value = getattr(self, name, None)
+            if isinstance(value, pygame.Surface):
+                surface = convert(value)
+                if surface is not value:
+                    setattr(self, name, surface)
+                    replaced += 1
+            elif isinstance(value, (list, tuple)):
+                surfaces = [convert(surface) if isinstance(surface, pygame.Surface) else surface for surface in value]
+                changed = sum(new is not old for new, old in zip(surfaces, value))
+                if changed:
+                    if isinstance(value, list):
+                        value[:] = surfaces
+                    else:
+                        setattr(self, name, tuple(surfaces))
+                    replaced += changed
+        return replaced
+
+    def set_display(self, display: pygame.Surface) -> None:
+        """
+        Method sets the surface self and every attached item get drawn on.
+
+        Args:
+            display (pygame.Surface): Surface to draw on.
+        """
+        self.display = display
+        for item, _ in self._item_offsets():
+            if hasattr(item, "set_display"):
+                item.set_display(display)
+            else:
+                item.display = display
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to attached items in reverse order of drawing (topmost first), until one of them
+        consumes it. Interactive items override it, calling the super method first as attached items are drawn on top
+        of them.
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        for item in reversed(self.items):
+            handle_event = getattr(item, "handle_event", None)
+            if handle_event and handle_event(event):
+                return True
+        return False
+
+    def on_display_resize(self, size: Tuple[int, int]) -> None:
+        """
+        Method gets called once the display was re-sized, passes the new size to every attached item. Items with a
+        layout depending on the display size should override it (calling the super method).
+
+        Args:
+            size (Tuple[int, int]): New size of display.
+        """
+        for item, _ in self._item_offsets():
+            if hasattr(item, "on_display_resize"):
+                item.on_display_resize(size)
+
+    def invalidate_bounds(self) -> None:
+        """
+        Method clears cached bounds (and other cached measurements, see _invalidate) of self and every item
+        containing it, so they get re-computed once needed.
+        """
+        item = self
+        while isinstance(item, BaseItem):
+            item._invalidate()
+            item = item.parent
+
+    def _invalidate(self) -> None:
+        """
+        Method clears values cached from the size of self or attached items. Called by invalidate_bounds, subclasses
+        caching other measurements should override it (calling the super method).
+        """
+        self._bounds = None
+
+    def _item_offsets(self) -> Iterator[Tuple[any, Tuple[int, int]]]:
+        """
+        Method yields every attached item along with its position relative to self, used for computing bounds.
+        """
+        return zip(self.items, self.items_positions)
+
+    def _compute_bounds(self) -> pygame.Rect:
+        """
+        Method computes bounds of self and every attached item, relative to own position.
+        """
+        bounds = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        for item, offset in self._item_offsets():
+            item_bounds = getattr(item, "relative_bounds", None)
+            if item_bounds is not None:
+                bounds.union_ip(item_bounds.move(offset[0], offset[1]))
+        return bounds
+
+    @property
+    def relative_bounds(self) -> pygame.Rect:
+        """
+        Bounds of self and every attached item, relative to own position. Cached until invalidated.
+        """
+        if self._bounds is None:
+            self._bounds = self._compute_bounds()
+        return self._bounds
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        """
+        Rectangle on display containing self and every attached item.
+        """
+        return self.relative_bounds.move(self.rect.x, self.rect.y)
 
     def update(self):
         # Dummy method, some items do not get updated but pages still cal the update method.
@@ -146,11 +431,16 @@ class Item(BaseItem):
     Class for items that are interactive but dependant on controller object.
     Items have hovered property which is set to true once the item is hovered by mouse. Have on_click method to trigger
     an action once the item is clicked.
+    Clicks are delivered by the page through handle_event; only the topmost item under the mouse receives (consumes)
+    a click, which then triggers on_click in the items next update.
     """
+    __slots__ = ("controller", "_on_click", "_last_click_time", "debounce_interval", "movable", "was_pressed",
+                 "hovered", "_clicked")
+
     def __init__(
         self,
         controller: 'Controller',
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         size: Tuple[int, int] = (1, 1),
         on_click: Callable = None,
         movable: bool = False,
@@ -159,7 +449,7 @@ class Item(BaseItem):
         """
         Args:
             controller (Controller): Main controller object.
-            position (List[int] = [0, 0]): Position to place item on screen (or on page).
+            position (List[int] = (0, 0)): Position to place item on screen (or on page).
             size (Tuple[int, int] = (1, 1)): Size of item.
             on_click (Callable): Callable function that gets called once the item is clicked. Default to None.
             movable (bool): If set to true item accepts double error clicks from mouse. (One normal mouse click is
@@ -185,13 +475,40 @@ class Item(BaseItem):
             self.debounce_interval = 0
         # Was pressed property used for checking if mouse was pressed on item initially and is still being pressed
         self.was_pressed = False
+        self.hovered = False
+        self._clicked = False  # If a click was delivered to item since its last update
 
     @property
-    def mouse_clicked(self):
-        if self.movable:
+    def mouse_clicked(self) -> bool:
+        """
+        If item was clicked since its last update. Movable items also count as clicked while the mouse stays pressed
+        after clicking them.
+
+        Returns:
+            bool: If clicked
+        """
+        if self.movable and self.was_pressed:
             return self.controller.input.mouse_pressed
-        else:
-            return self.controller.input.mouse_clicked
+        return self._clicked
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to attached items, then consumes left mouse button presses on item.
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        if not self.visible:
+            return False
+        if super().handle_event(event):
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            self._clicked = True
+            return True
+        return False
 
     def add_on_click(self, on_click: Union[Callable, List[Callable], Tuple[Callable]]) -> None:
         """
@@ -234,16 +551,16 @@ class Item(BaseItem):
         Used for updating all items attached to it(sizes, positions, etc.).
         """
         self.hovered = self.rect.collidepoint(self.controller.input.mouse_position)
-        # Check if mouse was clicked on item, in the interval of the debounce time
-        if self.hovered:
-            if self.mouse_clicked and self.debounce_time():
-                self.on_click()
-                self.was_pressed = True
+        clicked, self._clicked = self._clicked, False
+        # Check if item was clicked, in the interval of the debounce time
+        if clicked and self.debounce_time():
+            self.on_click()
+            self.was_pressed = True
         # Mouse was released
-        elif not self.mouse_clicked:
+        elif self.was_pressed and not self.controller.input.mouse_pressed:
             self.was_pressed = False
         # If was pressed and mouse is not on the item anymore still call on_click method works if movable = True
-        if self.was_pressed and self.movable:  # Only check if item is movable, otherwise get multiple clicks
+        elif self.was_pressed and self.movable:  # Only check if item is movable, otherwise get multiple clicks
             self.on_click()
         # Update all items
         for item in self.items:
@@ -254,7 +571,7 @@ class Item(BaseItem):
         Used for drawing itself and every item attached to it.
         """
         # Logic for drawing itself goes here
-        for item in self.items:
+        for item in visible_items(self.items, self.display.get_clip()):
             item.draw()
 
     def __repr__(self) -> str:
@@ -265,16 +582,18 @@ class StaticItem(BaseItem):
     """
     Class for static items that are not intractable (can't be clicked and do not have hovered property).
     """
+    __slots__ = ()
+
     def __init__(
         self,
-        position: List[int] = [0, 0],
+        position: List[int] = (0, 0),
         size: Tuple[int, int] = (1, 1),
         visible: bool = True,
         selected: bool = False
     ):
         """
         Args:
-            position (List[int] = [0, 0]): Position to place item on screen (or on page).
+            position (List[int] = (0, 0)): Position to place item on screen (or on page).
             size (Tuple[int, int] = (1, 1)): Size of item.
             visible (bool): If item is currently visible.
             selected (bool): If item is currently selected.
@@ -289,7 +608,7 @@ class StaticItem(BaseItem):
     def draw(self) -> None:
         """ Used for drawing itself and every item attached to it. """
         if self.visible:
-            for item in self.items:
+            for item in visible_items(self.items, self.display.get_clip()):
                 item.draw()
 
     def __repr__(self) -> str:
@@ -303,8 +622,10 @@ class ResizableItem(BaseItem):
     and that this class does not need the controller to be passed.
     Items can not be attached to this class.
     """
+    __slots__ = ("initial_size", "is_resized", "moved_position", "resized_factor", "resized_size", "resized")
+
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  size: Tuple[int, int] = (1, 1),
                  visible: bool = True,
                  selected: bool = False
@@ -377,6 +698,7 @@ class ResizableItem(BaseItem):
         self.moved_position = [dx, dy]
         self.resized_size = [int(self.width * factor), int(self.height * factor)]
         self.is_resized = True
+        self.invalidate_bounds()
 
     def reset_size(self) -> None:
         """
@@ -384,6 +706,16 @@ class ResizableItem(BaseItem):
         """
         self.moved_position = [0, 0]
         self.is_resized = False
+        self.invalidate_bounds()
+
+    def _compute_bounds(self) -> pygame.Rect:
+        """
+        Method computes bounds of self, including its re-sized rectangle, and every attached item.
+        """
+        bounds = super()._compute_bounds()
+        if self.is_resized:
+            bounds.union_ip(pygame.Rect(self.moved_position, self.resized_size))
+        return bounds
 
     def __repr__(self) -> str:
         return create_object_repr(self)
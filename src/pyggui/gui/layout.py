@@ -0,0 +1,288 @@
+"""
+Module containing flex layout classes, used for placing items in rows and columns without computing their positions
+by hand.
+"""
+
+from typing import List, Tuple
+
+from pyggui.gui.item import NO_ITEMS, BaseItem, StaticItem, visible_items
+
+# Possible values of FlexBox justify and align arguments
+JUSTIFY = ("start", "centre", "end", "space_between")
+ALIGN = ("start", "centre", "end", "stretch")
+
+
+def clamp_size(size: Tuple[int, int], min_size: Tuple[int, int] = None,
+               max_size: Tuple[int, int] = None) -> Tuple[int, int]:
+    """
+    Function clamps size between min_size and max_size.
+
+    Args:
+        size (Tuple[int, int]): Size to clamp.
+        min_size (Tuple[int, int]): Minimum size, None for no minimum.
+        max_size (Tuple[int, int]): Maximum size, None for no maximum.
+
+    Returns:
+        Tuple[int, int]: Clamped size.
+    """
+    width, height = size
+    if min_size:
+        width, height = max(width, min_size[0]), max(height, min_size[1])
+    if max_size:
+        width, height = min(width, max_size[0]), min(height, max_size[1])
+    return int(width), int(height)
+
+
+class FlexBox(StaticItem):
+    """
+    Container placing its items one after another in a row or a column, sized from its items (Text sizes, image
+    sizes, sizes of nested boxes) unless a fixed size is passed.
+
+    Items can grow to take up free space along the main axis (grow factor passed to add_item), are justified along
+    the main axis and aligned along the cross axis. Nested boxes are sized by the box containing them when they grow
+    or get stretched, other items keep their own size and get placed inside the space they were given.
+
+    Measured sizes are cached; once an item changes size (or an item gets added) only the boxes containing it get
+    measured and laid out again, so calling layout every frame is cheap. Layout is done in update, call layout
+    directly for placing items before the first update.
+    """
+    __slots__ = ("direction", "gap", "padding", "justify", "align", "fixed_size", "min_size", "max_size", "grows",
+                 "_measured", "_arranged")
+
+    def __init__(self,
+                 position: List[int] = (0, 0),
+                 direction: str = "row",
+                 gap: int = 0,
+                 padding: int = 0,
+                 justify: str = "start",
+                 align: str = "start",
+                 size: Tuple[int, int] = None,
+                 min_size: Tuple[int, int] = None,
+                 max_size: Tuple[int, int] = None,
+                 visible: bool = True,
+                 selected: bool = False
+                 ):
+        """
+        Args:
+            position (List[int]): Position of box on screen or on Page. Defaults to (0, 0).
+            direction (str): Either row (items placed left to right) or column (items placed top to bottom).
+                Defaults to row.
+            gap (int): Px between two consecutive items. Defaults to 0.
+            padding (int): Px between box borders and items. Defaults to 0.
+            justify (str): Placement of items along the main axis if there is free space: start, centre, end or
+                space_between. Defaults to start.
+            align (str): Placement of items along the cross axis: start, centre, end or stretch (nested boxes take
+                the whole cross size). Defaults to start.
+            size (Tuple[int, int]): Fixed size of box. Defaults to None, box is sized from its items.
+            min_size (Tuple[int, int]): Minimum size of box. Defaults to None.
+            max_size (Tuple[int, int]): Maximum size of box. Defaults to None.
+            visible (bool): If box and its items are drawn. Defaults to True.
+            selected (bool): If box is currently selected. Defaults to False.
+        """
+        if direction not in ("row", "column"):
+            raise ValueError(f"Direction {direction} is not one of: row, column.")
+        if justify not in JUSTIFY:
+            raise ValueError(f"Justify {justify} is not one of: {', '.join(JUSTIFY)}.")
+        if align not in ALIGN:
+            raise ValueError(f"Align {align} is not one of: {', '.join(ALIGN)}.")
+        self.direction = direction
+        self.gap = gap
+        self.padding = padding
+        self.justify = justify
+        self.align = align
+        self.fixed_size = size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.grows: List[float] = NO_ITEMS  # Grow factor of each item
+        self._measured = None  # Cached size measured from items, None once an item changed
+        self._arranged = False  # If items are placed for current size
+        super().__init__(position, clamp_size(size if size else (0, 0), min_size, max_size), visible, selected)
+
+    def _invalidate(self) -> None:
+        super()._invalidate()
+        self._measured = None
+        self._arranged = False
+
+    def add_item(self, item: any, grow: float = 0) -> int:
+        """
+        Method adds item as the last item of box.
+
+        Args:
+            item (any): Item to add, should have a size.
+            grow (float): Share of free space along the main axis item takes up, relative to grow factors of other
+                items. Defaults to 0, item does not grow.
+
+        Returns:
+            int: Position (index) in items list of added item.
+        """
+        if self.grows is NO_ITEMS:
+            self.grows = []
+        self.grows.append(grow)
+        return self._append_item(item, (0, 0))
+
+    def remove_item(self, item: any) -> int:
+        """
+        Method removes item from box, see BaseItem.remove_item.
+        """
+        index = super().remove_item(item)
+        del self.grows[index]
+        return index
+
+    def measure(self) -> Tuple[int, int]:
+        """
+        Method returns the size of box computed from its items (or its fixed size), clamped between its minimum and
+        maximum size. Result is cached until an item changes.
+
+        Returns:
+            Tuple[int, int]: Size in px.
+        """
+        if self._measured is None:
+            if self.fixed_size:
+                size = self.fixed_size
+            else:
+                main, cross = (0, 1) if self.direction == "row" else (1, 0)
+                sizes = [self._measure_item(item) for item in self.items]
+                content = [0, 0]
+                content[main] = sum(size[main] for size in sizes) + self.gap * max(0, len(sizes) - 1)
+                content[cross] = max((size[cross] for size in sizes), default=0)
+                size = (content[0] + 2 * self.padding, content[1] + 2 * self.padding)
+            self._measured = clamp_size(size, self.min_size, self.max_size)
+        return self._measured
+
+    @staticmethod
+    def _measure_item(item: any) -> Tuple[int, int]:
+        """
+        Method returns the size an item needs.
+        """
+        if isinstance(item, FlexBox):
+            return item.measure()
+        return tuple(item.size)
+
+    def layout(self) -> None:
+        """
+        Method sizes the box (if it is not contained in another box) and places its items, only if something changed
+        since the last layout.
+        """
+        if isinstance(self.parent, FlexBox):  # Laid out by the containing box
+            if not self._arranged:
+                self._arrange()
+            return
+        if self._measured is None or not self._arranged:
+            self._rect.size = self.measure()
+            self._arrange()
+
+    def _arrange(self) -> None:
+        """
+        Method places items inside box for its current size, nested boxes that got a new size (or changed) get
+        arranged as well.
+        """
+        main, cross = (0, 1) if self.direction == "row" else (1, 0)
+        padding = self.padding
+        inner = (self._rect.width - 2 * padding, self._rect.height - 2 * padding)
+        sizes = [list(self._measure_item(item)) for item in self.items]
+        slots = [size[main] for size in sizes]  # Space along main axis given to each item
+        free = inner[main] - sum(slots) - self.gap * max(0, len(slots) - 1)
+        total_grow = sum(self.grows)
+        if free > 0 and total_grow:  # Grow items
+            shares = [int(free * grow / total_grow) for grow in self.grows]
+            for i, share in enumerate(shares):
+                slots[i] += share
+            free -= sum(shares)
+            for i in range(len(slots) - 1, -1, -1):  # Rounding remainder goes to the last growing item
+                if self.grows[i]:
+                    slots[i] += free
+                    break
+            free = 0
+        # Justify along the main axis
+        position, spacing = 0, self.gap
+        if free > 0:
+            if self.justify == "centre":
+                position = free // 2
+            elif self.justify == "end":
+                position = free
+            elif self.justify == "space_between" and len(slots) > 1:
+                spacing += free / (len(slots) - 1)
+        for item, size, slot in zip(self.items, sizes, slots):
+            if isinstance(item, FlexBox):  # Nested boxes fill their slot, and the cross size if stretched
+                size[main] = slot
+                if self.align == "stretch":
+                    size[cross] = inner[cross]
+                size = clamp_size(size, item.min_size, item.max_size)
+                if tuple(item._rect.size) != size or not item._arranged:
+                    item._rect.size = size
+                    item._bounds = None
+                    item._arrange()
+            # Align along the cross axis
+            cross_position = 0
+            if self.align == "centre":
+                cross_position = (inner[cross] - size[cross]) // 2
+            elif self.align == "end":
+                cross_position = inner[cross] - size[cross]
+            offset = [0, 0]
+            offset[main] = padding + int(position)
+            offset[cross] = padding + cross_position
+            self._place(item, offset)
+            position += slot + spacing
+        self._arranged = True
+        item = self
+        while isinstance(item, BaseItem):  # Items moved, only bounds change not measurements
+            item._bounds = None
+            item = item.parent
+
+    def _place(self, item: any, offset: List[int]) -> None:
+        """
+        Method moves item to offset relative to box, if it is not there already.
+        """
+        if isinstance(item, BaseItem):
+            if item._offset != offset:
+                item._offset[0], item._offset[1] = offset
+                item._dirty = True
+                item.update_items_positions()
+        else:
+            item.position = self._resolve_offset(offset)
+
+    def update(self) -> None:
+        """
+        Method lays out box if needed, then updates every item.
+        """
+        self.layout()
+        for item in self.items:
+            item.update()
+
+    def draw(self) -> None:
+        """
+        Method draws every item in box.
+        """
+        if self.visible:
+            for item in visible_items(self.items, self.display.get_clip()):
+                item.draw()
+
+
+class FlexRow(FlexBox):
+    """
+    FlexBox placing items left to right.
+    """
+    __slots__ = ()
+
+    def __init__(self, position: List[int] = (0, 0), **kwargs):
+        """
+        Args:
+            position (List[int]): Position of box on screen or on Page. Defaults to (0, 0).
+            **kwargs (any): Passed to FlexBox.
+        """
+        super().__init__(position, direction="row", **kwargs)
+
+
+class FlexColumn(FlexBox):
+    """
+    FlexBox placing items top to bottom.
+    """
+    __slots__ = ()
+
+    def __init__(self, position: List[int] = (0, 0), **kwargs):
+        """
+        Args:
+            position (List[int]): Position of box on screen or on Page. Defaults to (0, 0).
+            **kwargs (any): Passed to FlexBox.
+        """
+        super().__init__(position, direction="column", **kwargs)
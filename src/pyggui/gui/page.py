@@ -2,18 +2,41 @@
 Module containing base classes for pages.
 """
 
-from typing import List, Tuple, Callable
+from typing import Iterator, List, Tuple, Callable
 
 import pygame
 
-from pyggui.gui.event_handler import EventHandler
+from pyggui.gui.event_handler import EventHandler, HandlerGroup
+from pyggui.gui.item import visible_items
+from pyggui.helpers.scheduler import Scheduler, ScheduledTask
+from pyggui.helpers.surfaces import display_formats, matches_display, surface_bytes, to_display_format
+
+
+# Attributes that may hold rendered surfaces of items not based on BaseItem (items based on it list their surfaces
+# through iter_surfaces)
+SURFACE_ATTRIBUTES = ("surface", "image", "current_image", "resized")
 
 
 class Page:
     """
     Main class other pages should inherit from.
     Page object functions similarly to an Item, it can be moved and resized.
+
+    Setting the class attribute reusable to True marks the page as reusable; the controller then keeps its instance
+    alive after redirecting from it and re-enters the same instance on later redirects instead of constructing a new
+    one. Arguments passed on those redirects are passed to the reset method.
+
+    Image paths listed in the class attribute preload_images get decoded on worker threads once the page is
+    prefetched through the controllers prefetch_page method, so constructing the page does not decode them again.
+
+    Each page has its own scheduler for timers (call_later), repeating callbacks (call_every) and items that only
+    need low-frequency updates (add_item with update_interval). Scheduled callbacks only run while the page is shown;
+    the scheduler is paused once the page is left and resumed once it appears again, so time spent hidden does not
+    count towards any timer.
     """
+    reusable: bool = False  # If controller keeps the page instance alive between redirects
+    preload_images: List[str] = []  # Image paths decoded in advance when page gets prefetched
+
     def __init__(self, controller: 'Controller'):
         """
         Args:
@@ -23,11 +46,16 @@ class Page:
         self.display = controller.display
         self.items = []
         self.items_positions = []  # Positions relative to the top left corner of page
+        self.updated_items = []  # Items updated every frame, others are updated by the scheduler
+        self.scheduler = Scheduler(clock=pygame.time.get_ticks)
+        self._item_tasks = {}  # Item -> ScheduledTask of items updated by the scheduler
+        self._removed = {}  # id(item) -> item of items removed since the last compaction
         self.background_color = (0, 0, 0)
         size = self.display.get_size()
         self.rect = pygame.Rect(0, 0, size[0], size[1])  # Initial position at (0, 0)
+        self._layout_size = size  # Display size items were last laid out for
 
-        self.event_handlers: List[EventHandler] = []
+        self.event_handlers: HandlerGroup = HandlerGroup()  # Page-wide handlers, enabled while page is shown
 
         self.parent = None  # Used if page is contained in another page
 
@@ -86,14 +114,22 @@ class Page:
 
     def add_event_handler(self, event_handler: EventHandler) -> None:
         """
-        Method adds a page-wide EventHandler object. This event handler is not triggered after the page has been
-        redirected from i.e. with the redirect_to or go_back methods of Controller.
+        Method adds a page-wide EventHandler object. Page event handlers only get triggered while the page is shown,
+        before items on page receive the event (see dispatch_event).
 
         Args:
             event_handler (EventHandler): EventHandler object to add.
         """
-        self.controller.input.add_event_handler(event_handler)
-        self.event_handlers.append(event_handler)
+        self.event_handlers.add(event_handler)
+
+    def remove_event_handler(self, event_handler: EventHandler) -> None:
+        """
+        Method removes a page-wide EventHandler object.
+
+        Args:
+            event_handler (EventHandler): EventHandler object to remove.
+        """
+        self.event_handlers.remove(event_handler)
 
     def add_event_type_handler(self, event_type: int, handler: Callable):
         """
@@ -109,40 +145,252 @@ class Page:
         event_handler = EventHandler(types=event_type, handlers=handler)
         self.add_event_handler(event_handler)
 
-    def add_item(self, item: any) -> None:
+    def add_item(self, item: any, update_interval: int = None, phase: int = None) -> None:
         """
         Method adds item to page. Items position should be set beforehand.
+        Items are updated every frame, unless an update interval is passed; the item is then updated by the pages
+        scheduler once every update_interval milliseconds.
 
         Args:
             item (any): Item to add to page. Item must have the update and draw methods.
+            update_interval (int): Optional; milliseconds between two updates of item.
+            phase (int): Optional; milliseconds from now of the first update, if not passed items sharing the same
+                update interval get spread evenly across it.
         """
+        if id(item) in self._removed:  # Re-added before its removal was applied
+            self._compact()
         item.parent = self
         self.items.append(item)
         self.items_positions.append(item.position)
+        if update_interval:
+            self._item_tasks[item] = self.scheduler.call_every(update_interval, item.update, phase=phase)
+        else:
+            self.updated_items.append(item)
+
+    def remove_item(self, item: any) -> None:
+        """
+        Method removes item from page, its scheduled updates are cancelled. Removals are applied in a single pass
+        over the items lists once the page finishes updating (or before drawing), so removing many items is cheap and
+        items can be removed while the page is updating them.
+
+        Args:
+            item (any): Item to remove.
+        """
+        self._removed[id(item)] = item
+        task = self._item_tasks.pop(item, None)
+        if task:
+            task.cancel()
+        item.parent = None
+
+    def _compact(self) -> None:
+        """
+        Method applies pending removals of items.
+        """
+        removed = self._removed
+        kept = [i for i, item in enumerate(self.items) if id(item) not in removed]
+        self.items = [self.items[i] for i in kept]
+        self.items_positions = [self.items_positions[i] for i in kept]
+        self.updated_items = [item for item in self.updated_items if id(item) not in removed]
+        removed.clear()
+
+    def call_later(self, delay: int, callback: Callable) -> ScheduledTask:
+        """
+        Method calls callback once, after delay milliseconds. Only called while the page is shown.
+
+        Args:
+            delay (int): Milliseconds from now.
+            callback (Callable): Callable function to call.
+
+        Returns:
+            ScheduledTask: Task, call its cancel method to cancel it.
+        """
+        return self.scheduler.call_later(delay, callback)
+
+    def call_every(self, interval: int, callback: Callable, phase: int = None) -> ScheduledTask:
+        """
+        Method calls callback every interval milliseconds. Only called while the page is shown.
+
+        Args:
+            interval (int): Milliseconds between two calls.
+            callback (Callable): Callable function to call.
+            phase (int): Optional; milliseconds from now of the first call, if not passed callbacks sharing the same
+                interval get spread evenly across it.
+
+        Returns:
+            ScheduledTask: Task, call its cancel method to cancel it.
+        """
+        return self.scheduler.call_every(interval, callback, phase=phase)
 
     def update(self) -> None:
         """
-        Method updates every item added to page. Once the item is added, page no longer controlls its position but it
-        has its original position stored.
+        Method updates every item added to page, and runs scheduled callbacks and item updates that are due.
+        Once the item is added, page no longer controlls its position but it has its original position stored.
         """
-        for i, item in enumerate(self.items):
+        for item in self.updated_items:
             item.update()
+        self.scheduler.update()
+        if self._removed:
+            self._compact()
 
     def draw(self) -> None:
         """
-        Method draws every item added to page.
+        Method draws every item added to page, skipping items outside the displays clip area.
         """
-        for item in self.items:
+        if self._removed:
+            self._compact()
+        for item in visible_items(self.items, self.display.get_clip()):
             item.draw()
 
+    def dispatch_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to page event handlers, then to items in reverse order of drawing (topmost first) through
+        their handle_event method, until one of them consumes it. Called by the controller for the overlay and current
+        page.
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        if self.event_handlers.dispatch(event):
+            return True
+        if self._removed:
+            self._compact()
+        for item in reversed(self.items):
+            handle_event = getattr(item, "handle_event", None)
+            if handle_event and handle_event(event):
+                return True
+        return False
+
+    def _all_items(self) -> Iterator[any]:
+        """
+        Method yields every item on page along with their attached items (including cells of grids).
+        """
+        items = list(self.items)
+        while items:
+            item = items.pop()
+            yield item
+            if hasattr(item, "_item_offsets"):
+                items.extend(attached for attached, _ in item._item_offsets())
+            else:
+                items.extend(getattr(item, "items", ()))
+
+    def _item_surfaces(self) -> Iterator[Tuple[any, str, pygame.Surface]]:
+        """
+        Method yields (item, name, surface) for every surface held by items (and their attached items) on page.
+        """
+        for item in self._all_items():
+            if hasattr(item, "iter_surfaces"):
+                for name, surface in item.iter_surfaces():
+                    yield item, name, surface
+            else:
+                for attribute in SURFACE_ATTRIBUTES:
+                    surface = getattr(item, attribute, None)
+                    if isinstance(surface, pygame.Surface):
+                        yield item, attribute, surface
+
+    def estimate_memory(self) -> int:
+        """
+        Method estimates the memory (in bytes) held by surfaces of every item (and their attached items) on page.
+        Surfaces shared by items are counted once. Used by the controller for bounding the page cache.
+
+        Returns:
+            int: Estimated number of bytes.
+        """
+        surfaces = {id(surface): surface for _, _, surface in self._item_surfaces()}
+        return sum(surface_bytes(surface) for surface in surfaces.values())
+
+    def convert_surfaces(self) -> int:
+        """
+        Method converts every surface held by items on page that is not in the displays pixel format, so none of them
+        gets converted on every blit. Called once the display gets re-sized (re-created).
+
+        Returns:
+            int: Number of converted surfaces.
+        """
+        formats = display_formats()
+        if formats is None:
+            return 0
+        # Id of surface -> (surface, converted surface), so surfaces shared by items stay shared. Source surfaces are
+        # kept so their ids do not get re-used while converting
+        converted_surfaces = {}
+
+        def convert(surface: pygame.Surface) -> pygame.Surface:
+            if id(surface) not in converted_surfaces:
+                converted_surfaces[id(surface)] = (surface, to_display_format(surface, formats))
+            return converted_surfaces[id(surface)][1]
+
+        converted = 0
+        for item in list(self._all_items()):
+            if hasattr(item, "convert_surfaces"):
+                converted += item.convert_surfaces(convert)
+                continue
+            for attribute in SURFACE_ATTRIBUTES:
+                surface = getattr(item, attribute, None)
+                if isinstance(surface, pygame.Surface) and not matches_display(surface, formats):
+                    setattr(item, attribute, convert(surface))
+                    converted += 1
+        return converted
+
+    def audit_surfaces(self) -> List[Tuple[any, str]]:
+        """
+        Method lists items on page holding a surface that is not in the displays pixel format, i.e. that SDL has to
+        convert on every blit. Meant for debugging slow drawing.
+
+        Returns:
+            List[Tuple[any, str]]: List of (item, surface name) tuples.
+        """
+        formats = display_formats()
+        if formats is None:
+            return []
+        return [(item, attribute) for item, attribute, surface in self._item_surfaces()
+                if not matches_display(surface, formats)]
+
+    def reset(self, *args, **kwargs) -> None:
+        """
+        Method gets called once a reusable page instance is re-entered through redirection, instead of constructing a
+        new page. Args and kwargs are the ones passed to the redirection. Safe for overriding.
+        """
+        pass
+
+    def _on_display_resize(self, size: Tuple[int, int]) -> None:
+        """
+        Private method only called by controller, or once the page appears after the display was re-sized.
+        Method re-sizes page and passes the new size to every item, then calls the on_display_resize method.
+
+        Args:
+            size (Tuple[int, int]): New size of display.
+        """
+        size = tuple(size)
+        if size == self._layout_size:
+            return
+        self._layout_size = size
+        self.size = size
+        self.convert_surfaces()  # Display got re-created, its pixel format might have changed
+        for item in self.items:
+            if hasattr(item, "on_display_resize"):
+                item.on_display_resize(size)
+        self.on_display_resize(size)
+
+    def on_display_resize(self, size: Tuple[int, int]) -> None:
+        """
+        Method gets called once the display has been re-sized while the page is shown (or before it appears again).
+        Safe for overriding.
+
+        Args:
+            size (Tuple[int, int]): New size of display.
+        """
+        pass
+
     def _on_appearance(self) -> None:
         """
         Private method only called by controller.
         Method gets called once the page has been brought up again. Calls the on_appearance method.
         """
-        # Re-add all page event handlers to input
-        for event_handler in self.event_handlers:
-            self.controller.input.add_event_handler(event_handler)
+        self._on_display_resize(self.display.get_size())  # Display might have been re-sized meanwhile
+        self.event_handlers.enabled = True
+        self.scheduler.resume()  # Timers continue where they stopped, time spent hidden does not count
         self.on_appearance()
 
     def on_appearance(self) -> None:
@@ -156,8 +404,8 @@ class Page:
         Private method only called by controller.
         Method gets called once the page has been redirected from. Calls the on_exit method.
         """
-        # Remove all page event handlers from input
-        self.controller.input.remove_event_handlers(self.event_handlers)
+        self.event_handlers.enabled = False
+        self.scheduler.pause()
         self.on_exit()
 
     def on_exit(self) -> None:
@@ -0,0 +1,202 @@
+"""
+Module containing the ParticleSystem class, used for moving and drawing large numbers of small sprites at once.
+Requires NumPy, install it with: pip install pyggui[numpy]
+"""
+
+from typing import Callable, List, Sequence, Tuple, Union
+from itertools import repeat
+
+import pygame
+
+from pyggui.gui.item import StaticItem
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+
+class ParticleSystem(StaticItem):
+    """
+    Item holding many particles (sprites) in NumPy arrays: positions, velocities, remaining lifetimes and ages.
+    Particles are moved all at once every update (using the controllers dt_s), particles that died or left the systems
+    area get removed using boolean masks, and all particles are drawn with a single Surface.blits call. This makes
+    the cost of a particle a few array elements instead of a whole item.
+
+    Particle positions are positions on the display (centres of drawn images), the systems rect is the area particles
+    are kept alive in. Add the system to a page with Page.add_item and emit particles using emit or emit_arrays.
+    If multiple images are passed, particles cycle through them based on their age (frame_rate images per second).
+    """
+    __slots__ = ("controller", "images", "capacity", "gravity", "frame_rate", "loop", "cull", "count",
+                 "positions", "velocities", "lifetimes", "ages", "_random", "_images_array", "_image_offset")
+    surface_attributes = ("images",)
+
+    def __init__(self,
+                 controller: 'Controller',
+                 images: Union[pygame.Surface, List[pygame.Surface]],
+                 capacity: int = 50000,
+                 position: List[int] = (0, 0),
+                 size: Tuple[int, int] = None,
+                 gravity: Tuple[float, float] = (0, 0),
+                 frame_rate: float = 10,
+                 loop: bool = True,
+                 cull: bool = True
+                 ):
+        """
+        Args:
+            controller (Controller): Main controller object.
+            images (Union[pygame.Surface, List[pygame.Surface]]): Image of particles, or list of images (of the same
+                size) particles cycle through.
+            capacity (int): Maximum number of particles alive at once. Defaults to 50000.
+            position (List[int]): Position of area particles are kept alive in. Defaults to (0, 0).
+            size (Tuple[int, int]): Size of area particles are kept alive in. Defaults to None, size of display.
+            gravity (Tuple[float, float]): Acceleration of every particle in px per second squared. Defaults to (0, 0).
+            frame_rate (float): Images per second particles cycle through, if multiple images were passed.
+                Defaults to 10.
+            loop (bool): If particles loop through images, otherwise they stay at the last image. Defaults to True.
+            cull (bool): If particles leaving the area get removed. Defaults to True.
+        """
+        if np is None:
+            raise ImportError("ParticleSystem requires NumPy, install it with: pip install pyggui[numpy]")
+        if not size:
+            size = controller.display.get_size()
+        super().__init__(position, size)
+        self.controller = controller
+        self.images: List[pygame.Surface] = list(images) if isinstance(images, (list, tuple)) else [images]
+        self.capacity = capacity
+        self.gravity = np.array(gravity, dtype=np.float32)
+        self.frame_rate = frame_rate
+        self.loop = loop
+        self.cull = cull
+
+        # Alive particles are kept at the start of each array, count is the number of alive particles
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)  # Remaining seconds
+        self.ages = np.zeros(capacity, dtype=np.float32)  # Seconds since emitted
+        self._random = np.random.default_rng()
+        self._images_array = np.empty(len(self.images), dtype=object)
+        self._images_array[:] = self.images
+        width, height = self.images[0].get_size()
+        self._image_offset = np.array((width // 2, height // 2), dtype=np.int32)  # Images are drawn centred
+
+    def emit(self,
+             number: int,
+             position: Tuple[float, float],
+             velocity: Tuple[float, float] = (0, 0),
+             spread: Tuple[float, float] = (0, 0),
+             lifetime: float = 1,
+             lifetime_spread: float = 0
+             ) -> int:
+        """
+        Method emits number of particles from position. Velocities and lifetimes are randomised uniformly within the
+        passed spreads.
+
+        Args:
+            number (int): Number of particles to emit.
+            position (Tuple[float, float]): Position on display particles are emitted from.
+            velocity (Tuple[float, float]): Mean velocity in px per second. Defaults to (0, 0).
+            spread (Tuple[float, float]): Maximum deviation of velocity in each direction. Defaults to (0, 0).
+            lifetime (float): Mean lifetime in seconds. Defaults to 1.
+            lifetime_spread (float): Maximum deviation of lifetime in seconds. Defaults to 0.
+
+        Returns:
+            int: Number of emitted particles, less than number if capacity was reached.
+        """
+        number = min(number, self.capacity - self.count)
+        if number <= 0:
+            return 0
+        random = self._random
+        velocities = np.asarray(velocity, dtype=np.float32) + random.uniform(-1, 1, (number, 2)) * spread
+        lifetimes = lifetime + random.uniform(-1, 1, number) * lifetime_spread
+        return self.emit_arrays(np.broadcast_to(np.asarray(position, dtype=np.float32), (number, 2)), velocities,
+                                lifetimes)
+
+    def emit_arrays(self, positions: Sequence, velocities: Sequence, lifetimes: Union[Sequence, float]) -> int:
+        """
+        Method emits particles with passed positions, velocities and lifetimes (arrays of equal length).
+
+        Args:
+            positions (Sequence): Array of shape (n, 2) of positions on display.
+            velocities (Sequence): Array of shape (n, 2) of velocities in px per second.
+            lifetimes (Union[Sequence, float]): Array of shape (n,) of lifetimes in seconds, or a single lifetime.
+
+        Returns:
+            int: Number of emitted particles, less than n if capacity was reached.
+        """
+        positions = np.asarray(positions, dtype=np.float32)
+        number = min(len(positions), self.capacity - self.count)
+        if number <= 0:
+            return 0
+        start, end = self.count, self.count + number
+        self.positions[start:end] = positions[:number]
+        self.velocities[start:end] = np.asarray(velocities, dtype=np.float32)[:number]
+        self.lifetimes[start:end] = np.broadcast_to(np.asarray(lifetimes, dtype=np.float32), (len(positions),))[
+                                    :number]
+        self.ages[start:end] = 0
+        self.count = end
+        return number
+
+    def clear(self) -> None:
+        """
+        Method removes every particle.
+        """
+        self.count = 0
+
+    def update(self) -> None:
+        """
+        Method moves every particle and removes particles that died (or left the area if culling).
+        """
+        count = self.count
+        if not count:
+            return
+        dt = self.controller.dt_s
+        positions, velocities = self.positions[:count], self.velocities[:count]
+        lifetimes, ages = self.lifetimes[:count], self.ages[:count]
+        if self.gravity.any():
+            velocities += self.gravity * dt
+        positions += velocities * dt
+        lifetimes -= dt
+        ages += dt
+        alive = lifetimes > 0
+        if self.cull:
+            rect = self.rect
+            offset_x, offset_y = self._image_offset
+            alive &= (positions[:, 0] > rect.left - offset_x) & (positions[:, 0] < rect.right + offset_x)
+            alive &= (positions[:, 1] > rect.top - offset_y) & (positions[:, 1] < rect.bottom + offset_y)
+        if not alive.all():  # Move alive particles to the start of arrays
+            kept = np.flatnonzero(alive)
+            self.count = len(kept)
+            for array in (self.positions, self.velocities, self.lifetimes, self.ages):
+                array[:self.count] = array[kept]
+        if self.count:
+            self.controller.wake()  # Keep game loop running while particles move
+
+    def convert_surfaces(self, convert: Callable[[pygame.Surface], pygame.Surface]) -> int:
+        """
+        Method replaces images, along with the array of images used for drawing, see BaseItem.convert_surfaces.
+        """
+        replaced = super().convert_surfaces(convert)
+        if replaced:
+            self._images_array[:] = self.images
+        return replaced
+
+    def draw(self) -> None:
+        """
+        Method draws every particle with a single blits call.
+        """
+        count = self.count
+        if not count or not self.visible:
+            return
+        destinations = (self.positions[:count].astype(np.int32) - self._image_offset).tolist()
+        if len(self.images) == 1:
+            surfaces = repeat(self.images[0])
+        else:
+            frames = (self.ages[:count] * self.frame_rate).astype(np.int32)
+            if self.loop:
+                frames %= len(self.images)
+            else:
+                np.minimum(frames, len(self.images) - 1, out=frames)
+            surfaces = self._images_array[frames].tolist()
+        self.display.blits(zip(surfaces, destinations), doreturn=False)
@@ -0,0 +1,93 @@
+"""
+Module containing the ItemPool class, used for re-using short-lived items instead of constructing new ones.
+"""
+
+from typing import Callable, List
+
+
+class ItemPool:
+    """
+    Pool of re-usable items. Items are constructed by the factory only if no released item is available, released
+    items are kept in a free list and get reset once acquired again. Useful for items that are shown briefly and in
+    large numbers (toasts, floating numbers, particles, temporary buttons), as constructing items (and rendering
+    text) is far more expensive than resetting them.
+
+    Example:
+        pool = ItemPool(factory=lambda: Text(value=""), reset=lambda text, value: setattr(text, "value", value))
+        text = pool.acquire("+10")
+        page.add_item(text)
+        page.call_later(500, lambda: pool.release(text))  # Removes it from page, keeps it for re-use
+    """
+    def __init__(self, factory: Callable[[], any], reset: Callable[..., None] = None, max_size: int = 64):
+        """
+        Args:
+            factory (Callable[[], any]): Function returning a new item.
+            reset (Callable[..., None]): Function accepting an item (along with arguments passed to acquire), setting
+                it up for re-use. Defaults to None.
+            max_size (int): Maximum number of released items kept, others are left for the garbage collector.
+                Defaults to 64.
+        """
+        self.factory = factory
+        self.reset = reset
+        self.max_size = max_size
+        self._free: List[any] = []
+        self._free_ids = set()  # Ids of released items, guards against releasing an item twice
+
+    def acquire(self, *args, **kwargs) -> any:
+        """
+        Method returns a released item if available, otherwise a new item from the factory. Args and kwargs are passed
+        to the reset function.
+
+        Returns:
+            any: Item ready for use.
+        """
+        if self._free:
+            item = self._free.pop()
+            self._free_ids.discard(id(item))
+        else:
+            item = self.factory()
+        if self.reset:
+            self.reset(item, *args, **kwargs)
+        return item
+
+    def release(self, item: any) -> None:
+        """
+        Method removes item from the page or item it was added to (if any) and keeps it for re-use. Items whose parent
+        can not remove them (has no remove_item method) are not kept. Item should not be used after being released.
+
+        Args:
+            item (any): Item acquired from this pool.
+        """
+        if id(item) in self._free_ids:
+            return
+        parent = getattr(item, "parent", None)
+        if parent is not None:
+            if not hasattr(parent, "remove_item"):  # Item can not be detached, re-using it would draw it twice
+                return
+            parent.remove_item(item)
+        if len(self._free) < self.max_size:
+            self._free.append(item)
+            self._free_ids.add(id(item))
+
+    def prefill(self, number: int) -> None:
+        """
+        Method constructs items in advance (up to max_size free items), so acquiring them later is cheap.
+
+        Args:
+            number (int): Number of items to construct.
+        """
+        for _ in range(min(number, self.max_size - len(self._free))):
+            item = self.factory()
+            self._free.append(item)
+            self._free_ids.add(id(item))
+
+    def clear(self) -> None:
+        """
+        Method drops every released item.
+        """
+        self._free.clear()
+        self._free_ids.clear()
+
+    def __len__(self) -> int:
+        """ Number of released items ready for re-use """
+        return len(self._free)
@@ -0,0 +1,516 @@
+"""
+Module containing scrollable containers.
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple
+import math
+
+import pygame
+
+from pyggui.gui.container import StaticContainer
+from pyggui.gui.item import visible_items
+
+
+def wheel_steps(item: any, event: pygame.event.Event) -> int:
+    """
+    Function returns mouse wheel steps of event if it is a mouse wheel event happening while item is hovered, positive
+    if rolled up. Returns 0 for any other event.
+
+    Args:
+        item (any): Item with a controller attribute.
+        event (pygame.event.Event): Event to check.
+
+    Returns:
+        int: Wheel steps.
+    """
+    if event.type != pygame.MOUSEWHEEL or not item.rect.collidepoint(item.controller.input.mouse_position):
+        return 0
+    return event.y
+
+
+class ScrollList(StaticContainer):
+    """
+    Virtualized vertical list of rows with a fixed height. Only rows inside the visible part of the list (plus a small
+    buffer of rows above and below) exist as items; rows scrolled out of view get recycled and bound to the newly
+    visible values. Updating and drawing the list therefore depends on the number of visible rows, not the size of
+    the data.
+
+    Rows are created with row_factory and filled with values from data using bind, which is called with the row item
+    and the value at the rows index in data. Data can be any sequence (list, tuple or a custom object implementing
+    __len__ and __getitem__), call refresh once it changes.
+
+    The list is scrolled with the mouse wheel while hovered, or with the scroll_by and scroll_to_index methods.
+    """
+    __slots__ = ("controller", "data", "row_height", "row_factory", "bind", "buffer", "scroll_speed", "_scroll",
+                 "_rows", "_free_rows")
+
+    def __init__(self,
+                 controller: 'Controller',
+                 data: Sequence[any],
+                 row_factory: Callable[[], any],
+                 bind: Callable[[any, any], None],
+                 row_height: int,
+                 position: List[int] = (0, 0),
+                 size: Tuple[int, int] = (100, 100),
+                 buffer: int = 2,
+                 scroll_speed: int = None,
+                 visible: bool = False,
+                 selected: bool = False
+                 ):
+        """
+        Args:
+            controller (Controller): Main controller object.
+            data (Sequence[any]): Values displayed in list, one per row.
+            row_factory (Callable[[], any]): Function returning a new row item. Row items are positioned by the list.
+            bind (Callable[[any, any], None]): Function accepting a row item and a value from data, updating the row
+                item so it displays the value.
+            row_height (int): Height of every row in px.
+            position (List[int]): Position of list on screen or on Page. Defaults to (0, 0).
+            size (Tuple[int, int]): Size of visible part of list. Defaults to (100, 100).
+            buffer (int): Number of rows kept bound above and below the visible rows. Defaults to 2.
+            scroll_speed (int): Px scrolled per mouse wheel step. Defaults to three rows.
+            visible (bool): If list boundaries rectangle should be displayed. Defaults to False.
+            selected (bool): If the list is currently selected. Defaults to False.
+        """
+        super().__init__(position, size, visible, selected)
+        self.controller = controller
+        self.data = data
+        self.row_height = max(1, int(row_height))
+        self.row_factory = row_factory
+        self.bind = bind
+        self.buffer = buffer
+        self.scroll_speed = scroll_speed if scroll_speed else self.row_height * 3
+
+        self._scroll = 0  # Px scrolled from the top of list
+        self._rows: Dict[int, any] = {}  # Index in data -> bound row item
+        self._free_rows: List[any] = []  # Row items not bound to any value, ready to be recycled
+        self._bind_rows()
+
+    @property
+    def content_height(self) -> int:
+        """
+        Height of all rows together in px.
+        """
+        return len(self.data) * self.row_height
+
+    @property
+    def max_scroll(self) -> int:
+        """
+        Maximum px the list can be scrolled by.
+        """
+        return max(0, self.content_height - self.height)
+
+    @property
+    def scroll(self) -> int:
+        """
+        Px scrolled from the top of list.
+        """
+        return self._scroll
+
+    @scroll.setter
+    def scroll(self, value: int) -> None:
+        value = min(self.max_scroll, max(0, int(value)))
+        if value != self._scroll:
+            self._scroll = value
+            self._bind_rows()
+
+    @property
+    def rows(self) -> Dict[int, any]:
+        """
+        Currently bound row items, keyed by their index in data.
+        """
+        return self._rows
+
+    def visible_range(self) -> Tuple[int, int]:
+        """
+        Method returns the range of indices in data that currently have a bound row, including the buffer.
+
+        Returns:
+            Tuple[int, int]: First index and index after the last one.
+        """
+        first = self._scroll // self.row_height - self.buffer
+        last = math.ceil((self._scroll + self.height) / self.row_height) + self.buffer
+        return max(0, first), min(len(self.data), last)
+
+    def _bind_rows(self) -> None:
+        """
+        Method recycles rows that left the visible range and binds rows to newly visible indices.
+        """
+        first, last = self.visible_range()
+        rows = self._rows
+        for index in [index for index in rows if not first <= index < last]:
+            self._free_rows.append(rows.pop(index))
+        for index in range(first, last):
+            if index not in rows:
+                row = self._free_rows.pop() if self._free_rows else self.row_factory()
+                row.parent = self
+                self.bind(row, self.data[index])
+                rows[index] = row
+        self._position_rows()
+
+    def _position_rows(self) -> None:
+        """
+        Method moves every bound row into its position based on current scroll.
+        """
+        x, y = self.x, self.y - self._scroll
+        for index, row in self._rows.items():
+            position = (x, y + index * self.row_height)
+            if row.position != list(position):
+                row.move_to(position)
+
+    def refresh(self) -> None:
+        """
+        Method re-binds every visible row, should be called once data changes.
+        """
+        self._free_rows.extend(self._rows.values())
+        self._rows.clear()
+        self._scroll = min(self.max_scroll, self._scroll)
+        self._bind_rows()
+
+    def scroll_by(self, change: int) -> None:
+        """
+        Method scrolls list by change px, positive values scroll down.
+
+        Args:
+            change (int): Px to scroll by.
+        """
+        self.scroll = self._scroll + change
+
+    def scroll_to_index(self, index: int) -> None:
+        """
+        Method scrolls list so the row at index is at the top of list (or as close as possible).
+
+        Args:
+            index (int): Index in data.
+        """
+        self.scroll = index * self.row_height
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to attached items, then to bound rows. Mouse events outside of the list are not
+        delivered to rows. Mouse wheel events not consumed by rows scroll the list while hovered, they are consumed if
+        the list scrolled (so outer lists scroll once this one reaches its end).
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        if super().handle_event(event):
+            return True
+        position = getattr(event, "pos", None)
+        if position is not None and not self.rect.collidepoint(position):
+            return False
+        for row in self._rows.values():
+            handle_event = getattr(row, "handle_event", None)
+            if handle_event and handle_event(event):
+                return True
+        steps = wheel_steps(self, event)
+        if steps:
+            scroll = self._scroll
+            self.scroll_by(-steps * self.scroll_speed)
+            return self._scroll != scroll
+        return False
+
+    def update(self) -> None:
+        """
+        Method updates bound rows and attached items.
+        """
+        self._position_rows()  # List might have been moved
+        for row in self._rows.values():
+            row.selected = self.selected
+            row.update()
+        super().update()
+
+    def draw(self) -> None:
+        """
+        Method draws visible rows clipped to the list rectangle, and every attached item.
+        """
+        previous_clip = self.display.get_clip()
+        clip = self.rect.clip(previous_clip)
+        self.display.set_clip(clip)
+        for row in visible_items(self._rows.values(), clip):
+            row.draw()
+        self.display.set_clip(previous_clip)
+        super().draw()
+
+
+class ScrollContainer(StaticContainer):
+    """
+    Vertically scrollable container. Items are added in positions relative to the top of the (scrollable) content
+    and are rendered into an offscreen surface the size of the container, which gets blitted on the display.
+
+    Content is only re-drawn where needed: on scroll the offscreen surface is shifted with Surface.scroll and only the
+    newly exposed strip is drawn, clipped with set_clip. Changes to content (ex. a text changing its value) are not
+    picked up automatically, call invalidate with the changed area (or nothing to redraw everything).
+
+    Items get their display swapped to the offscreen surface, so they should be built (with their own attached items)
+    before adding them. Only items intersecting the visible part of the container get updated.
+    """
+    __slots__ = ("controller", "scroll_speed", "smooth", "background_color", "content_height", "_scroll",
+                 "_target_scroll", "_surface", "_drawn_scroll", "_dirty_rects", "_offscreen")
+    surface_attributes = ("_surface",)
+
+    def __init__(self,
+                 controller: 'Controller',
+                 position: List[int] = (0, 0),
+                 size: Tuple[int, int] = (100, 100),
+                 scroll_speed: int = 30,
+                 smooth: bool = True,
+                 background_color: Tuple[int, int, int] = (0, 0, 0),
+                 visible: bool = False,
+                 selected: bool = False
+                 ):
+        """
+        Args:
+            controller (Controller): Main controller object.
+            position (List[int]): Position of container on screen or on Page. Defaults to (0, 0).
+            size (Tuple[int, int]): Size of visible part of container. Defaults to (100, 100).
+            scroll_speed (int): Px scrolled per mouse wheel step. Defaults to 30.
+            smooth (bool): If scrolling should ease towards the scrolled position over a few frames instead of jumping
+                to it. Defaults to True.
+            background_color (Tuple[int, int, int]): Color content is drawn on, None for a transparent background.
+                Defaults to black.
+            visible (bool): If container boundaries rectangle should be displayed. Defaults to False.
+            selected (bool): If the container is currently selected. Defaults to False.
+        """
+        super().__init__(position, size, visible, selected)
+        self.controller = controller
+        self.scroll_speed = scroll_speed
+        self.smooth = smooth
+        self.background_color = background_color
+        self.content_height = self.height  # Height of content, grows as items get added
+
+        self._scroll = 0  # Px scrolled from the top of content
+        self._target_scroll = 0  # Scroll position smooth scrolling is easing towards
+        self._surface = self._make_surface()
+        self._drawn_scroll = None  # Scroll the offscreen surface was drawn at, None if it has to be fully re-drawn
+        self._dirty_rects: List[pygame.Rect] = []  # Areas of offscreen surface to re-draw
+        self._offscreen = False  # If items are positioned on the offscreen surface instead of the display
+
+    def _make_surface(self) -> pygame.Surface:
+        """
+        Method creates the offscreen surface content is drawn on.
+        """
+        if self.background_color is None:
+            return pygame.Surface(self.size, pygame.SRCALPHA)
+        surface = pygame.Surface(self.size)
+        return surface.convert() if pygame.display.get_surface() else surface
+
+    @property
+    def max_scroll(self) -> int:
+        """
+        Maximum px the content can be scrolled by.
+        """
+        return max(0, self.content_height - self.height)
+
+    @property
+    def scroll(self) -> int:
+        """
+        Px scrolled from the top of content.
+        """
+        return self._scroll
+
+    @scroll.setter
+    def scroll(self, value: int) -> None:
+        self._scroll = self._target_scroll = min(self.max_scroll, max(0, int(value)))
+        self.update_items_positions()
+
+    def scroll_by(self, change: int) -> None:
+        """
+        Method scrolls content by change px, positive values scroll down. Eases towards the new position if smooth.
+
+        Args:
+            change (int): Px to scroll by.
+        """
+        target = min(self.max_scroll, max(0, int(self._target_scroll + change)))
+        if self.smooth:
+            self._target_scroll = target
+        else:
+            self.scroll = target
+
+    def add_item(self, item: any, relative_position: Tuple[int, int]) -> int:
+        """
+        Method adds item in a position relative to the top left corner of content.
+
+        Args:
+            item (any): Item to add.
+            relative_position (Tuple[int, int]): Position of item relative to the top left corner of content.
+
+        Returns:
+            int: Position (index) in items list of added item.
+        """
+        index = super().add_item(item, relative_position)
+        item.set_display(self._surface)
+        bottom = relative_position[1] + item.relative_bounds.bottom
+        self.content_height = max(self.content_height, bottom)
+        self.invalidate()
+        return index
+
+    def convert_surfaces(self, convert: Callable[[pygame.Surface], pygame.Surface]) -> int:
+        """
+        Method replaces the offscreen surface, items get drawn on the replacement, see BaseItem.convert_surfaces.
+        """
+        replaced = super().convert_surfaces(convert)
+        if replaced:
+            for item in self.items:
+                item.set_display(self._surface)
+            self.invalidate()
+        return replaced
+
+    def remove_item(self, item: any) -> int:
+        """
+        Method removes item from content and re-draws everything, see BaseItem.remove_item. Content height shrinks
+        to the remaining items (never below the containers height), scroll is clamped to it.
+        """
+        index = super().remove_item(item)
+        if hasattr(item, "set_display"):  # Item is no longer drawn on the offscreen surface
+            item.set_display(self.display)
+        else:
+            item.display = self.display
+        self.content_height = max([self.height] + [
+            y + attached.relative_bounds.bottom for attached, (_, y) in zip(self.items, self.items_positions)
+        ])
+        if max(self._scroll, self._target_scroll) > self.max_scroll:
+            self.scroll = min(self._scroll, self.max_scroll)
+        self.invalidate()
+        return index
+
+    def invalidate(self, area: pygame.Rect = None) -> None:
+        """
+        Method marks area of content to be re-drawn on next draw.
+
+        Args:
+            area (pygame.Rect): Area relative to the top left corner of content. Defaults to None, re-drawing
+                everything.
+        """
+        if area is None:
+            self._drawn_scroll = None
+            self._dirty_rects.clear()
+        elif self._drawn_scroll is not None:
+            self._dirty_rects.append(pygame.Rect(area).move(0, -self._drawn_scroll))
+
+    def _compute_bounds(self) -> pygame.Rect:
+        """
+        Content is clipped to the container, so bounds are the containers rectangle.
+        """
+        return pygame.Rect(0, 0, self.rect.width, self.rect.height)
+
+    def _resolve_offset(self, offset: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the position of an item with offset relative to the top left corner of content, either on the
+        display or on the offscreen surface (while drawing content).
+        """
+        if self._offscreen:
+            return offset[0], offset[1] - self._scroll
+        rect = self.rect
+        return rect.x + offset[0], rect.y + offset[1] - self._scroll
+
+    def _local_offset(self, position: List[int]) -> Tuple[int, int]:
+        """
+        Method returns the offset relative to the top left corner of content of an item placed in position.
+        """
+        if self._offscreen:
+            return position[0], position[1] + self._scroll
+        rect = self.rect
+        return position[0] - rect.x, position[1] - rect.y + self._scroll
+
+    def _visible(self, area: pygame.Rect, scroll: int) -> List[any]:
+        """
+        Method returns items intersecting area (relative to the top left corner of the container) at scroll.
+        """
+        visible = []
+        for item, (item_x, item_y) in zip(self.items, self.items_positions):
+            if area.colliderect(item.relative_bounds.move(item_x, item_y - scroll)):
+                visible.append(item)
+        return visible
+
+    def _redraw(self, area: pygame.Rect) -> None:
+        """
+        Method draws items intersecting area onto the offscreen surface.
+
+        Args:
+            area (pygame.Rect): Area of offscreen surface to draw.
+        """
+        surface = self._surface
+        area = area.clip(surface.get_rect())
+        if not area:
+            return
+        surface.set_clip(area)
+        surface.fill(self.background_color if self.background_color is not None else (0, 0, 0, 0), area)
+        items = self._visible(area, self._scroll)
+        if items:
+            self._offscreen = True  # Move items into offscreen surface coordinates
+            self.update_items_positions()
+            for item in items:
+                item.draw()
+            self._offscreen = False
+            self.update_items_positions()
+        surface.set_clip(None)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Method delivers event to items, mouse events only if they happened inside of container (content outside of it
+        is not shown). Mouse wheel events not consumed by items scroll the container while hovered, they are consumed
+        if the container scrolled.
+
+        Args:
+            event (pygame.event.Event): Event to deliver.
+
+        Returns:
+            bool: If event was consumed.
+        """
+        position = getattr(event, "pos", None)
+        if position is not None and not self.rect.collidepoint(position):
+            return False
+        if super().handle_event(event):
+            return True
+        steps = wheel_steps(self, event)
+        if steps:
+            target = self._target_scroll
+            self.scroll_by(-steps * self.scroll_speed)
+            return self._target_scroll != target
+        return False
+
+    def update(self) -> None:
+        """
+        Method eases smooth scrolling and updates items in the visible part of container.
+        """
+        if self._target_scroll != self._scroll:  # Ease towards target, at least a px per frame
+            step = (self._target_scroll - self._scroll) * 0.3
+            step = int(step) or (1 if step > 0 else -1)
+            self._scroll += step
+            self.update_items_positions()
+        for item in self._visible(pygame.Rect((0, 0), self.size), self._scroll):
+            item.selected = self.selected
+            item.update()
+
+    def draw(self) -> None:
+        """
+        Method re-draws exposed and invalidated parts of content, then blits content onto the display.
+        """
+        if self._surface.get_size() != tuple(self.size):  # Container was re-sized
+            self._surface = self._make_surface()
+            for item in self.items:
+                item.set_display(self._surface)
+            self._drawn_scroll = None
+        if self._drawn_scroll is None or abs(self._scroll - self._drawn_scroll) >= self.height:
+            self._dirty_rects.clear()
+            self._redraw(self._surface.get_rect())
+        elif self._scroll != self._drawn_scroll:
+            change = self._scroll - self._drawn_scroll
+            self._surface.scroll(0, -change)  # Shift drawn content, then draw only the exposed strip
+            if change > 0:
+                self._redraw(pygame.Rect(0, self.height - change, self.width, change))
+            else:
+                self._redraw(pygame.Rect(0, 0, self.width, -change))
+            for rect in self._dirty_rects:  # Dirty areas were marked at the previous scroll
+                rect.move_ip(0, -change)
+        self._drawn_scroll = self._scroll
+        for rect in self._dirty_rects:
+            self._redraw(rect)
+        self._dirty_rects.clear()
+        self.display.blit(self._surface, self.position)
+        if self.visible:
+            pygame.draw.rect(self.display, (255, 255, 255), self.rect, width=1)
@@ -9,6 +9,7 @@ import pygame
 
 from pyggui.gui.item import StaticItem
 from pyggui.helpers.helpers import create_object_repr
+from pyggui.helpers.surfaces import to_display_format
 
 
 class Text(StaticItem):
@@ -19,8 +20,11 @@ class Text(StaticItem):
 
     Note: If you change the value of the text the render method should be called to re-render the changed text.
     """
+    __slots__ = ("color", "_value", "font_size", "font", "surface")
+    surface_attributes = ("surface",)
+
     def __init__(self,
-                 position: List[int] = [0, 0],
+                 position: List[int] = (0, 0),
                  value: str = "Text",
                  font: str = None,
                  font_size: int = 21,
@@ -49,7 +53,7 @@ class Text(StaticItem):
             self.font = pygame.font.SysFont(font, font_size)
         # Get size of of rendered font, create surface
         size = self.font.size(value)
-        self.surface = self.font.render(value, True, self.color)
+        self.surface = to_display_format(self.font.render(value, True, self.color))
         # Call to super method with new fetched size of surface
         super().__init__(position, size)
 
@@ -64,9 +68,10 @@ class Text(StaticItem):
 
     def render(self) -> None:
         """  TODO: Add value property and setter to auto-update text
-        Method re-renders the text surface, method should be called once the text value has changed.
+        Method re-renders the text surface, method should be called once the text value has changed. Surface is
+        converted to the displays pixel format.
         """
-        self.surface = self.font.render(self._value, True, self.color)
+        self.surface = to_display_format(self.font.render(self._value, True, self.color))
         self.size = self.font.size(self._value)
 
     def update(self) -> None:
@@ -0,0 +1,339 @@
+"""
+Module containing the tweening engine and easing functions, used for animating item properties (positions, sizes,
+progress, colors, ...) over time.
+Easing functions accept either a float or a NumPy array of floats in range [0, 1].
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, tweens are then advanced one by one
+    np = None
+
+
+def _where(condition: any, if_true: any, if_false: any) -> any:
+    """
+    Function selects between two values (or arrays of values) based on condition, so easing functions work on both.
+    """
+    if np is not None and isinstance(condition, np.ndarray):
+        return np.where(condition, if_true, if_false)
+    return if_true if condition else if_false
+
+
+def linear(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return t
+
+
+def ease_in_quad(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return t * t
+
+
+def ease_out_quad(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return 1 - (1 - t) * (1 - t)
+
+
+def ease_in_out_quad(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return _where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+
+
+def ease_in_cubic(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return t * t * t
+
+
+def ease_out_cubic(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return _where(t < 0.5, 4 * t * t * t, 1 - (-2 * t + 2) ** 3 / 2)
+
+
+def ease_out_back(t: Union[float, 'np.ndarray']) -> Union[float, 'np.ndarray']:
+    return 1 + 2.70158 * (t - 1) ** 3 + 1.70158 * (t - 1) ** 2
+
+
+# Easing functions by name, tweens accept either a name or a function
+EASINGS: Dict[str, Callable] = {
+    "linear": linear,
+    "ease_in_quad": ease_in_quad,
+    "ease_out_quad": ease_out_quad,
+    "ease_in_out_quad": ease_in_out_quad,
+    "ease_in_cubic": ease_in_cubic,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_cubic": ease_in_out_cubic,
+    "ease_out_back": ease_out_back,
+}
+
+
+class Tween:
+    """
+    Class representing a single tween; values going from start to end over duration milliseconds. Every time the
+    tween advances, apply gets called with the current values. Created through TweenEngine methods.
+    """
+    def __init__(
+        self,
+        start: Sequence[float],
+        end: Sequence[float],
+        duration: int,
+        apply: Callable[[List[float]], None],
+        easing: Union[str, Callable] = "linear",
+        on_complete: Callable = None
+    ):
+        """
+        Args:
+            start (Sequence[float]): Starting values.
+            end (Sequence[float]): Ending values, same length as start.
+            duration (int): Duration in milliseconds.
+            apply (Callable[[List[float]], None]): Function accepting list of current values, applying them.
+            easing (Union[str, Callable]): Name of easing function (see EASINGS) or an easing function.
+                Defaults to linear.
+            on_complete (Callable): Callable function called once the tween finishes. Defaults to None.
+        """
+        self.start = [float(value) for value in start]
+        self.end = [float(value) for value in end]
+        self.duration = max(1, duration)
+        self.apply = apply
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_complete = on_complete
+        self.elapsed = 0
+        self.cancelled = False
+
+    @property
+    def finished(self) -> bool:
+        return self.elapsed >= self.duration
+
+    def cancel(self) -> None:
+        """
+        Method stops the tween where it is, on_complete does not get called.
+        """
+        self.cancelled = True
+
+
+class TweenEngine:
+    """
+    Class advancing every active tween once per frame (the controller owns one and advances it before pages update).
+    Once many tweens are active and NumPy is installed, elapsed times, easing and interpolation are computed for all
+    tweens at once on arrays, only applying the values is done per tween.
+    """
+    vectorise_from: int = 32  # Number of active tweens from which tweens are advanced on arrays
+
+    def __init__(self):
+        self._tweens: List[Tween] = []
+        self._arrays = None  # Arrays of active tweens, re-built once tweens get added or removed
+
+    def add(self, tween: Tween) -> Tween:
+        """
+        Method starts advancing tween.
+
+        Args:
+            tween (Tween): Tween to add.
+
+        Returns:
+            Tween: Added tween.
+        """
+        self._tweens.append(tween)
+        self._arrays = None
+        return tween
+
+    def tween(
+        self,
+        start: Sequence[float],
+        end: Sequence[float],
+        duration: int,
+        apply: Callable[[List[float]], None],
+        easing: Union[str, Callable] = "linear",
+        on_complete: Callable = None
+    ) -> Tween:
+        """
+        Method starts a tween of arbitrary values, see Tween.
+        """
+        return self.add(Tween(start, end, duration, apply, easing, on_complete))
+
+    def move(self, item: any, to: Tuple[int, int], duration: int, easing: Union[str, Callable] = "ease_out_quad",
+             on_complete: Callable = None) -> Tween:
+        """
+        Method moves item (along with attached items) to position over duration milliseconds.
+
+        Args:
+            item (any): Item to move.
+            to (Tuple[int, int]): Position to move to.
+            duration (int): Duration in milliseconds.
+            easing (Union[str, Callable]): Easing function or its name. Defaults to ease_out_quad.
+            on_complete (Callable): Callable function called once finished. Defaults to None.
+
+        Returns:
+            Tween: Started tween, can be used for cancelling it.
+        """
+        return self.tween(item.position, to, duration, lambda values: item.move_to((round(values[0]),
+                                                                                      round(values[1]))),
+                          easing, on_complete)
+
+    def resize(self, item: 'ResizableItem', to: float, duration: int, easing: Union[str, Callable] = "ease_out_quad",
+               on_complete: Callable = None) -> Tween:
+        """
+        Method re-sizes a re-sizable item to factor over duration milliseconds.
+
+        Args:
+            item (ResizableItem): Item to re-size.
+            to (float): Re-size factor to end at.
+            duration (int): Duration in milliseconds.
+            easing (Union[str, Callable]): Easing function or its name. Defaults to ease_out_quad.
+            on_complete (Callable): Callable function called once finished. Defaults to None.
+
+        Returns:
+            Tween: Started tween, can be used for cancelling it.
+        """
+        return self.tween((item.resized_factor,), (to,), duration, lambda values: item.resize(values[0]), easing,
+                          on_complete)
+
+    def progress(self, bar: 'DefaultProgressBar', to: float, duration: int, easing: Union[str, Callable] = "linear",
+                 on_complete: Callable = None) -> Tween:
+        """
+        Method fills a progress bar to progress over duration milliseconds.
+
+        Args:
+            bar (DefaultProgressBar): Progress bar.
+            to (float): Progress to end at, in range [0, 1].
+            duration (int): Duration in milliseconds.
+            easing (Union[str, Callable]): Easing function or its name. Defaults to linear.
+            on_complete (Callable): Callable function called once finished. Defaults to None.
+
+        Returns:
+            Tween: Started tween, can be used for cancelling it.
+        """
+        return self.tween((bar.progress,), (to,), duration, lambda values: bar.update_progress(values[0]), easing,
+                          on_complete)
+
+    def attribute(self, obj: any, name: str, to: Union[float, Sequence[float]], duration: int,
+                  easing: Union[str, Callable] = "linear", on_complete: Callable = None) -> Tween:
+        """
+        Method changes a numeric attribute (or a tuple of numbers, ex. a color) of obj over duration milliseconds.
+        Tuples of integers (colors) stay tuples of integers.
+
+        Args:
+            obj (any): Object holding attribute.
+            name (str): Name of attribute.
+            to (Union[float, Sequence[float]]): Value to end at.
+            duration (int): Duration in milliseconds.
+            easing (Union[str, Callable]): Easing function or its name. Defaults to linear.
+            on_complete (Callable): Callable function called once finished. Defaults to None.
+
+        Returns:
+            Tween: Started tween, can be used for cancelling it.
+        """
+        start = getattr(obj, name)
+        if isinstance(start, (int, float)):
+            apply = lambda values: setattr(obj, name, values[0])  # noqa: E731
+            return self.tween((start,), (to,), duration, apply, easing, on_complete)
+        integers = all(isinstance(value, int) for value in start)
+        if integers:
+            apply = lambda values: setattr(obj, name, tuple(round(value) for value in values))  # noqa: E731
+        else:
+            apply = lambda values: setattr(obj, name, tuple(values))  # noqa: E731
+        return self.tween(start, to, duration, apply, easing, on_complete)
+
+    def color(self, obj: any, to: Tuple[int, ...], duration: int, name: str = "color",
+              easing: Union[str, Callable] = "linear", on_complete: Callable = None) -> Tween:
+        """
+        Method changes the color attribute of obj over duration milliseconds, see attribute. Items that pre-render
+        surfaces need re-rendering once their color changes (ex. call Text.render in on_complete or a custom apply).
+        """
+        return self.attribute(obj, name, to, duration, easing, on_complete)
+
+    def clear(self) -> None:
+        """
+        Method cancels every tween.
+        """
+        for tween in self._tweens:
+            tween.cancel()
+        self._tweens.clear()
+        self._arrays = None
+
+    def update(self, dt: float) -> None:
+        """
+        Method advances every active tween by dt milliseconds, applies current values and calls completion callbacks
+        of finished tweens.
+
+        Args:
+            dt (float): Milliseconds passed since the last update.
+        """
+        if not self._tweens:
+            return
+        if any(tween.cancelled for tween in self._tweens):
+            self._tweens = [tween for tween in self._tweens if not tween.cancelled]
+            self._arrays = None
+        if np is not None and len(self._tweens) >= self.vectorise_from:
+            finished = self._update_arrays(dt)
+        else:
+            finished = self._update_each(dt)
+        if finished:
+            self._tweens = [tween for tween in self._tweens if not tween.finished and not tween.cancelled]
+            self._arrays = None
+            for tween in finished:
+                if tween.on_complete:
+                    tween.on_complete()
+
+    def _update_each(self, dt: float) -> List[Tween]:
+        """
+        Method advances tweens one by one, returns finished ones.
+        """
+        finished = []
+        for tween in self._tweens:
+            tween.elapsed += dt
+            t = min(1.0, tween.elapsed / tween.duration)
+            eased = tween.easing(t)
+            tween.apply([start + (end - start) * eased for start, end in zip(tween.start, tween.end)])
+            if t >= 1:
+                finished.append(tween)
+        return finished
+
+    def _build_arrays(self) -> Dict[str, any]:
+        """
+        Method builds arrays of start values, value changes, elapsed times and durations of active tweens. Tweens with
+        fewer values are padded with zeros.
+        """
+        tweens = self._tweens
+        width = max(len(tween.start) for tween in tweens)
+        start = np.zeros((len(tweens), width))
+        change = np.zeros((len(tweens), width))
+        for i, tween in enumerate(tweens):
+            start[i, :len(tween.start)] = tween.start
+            change[i, :len(tween.end)] = np.subtract(tween.end, tween.start)
+        easings = {}  # Easing function -> indices of tweens using it
+        for i, tween in enumerate(tweens):
+            easings.setdefault(tween.easing, []).append(i)
+        return {
+            "start": start,
+            "change": change,
+            "elapsed": np.array([tween.elapsed for tween in tweens], dtype=float),
+            "duration": np.array([tween.duration for tween in tweens], dtype=float),
+            "easings": [(easing, np.array(indices)) for easing, indices in easings.items()],
+            "sizes": [len(tween.start) for tween in tweens],
+        }
+
+    def _update_arrays(self, dt: float) -> List[Tween]:
+        """
+        Method advances tweens on arrays, returns finished ones.
+        """
+        if self._arrays is None:
+            self._arrays = self._build_arrays()
+        arrays = self._arrays
+        arrays["elapsed"] += dt
+        t = np.minimum(1.0, arrays["elapsed"] / arrays["duration"])
+        eased = np.empty_like(t)
+        for easing, indices in arrays["easings"]:
+            eased[indices] = easing(t[indices])
+        values = (arrays["start"] + arrays["change"] * eased[:, None]).tolist()
+        finished = []
+        elapsed = arrays["elapsed"].tolist()
+        for tween, tween_values, size, tween_elapsed in zip(self._tweens, values, arrays["sizes"], elapsed):
+            tween.elapsed = tween_elapsed
+            tween.apply(tween_values[:size] if size != len(tween_values) else tween_values)
+            if tween_elapsed >= tween.duration:
+                finished.append(tween)
+        return finished
+
+    def __len__(self) -> int:
+        """ Number of active tweens """
+        return len(self._tweens)
@@ -2,6 +2,8 @@
 Import only public classes and functions.
 """
 
+from pyggui.helpers.cache import LRUCache
 from pyggui.helpers.file_handling import *
 from pyggui.helpers.helpers import check_callable_arguments, create_callable
 from pyggui.helpers.stack import Stack
+from pyggui.helpers.surfaces import draw_rect, nine_slice, rect_surface, scale, three_slice
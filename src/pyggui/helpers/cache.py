@@ -0,0 +1,129 @@
+"""
+Module containing cache implementations used for keeping objects alive between uses (pages, surfaces, ...).
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterator
+
+
+class LRUCache:
+    """
+    Least recently used cache. Cache is bounded by the number of stored values and optionally by the total size of
+    stored values, where the size of each value is computed by the passed size_function. Once either bound is exceeded
+    the least recently used values get evicted, optionally calling on_evict for each of them.
+    """
+    def __init__(self, max_items: int = 8, max_size: int = None, size_function: Callable = None,
+                 on_evict: Callable = None):
+        """
+        Args:
+            max_items (int): Maximum number of values stored in cache. None for no limit. Defaults to 8.
+            max_size (int): Maximum total size of stored values (unit is defined by size_function). None for no
+                limit. Defaults to None.
+            size_function (Callable): Function accepting a stored value, returning its (estimated) size. Only used if
+                max_size is set. Defaults to None.
+            on_evict (Callable): Function accepting key and value of an evicted value, called once it gets evicted
+                (not when popped or cleared). Defaults to None.
+        """
+        self.max_items = max_items
+        self.max_size = max_size
+        self.size_function = size_function
+        self.on_evict = on_evict
+
+        self._data: OrderedDict = OrderedDict()  # key -> value, most recently used at the end
+        self._sizes = {}  # key -> size of value
+        self._total_size = 0
+
+    @property
+    def total_size(self) -> int:
+        """
+        Total size of all values stored in cache, as estimated by the size_function.
+        """
+        return self._total_size
+
+    def get(self, key: Hashable, default: any = None) -> any:
+        """
+        Method returns value stored under key and marks it as most recently used.
+
+        Args:
+            key (Hashable): Key of value.
+            default (any): Value returned if key is not in cache. Defaults to None.
+
+        Returns:
+            any: Stored value or default.
+        """
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: Hashable, value: any) -> None:
+        """
+        Method stores value under key as most recently used, evicting least recently used values if the cache
+        exceeds its bounds.
+
+        Args:
+            key (Hashable): Key to store value under.
+            value (any): Value to store.
+        """
+        if key in self._data:
+            self.pop(key)
+        self._data[key] = value
+        if self.max_size is not None and self.size_function:
+            size = self.size_function(value)
+            self._sizes[key] = size
+            self._total_size += size
+        self._evict()
+
+    def pop(self, key: Hashable, default: any = None) -> any:
+        """
+        Method removes value stored under key from cache and returns it.
+
+        Args:
+            key (Hashable): Key of value.
+            default (any): Value returned if key is not in cache. Defaults to None.
+
+        Returns:
+            any: Removed value or default.
+        """
+        if key not in self._data:
+            return default
+        self._total_size -= self._sizes.pop(key, 0)
+        return self._data.pop(key)
+
+    def values(self) -> Iterator:
+        """
+        Method returns an iterator over stored values, from least to most recently used, without marking them used.
+        """
+        return iter(list(self._data.values()))
+
+    def clear(self) -> None:
+        """
+        Method removes every value from cache.
+        """
+        self._data.clear()
+        self._sizes.clear()
+        self._total_size = 0
+
+    def _evict(self) -> None:
+        """
+        Method removes least recently used values until the cache is within its bounds. The most recently used value
+        is always kept.
+        """
+        while len(self._data) > 1:
+            too_many = self.max_items is not None and len(self._data) > self.max_items
+            too_big = self.max_size is not None and self._total_size > self.max_size
+            if not (too_many or too_big):
+                break
+            key = next(iter(self._data))  # Least recently used is at the beginning
+            value = self.pop(key)
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
@@ -10,8 +10,71 @@ import json
 
 import pygame
 
+from pyggui.helpers.cache import LRUCache
+from pyggui.helpers.surfaces import surface_bytes
+
 
 class ImageLoader:
+    """
+    Class consisting of static methods for loading images. Images can be decoded in advance (ex. on worker threads)
+    using the decode and stage methods, a staged image is then used by the next load of the same path instead of
+    decoding the file again.
+    Images used by many items (ex. skins of bars) can be loaded through load_cached_image, which keeps loaded images
+    in the shared cache attribute.
+    """
+    _staged: Dict[str, pygame.surface.Surface] = {}  # Absolute path -> decoded, not yet converted surface
+    # (Absolute path, transparent) -> loaded surface, bounded to 64MB of pixels
+    cache: LRUCache = LRUCache(
+        max_items=None,
+        max_size=64 * 1024 * 1024,
+        size_function=surface_bytes
+    )
+
+    @staticmethod
+    def decode(image_path: str) -> pygame.surface.Surface:
+        """
+        Method decodes image file without converting it to the displays pixel format, so it is safe to call from
+        threads other than the main one.
+
+        Args:
+            image_path (str): Path to image to decode
+
+        Returns:
+            pygame.surface.Surface: Decoded image as a Pygame surface
+        """
+        return pygame.image.load(image_path)
+
+    @staticmethod
+    def stage(image_path: str, surface: pygame.surface.Surface) -> None:
+        """
+        Method stages a decoded surface, the next load of image_path will use it instead of decoding the file.
+
+        Args:
+            image_path (str): Path of decoded image
+            surface (pygame.surface.Surface): Surface returned by the decode method
+        """
+        ImageLoader._staged[os.path.abspath(image_path)] = surface
+
+    @staticmethod
+    def unstage(image_path: str) -> None:
+        """
+        Method removes staged surface of image path if it was not used by a load.
+
+        Args:
+            image_path (str): Path of decoded image
+        """
+        ImageLoader._staged.pop(os.path.abspath(image_path), None)
+
+    @staticmethod
+    def _load(image_path: str) -> pygame.surface.Surface:
+        """
+        Method returns staged surface of image path if it exists, otherwise decodes the image file.
+        """
+        staged = ImageLoader._staged.pop(os.path.abspath(image_path), None)
+        if staged is not None:
+            return staged
+        return pygame.image.load(image_path)
+
     @staticmethod
     def load_image(image_path: str) -> pygame.surface.Surface:
         """
@@ -23,7 +86,7 @@ class ImageLoader:
         Returns:
             pygame.surface.Surface: Image loaded as a Pygame surface
         """
-        return pygame.image.load(image_path).convert()  # .convert() optimizes speed by 5x
+        return ImageLoader._load(image_path).convert()  # .convert() optimizes speed by 5x
 
     @staticmethod
     def load_transparent_image(image_path: str) -> pygame.surface.Surface:
@@ -36,7 +99,30 @@ class ImageLoader:
         Returns:
             pygame.surface.Surface: Image loaded as a Pygame surface
         """
-        return pygame.image.load(image_path).convert_alpha()  # .convert() optimizes speed by 5x
+        return ImageLoader._load(image_path).convert_alpha()  # .convert() optimizes speed by 5x
+
+    @staticmethod
+    def load_cached_image(image_path: str, transparent: bool = False) -> pygame.surface.Surface:
+        """
+        Method loads given path into image once, following loads of the same path return the same surface (which
+        should therefore not be drawn on).
+
+        Args:
+            image_path (str): Path to image to load
+            transparent (bool): If image should be loaded as transparent. Defaults to False.
+
+        Returns:
+            pygame.surface.Surface: Image loaded as a Pygame surface
+        """
+        key = (os.path.abspath(image_path), transparent)
+        image = ImageLoader.cache.get(key)
+        if image is None:
+            if transparent:
+                image = ImageLoader.load_transparent_image(image_path)
+            else:
+                image = ImageLoader.load_image(image_path)
+            ImageLoader.cache.put(key, image)
+        return image
 
     @staticmethod
     def load_folder(folder_path: str) -> List[pygame.surface.Surface]:
@@ -0,0 +1,164 @@
+"""
+Module containing the FrameStatistics class, used for collecting frame times of the main game loop.
+"""
+
+from typing import Dict, List
+import math
+
+# Phases of a single frame, in the order they are executed in the main loop
+PHASES = ("input", "update", "draw", "present")
+
+
+def nearest_rank(ordered: List[float], percent: float) -> float:
+    """
+    Function returns the nearest-rank percentile of sorted values, 0 if there are no values.
+
+    Args:
+        ordered (List[float]): Sorted values.
+        percent (float): Percentile in range [0, 100].
+
+    Returns:
+        float: Value at percentile.
+    """
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered), max(1, math.ceil(percent / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+class FrameStatistics:
+    """
+    Class keeps a ring buffer of the most recent frame times (in milliseconds), along with the time spent in each
+    phase of the frame (input, update, draw, present). Statistics are computed over that sliding window only when
+    requested, recording a frame only stores a few numbers so statistics can be kept on at all times.
+
+    Frames taking longer than budget (in milliseconds) are counted as janky frames.
+    """
+    def __init__(self, window_size: int = 300, budget: float = 1000 / 60):
+        """
+        Args:
+            window_size (int): Number of most recent frames statistics are computed over. Defaults to 300.
+            budget (float): Time budget of a single frame in milliseconds. Defaults to 1000 / 60.
+        """
+        self.window_size = window_size
+        self.budget = budget
+
+        self._times: Dict[str, List[float]] = {"frame": [0.0] * window_size}
+        for phase in PHASES:
+            self._times[phase] = [0.0] * window_size
+        self._index = 0  # Index in buffers where next frame gets recorded
+        self._count = 0  # Number of recorded frames in buffers
+        self.total_frames = 0  # Number of all recorded frames
+
+    def record(self, frame: float, input_time: float, update: float, draw: float, present: float) -> None:
+        """
+        Method records times of a single frame, overwriting the oldest frame once the window is full.
+
+        Args:
+            frame (float): Total time of frame in milliseconds, excluding time spent waiting for the frame rate cap (so
+                capped frames within budget are not counted as janky).
+            input_time (float): Time spent processing input in milliseconds.
+            update (float): Time spent updating pages in milliseconds.
+            draw (float): Time spent drawing pages in milliseconds.
+            present (float): Time spent updating the display in milliseconds.
+        """
+        i = self._index
+        times = self._times
+        times["frame"][i] = frame
+        times["input"][i] = input_time
+        times["update"][i] = update
+        times["draw"][i] = draw
+        times["present"][i] = present
+        self._index = (i + 1) % self.window_size
+        if self._count < self.window_size:
+            self._count += 1
+        self.total_frames += 1
+
+    def reset(self) -> None:
+        """
+        Method clears all recorded frames.
+        """
+        self._index = 0
+        self._count = 0
+        self.total_frames = 0
+
+    def samples(self, phase: str = "frame") -> List[float]:
+        """
+        Method returns recorded times of phase in the current window, oldest first.
+
+        Args:
+            phase (str): Either frame or one of the phases: input, update, draw, present. Defaults to frame.
+
+        Returns:
+            List[float]: Times in milliseconds.
+        """
+        buffer = self._times[phase]
+        if self._count < self.window_size:
+            return buffer[:self._count]
+        return buffer[self._index:] + buffer[:self._index]
+
+    def mean(self, phase: str = "frame") -> float:
+        """
+        Method returns the mean time of phase over the current window, 0 if no frame was recorded.
+        """
+        if not self._count:
+            return 0.0
+        return sum(self.samples(phase)) / self._count
+
+    def percentile(self, percent: float, phase: str = "frame") -> float:
+        """
+        Method returns the percentile of phase times over the current window, 0 if no frame was recorded.
+
+        Args:
+            percent (float): Percentile in range [0, 100].
+            phase (str): Either frame or one of the phases: input, update, draw, present. Defaults to frame.
+
+        Returns:
+            float: Time in milliseconds.
+        """
+        return nearest_rank(sorted(self.samples(phase)), percent)
+
+    def max(self, phase: str = "frame") -> float:
+        """
+        Method returns the longest time of phase over the current window, 0 if no frame was recorded.
+        """
+        return max(self.samples(phase), default=0.0)
+
+    @property
+    def jank_count(self) -> int:
+        """
+        Number of frames in the current window that took longer than the budget.
+        """
+        return sum(1 for time in self.samples("frame") if time > self.budget)
+
+    @property
+    def fps(self) -> float:
+        """
+        Mean frame rate over the current window, 0 if no frame was recorded.
+        """
+        mean = self.mean()
+        return 1000 / mean if mean else 0.0
+
+    def summary(self) -> Dict[str, any]:
+        """
+        Method returns statistics over the current window, useful for logging.
+
+        Returns:
+            Dict[str, any]: Dictionary with keys frame and each phase holding mean, p50, p95, p99 and max times
+                (in milliseconds), along with the number of frames, janky frames and the frame budget.
+        """
+        summary = {
+            "frames": self._count,
+            "jank": self.jank_count,
+            "budget": self.budget
+        }
+        for phase in ("frame",) + PHASES:
+            ordered = sorted(self.samples(phase))
+            summary[phase] = {
+                "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+                "p50": nearest_rank(ordered, 50),
+                "p95": nearest_rank(ordered, 95),
+                "p99": nearest_rank(ordered, 99),
+                "max": ordered[-1] if ordered else 0.0
+            }
+        return summary
@@ -57,6 +57,16 @@ def create_object_repr(instance: any) -> str:
     """
     # Get class name
     class_name = instance.__class__.__name__
-    # Get attributes and its values, format into string "attr=value, attr=value, ... "
-    attr_str = ", ".join([f"{attribute}={value}" for attribute, value in instance.__dict__.items()])
+    # Get attributes and its values, attributes are either defined in __slots__ of classes or stored in __dict__
+    attributes = {}
+    for cls in reversed(type(instance).__mro__):
+        slots = getattr(cls, "__slots__", ())
+        for attribute in ([slots] if isinstance(slots, str) else slots):
+            if attribute not in ("__dict__", "__weakref__") and hasattr(instance, attribute):
+                attributes[attribute] = getattr(instance, attribute)
+    attributes.update(getattr(instance, "__dict__", {}))
+    if attributes.get("parent") is not None:  # Parent holds the instance, only name it to avoid infinite recursion
+        attributes["parent"] = f"<{attributes['parent'].__class__.__name__}>"
+    # Format into string "attr=value, attr=value, ... "
+    attr_str = ", ".join([f"{attribute}={value}" for attribute, value in attributes.items()])
     return f"{class_name}({attr_str})"
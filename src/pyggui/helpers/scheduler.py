@@ -0,0 +1,173 @@
+"""
+Module containing the Scheduler class, used for running callbacks at set intervals or after a set delay.
+"""
+
+from typing import Callable, List, Tuple
+import heapq
+import itertools
+import time
+
+
+def spread_phase(index: int, interval: int) -> int:
+    """
+    Function returns the phase (offset in milliseconds) of the index-th task repeating at interval, so that tasks
+    sharing an interval get spread evenly across it: 0, 1/2, 1/4, 3/4, 1/8, ... of the interval.
+
+    Args:
+        index (int): Number of tasks already spread over the same interval.
+        interval (int): Interval in milliseconds.
+
+    Returns:
+        int: Phase in range [0, interval).
+    """
+    fraction, denominator = 0, 1
+    while index:  # Van der Corput sequence in base 2
+        denominator *= 2
+        index, remainder = divmod(index, 2)
+        fraction += remainder / denominator
+    return int(interval * fraction)
+
+
+class ScheduledTask:
+    """
+    Class representing a single callback in the scheduler, either a one-shot timer or a repeating task.
+    """
+    def __init__(self, callback: Callable, due: int, interval: int = None):
+        """
+        Args:
+            callback (Callable): Callable function to call once due.
+            due (int): Time (in milliseconds of the schedulers clock) the task is due at.
+            interval (int): Milliseconds between two calls of a repeating task, None for one-shot tasks.
+        """
+        self.callback = callback
+        self.due = due
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Method cancels the task, its callback won't be called anymore.
+        """
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Class runs callbacks that are due. Callbacks are kept in a heap ordered by due time, so each update only touches
+    the callbacks that are due. Repeating tasks without a set phase get spread evenly across their interval so
+    tasks sharing an interval do not all run in the same frame.
+    The scheduler can be paused; time passing while paused does not count towards any task, so tasks do not all
+    become due at once when resumed.
+    """
+    def __init__(self, clock: Callable[[], int] = None):
+        """
+        Args:
+            clock (Callable[[], int]): Function returning current time in milliseconds. Defaults to a monotonic clock.
+        """
+        self.clock = clock if clock else lambda: int(time.monotonic() * 1000)
+        self._heap: List[Tuple[int, int, ScheduledTask]] = []
+        self._counter = itertools.count()  # Keeps order of tasks due at the same time
+        self._spread = {}  # Interval -> number of tasks spread over it
+        self._paused_at: int = None  # Clock time the scheduler was paused at, None if running
+
+    def _push(self, task: ScheduledTask) -> ScheduledTask:
+        heapq.heappush(self._heap, (task.due, next(self._counter), task))
+        return task
+
+    def call_later(self, delay: int, callback: Callable) -> ScheduledTask:
+        """
+        Method schedules a one-shot timer.
+
+        Args:
+            delay (int): Milliseconds from now after which the callback gets called.
+            callback (Callable): Callable function to call.
+
+        Returns:
+            ScheduledTask: Task, can be used for cancelling it.
+        """
+        return self._push(ScheduledTask(callback, self.clock() + delay))
+
+    def call_every(self, interval: int, callback: Callable, phase: int = None) -> ScheduledTask:
+        """
+        Method schedules a repeating task. If the task falls behind (ex. a long frame), missed calls are skipped and
+        the task is called once.
+
+        Args:
+            interval (int): Milliseconds between two calls.
+            callback (Callable): Callable function to call.
+            phase (int): Milliseconds from now of the first call. If not passed, tasks with the same interval get
+                spread evenly across it.
+
+        Returns:
+            ScheduledTask: Task, can be used for cancelling it.
+        """
+        interval = max(1, int(interval))
+        if phase is None:
+            index = self._spread.get(interval, 0)
+            self._spread[interval] = index + 1
+            phase = spread_phase(index, interval)
+        return self._push(ScheduledTask(callback, self.clock() + phase, interval))
+
+    def next_due(self) -> int:
+        """
+        Method returns the time the next task is due at, None if no task is scheduled.
+
+        Returns:
+            int: Time in milliseconds of the schedulers clock.
+        """
+        while self._heap and self._heap[0][2].cancelled:  # Drop cancelled tasks
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pause(self) -> None:
+        """
+        Method pauses the scheduler, tasks are not called until resumed.
+        """
+        if self._paused_at is None:
+            self._paused_at = self.clock()
+
+    def resume(self) -> None:
+        """
+        Method resumes a paused scheduler, every task gets postponed by the time spent paused.
+        """
+        if self._paused_at is None:
+            return
+        paused_for = self.clock() - self._paused_at
+        self._paused_at = None
+        if paused_for <= 0:
+            return
+        for i, (due, order, task) in enumerate(self._heap):  # Same shift for every task keeps the heap ordered
+            task.due = due + paused_for
+            self._heap[i] = (task.due, order, task)
+
+    def clear(self) -> None:
+        """
+        Method removes every scheduled task.
+        """
+        for _, _, task in self._heap:
+            task.cancel()
+        self._heap.clear()
+        self._spread.clear()
+
+    def update(self) -> None:
+        """
+        Method calls every task that is due, repeating tasks get re-scheduled for their next interval. Nothing is
+        called while paused.
+        """
+        if self._paused_at is not None:
+            return
+        now = self.clock()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, _, task = heapq.heappop(heap)
+            if task.cancelled:
+                continue
+            if task.interval is not None:  # Re-schedule first so the callback can cancel it
+                task.due = due + task.interval
+                if task.due <= now:  # Fell behind, skip missed calls but keep phase
+                    task.due = now + task.interval - (now - due) % task.interval
+                self._push(task)
+            task.callback()
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, task in self._heap if not task.cancelled)
@@ -0,0 +1,322 @@
+"""
+Module containing shared caches of rendered surfaces, so geometry that rarely changes is rasterized once and then only
+blitted.
+"""
+
+from typing import Dict, Hashable, Tuple, Union
+
+import pygame
+
+from pyggui.helpers.cache import LRUCache
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Function returns the (estimated) number of bytes the pixels of surface take up.
+
+    Args:
+        surface (pygame.Surface): Surface.
+
+    Returns:
+        int: Number of bytes.
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Rendered shapes keyed by (size, color, width, border_radius), bounded to 256 shapes and 32MB of pixels
+shape_cache: LRUCache = LRUCache(max_items=256, max_size=32 * 1024 * 1024, size_function=surface_bytes)
+# Nine-sliced surfaces keyed by (source surface or key, size, borders), bounded to 128 surfaces and 32MB of pixels
+slice_cache: LRUCache = LRUCache(max_items=128, max_size=32 * 1024 * 1024, size_function=surface_bytes)
+# Scaled surfaces keyed by (source, size, smooth), bounded to 512 surfaces and 64MB of pixels
+scale_cache: LRUCache = LRUCache(max_items=512, max_size=64 * 1024 * 1024, size_function=surface_bytes)
+
+
+# Pixel formats of the display the cached surfaces were rendered for, see sync_display_format
+_display_format: Tuple = None
+_alpha_formats: Dict[Tuple, Tuple] = {}  # Display format -> format of surfaces converted with convert_alpha
+
+
+def _format(surface: pygame.Surface) -> Tuple:
+    """
+    Function returns pixel format of surface (bits per pixel and color masks).
+    """
+    return surface.get_bitsize(), surface.get_masks()
+
+
+def display_formats() -> Tuple[Tuple, Tuple]:
+    """
+    Function returns pixel formats surfaces get by converting them for the current display (ex. (32, masks)), first
+    for opaque surfaces (Surface.convert) then for surfaces with per-pixel alpha (Surface.convert_alpha). None if
+    there is no display.
+
+    Returns:
+        Tuple[Tuple, Tuple]: Opaque and alpha pixel format.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    opaque = _format(display)
+    if opaque not in _alpha_formats:
+        _alpha_formats[opaque] = _format(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha())
+    return opaque, _alpha_formats[opaque]
+
+
+def matches_display(surface: pygame.Surface, formats: Tuple[Tuple, Tuple] = None) -> bool:
+    """
+    Function checks if surface is in the pixel format of the display, surfaces in other formats get converted by SDL
+    on every blit (slow path).
+
+    Args:
+        surface (pygame.Surface): Surface to check.
+        formats (Tuple[Tuple, Tuple]): Formats returned by display_formats, fetched if not passed.
+
+    Returns:
+        bool: If surface matches, True if there is no display to compare with.
+    """
+    formats = formats or display_formats()
+    if formats is None:
+        return True
+    opaque, alpha = formats
+    return _format(surface) == (alpha if surface.get_flags() & pygame.SRCALPHA else opaque)
+
+
+def to_display_format(surface: pygame.Surface, formats: Tuple[Tuple, Tuple] = None) -> pygame.Surface:
+    """
+    Function converts surface to the pixel format of the display; surfaces with per-pixel alpha keep it (convert_alpha),
+    others are converted without it (convert, keeping their color key). Surfaces already in the displays format, or
+    any surface if there is no display yet, are returned as they are.
+
+    Args:
+        surface (pygame.Surface): Surface to convert.
+        formats (Tuple[Tuple, Tuple]): Formats returned by display_formats, fetched if not passed.
+
+    Returns:
+        pygame.Surface: Converted (new) surface, or passed surface.
+    """
+    formats = formats or display_formats()
+    if formats is None or matches_display(surface, formats):
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def sync_display_format() -> bool:
+    """
+    Function clears the shared surface caches (along with images cached by ImageLoader) if the display changed its
+    pixel format since the last call (ex. once the display was re-created), so images get loaded and shapes and scaled
+    images get rendered again in the new format.
+
+    Returns:
+        bool: If the format changed.
+    """
+    global _display_format
+    formats = display_formats()
+    if formats == _display_format:
+        return False
+    changed = _display_format is not None
+    _display_format = formats
+    if changed:
+        from pyggui.helpers.file_handling import ImageLoader  # Imported here, file_handling imports this module
+        shape_cache.clear()
+        slice_cache.clear()
+        scale_cache.clear()
+        ImageLoader.cache.clear()
+    return changed
+
+
+def quantise(factor: float, step: float) -> float:
+    """
+    Function rounds factor to the nearest multiple of step, so nearly equal factors share cached results.
+
+    Args:
+        factor (float): Factor to round.
+        step (float): Step to round to, None or 0 returns factor unchanged.
+
+    Returns:
+        float: Rounded factor.
+    """
+    if not step:
+        return factor
+    return round(round(factor / step) * step, 6)
+
+
+def scale(surface: pygame.Surface, size: Tuple[int, int], smooth: bool = False, key: Hashable = None) -> pygame.Surface:
+    """
+    Function returns surface scaled to size. Results are cached per (source, size, smooth) in the shared scale_cache,
+    so the returned surface should not be drawn on.
+
+    Args:
+        surface (pygame.Surface): Surface to scale.
+        size (Tuple[int, int]): Size of returned surface.
+        smooth (bool): If pygame.transform.smoothscale is used (better quality, slower), only for 24 and 32 bit
+            surfaces, others are scaled normally. Defaults to False.
+        key (Hashable): Key identifying the source, instances loading the same image file can pass the same key (ex.
+            its path) to share scaled surfaces. Defaults to None, surface itself is the key.
+
+    Returns:
+        pygame.Surface: Scaled surface.
+    """
+    size = (max(0, int(size[0])), max(0, int(size[1])))
+    cache_key = (surface if key is None else key, size, smooth)
+    result = scale_cache.get(cache_key)
+    if result is None:
+        if smooth and surface.get_bytesize() >= 3:
+            result = pygame.transform.smoothscale(surface, size)
+        else:
+            result = pygame.transform.scale(surface, size)
+        scale_cache.put(cache_key, result)
+    return result
+
+
+def rect_surface(
+    size: Tuple[int, int],
+    color: Union[Tuple[int, int, int], Tuple[int, int, int, int]],
+    width: int = 0,
+    border_radius: int = 0
+) -> pygame.Surface:
+    """
+    Function returns a surface of size with a rectangle drawn on it (same arguments as pygame.draw.rect), everything
+    outside of the shape is transparent. Surfaces are rendered once per (size, color, width, border_radius) and kept in
+    the shared shape_cache. Opaque shapes use a run-length encoded color key so mostly transparent outlines blit fast,
+    shapes with a transparent color use per-pixel alpha.
+
+    Args:
+        size (Tuple[int, int]): Size of rectangle.
+        color (Union[Tuple[int, int, int], Tuple[int, int, int, int]]): Color of rectangle.
+        width (int): Width of outline, 0 to fill the rectangle. Defaults to 0.
+        border_radius (int): Radius of rounded corners. Defaults to 0.
+
+    Returns:
+        pygame.Surface: Cached surface, should not be drawn on.
+    """
+    key = (tuple(size), tuple(color), width, border_radius)
+    surface = shape_cache.get(key)
+    if surface is None:
+        if len(color) == 4 and color[3] != 255:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface(size)
+            colorkey = (color[0] ^ 255, color[1], color[2])  # Always differs from color
+            surface.fill(colorkey)
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        pygame.draw.rect(surface, color, surface.get_rect(), width, border_radius)
+        shape_cache.put(key, surface)
+    return surface
+
+
+def draw_rect(
+    surface: pygame.Surface,
+    color: Union[Tuple[int, int, int], Tuple[int, int, int, int]],
+    rect: Union[pygame.Rect, Tuple[int, int, int, int]],
+    width: int = 0,
+    border_radius: int = 0
+) -> pygame.Rect:
+    """
+    Function is a drop-in replacement for pygame.draw.rect, blitting shapes from the shared shape cache. Filled opaque
+    rectangles without rounded corners are filled directly, as that is as fast as a blit.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on.
+        color (Union[Tuple[int, int, int], Tuple[int, int, int, int]]): Color of rectangle.
+        rect (Union[pygame.Rect, Tuple[int, int, int, int]]): Position and size of rectangle.
+        width (int): Width of outline, 0 to fill the rectangle. Defaults to 0.
+        border_radius (int): Radius of rounded corners. Defaults to 0.
+
+    Returns:
+        pygame.Rect: Area of surface drawn on.
+    """
+    rect = pygame.Rect(rect)
+    if rect.width <= 0 or rect.height <= 0:
+        return pygame.Rect(rect.topleft, (0, 0))
+    if not width and not border_radius and (len(color) == 3 or color[3] == 255):
+        return surface.fill(color, rect)
+    return surface.blit(rect_surface(rect.size, color, width, border_radius), rect)
+
+
+def three_slice(surface: pygame.Surface, size: Tuple[int, int], edge: int) -> pygame.Surface:
+    """
+    Function scales surface to size horizontally in three slices; the left and right edge (edge px wide) keep their
+    width, only the middle slice gets stretched. All slices are scaled to the new height.
+
+    Args:
+        surface (pygame.Surface): Surface to scale.
+        size (Tuple[int, int]): Size of returned surface.
+        edge (int): Width of left and right edge in px, 0 scales the whole surface.
+
+    Returns:
+        pygame.Surface: New, scaled surface.
+    """
+    width, height = size
+    source_width, source_height = surface.get_size()
+    edge = max(0, min(edge, (source_width - 1) // 2, width // 2))
+    if not edge:
+        return pygame.transform.scale(surface, size)
+    result = pygame.Surface(size, surface.get_flags() & pygame.SRCALPHA, surface)
+    if surface.get_colorkey() is not None:
+        result.set_colorkey(surface.get_colorkey())
+    slices = (
+        ((0, edge), (0, edge)),  # (source x, source width), (target x, target width)
+        ((edge, source_width - 2 * edge), (edge, width - 2 * edge)),
+        ((source_width - edge, edge), (width - edge, edge))
+    )
+    for (source_x, source_slice), (target_x, target_slice) in slices:
+        if target_slice > 0:
+            piece = surface.subsurface((source_x, 0, source_slice, source_height))
+            result.blit(pygame.transform.scale(piece, (target_slice, height)), (target_x, 0))
+    return result
+
+
+def _slice_spans(source: int, target: int, start: int, end: int) -> Tuple[Tuple[int, int, int, int], ...]:
+    """
+    Function returns (source position, source length, target position, target length) of the start edge, middle and
+    end edge along one axis, edges are shrunk if they do not fit.
+    """
+    if start + end > target:  # Edges do not fit, shrink them proportionally
+        start = target * start // (start + end)
+        end = target - start
+    middle = max(0, source - start - end)
+    return (
+        (0, start, 0, start),
+        (start, middle, start, target - start - end),
+        (source - end, end, target - end, end)
+    )
+
+
+def nine_slice(surface: pygame.Surface, size: Tuple[int, int], borders: Tuple[int, int, int, int],
+               key: Hashable = None) -> pygame.Surface:
+    """
+    Function scales surface to size in nine slices; corners keep their size, edges are stretched along their length and
+    the centre is stretched in both directions. Results are cached per (source, size, borders) in the shared
+    slice_cache, so the returned surface should not be drawn on.
+
+    Args:
+        surface (pygame.Surface): Surface to scale.
+        size (Tuple[int, int]): Size of returned surface.
+        borders (Tuple[int, int, int, int]): Insets of left, top, right and bottom border in px.
+        key (Hashable): Key identifying the source, instances loading the same image file can pass the same key (ex.
+            its path) to share sliced surfaces. Defaults to None, surface itself is the key.
+
+    Returns:
+        pygame.Surface: Scaled surface.
+    """
+    size = (max(0, int(size[0])), max(0, int(size[1])))
+    cache_key = (surface if key is None else key, size, tuple(borders))
+    result = slice_cache.get(cache_key)
+    if result is not None:
+        return result
+    left, top, right, bottom = borders
+    source_width, source_height = surface.get_size()
+    result = pygame.Surface(size, surface.get_flags() & pygame.SRCALPHA, surface)
+    if surface.get_colorkey() is not None:
+        result.set_colorkey(surface.get_colorkey())
+    for source_x, source_width_, target_x, target_width in _slice_spans(source_width, size[0], left, right):
+        for source_y, source_height_, target_y, target_height in _slice_spans(source_height, size[1], top, bottom):
+            if target_width <= 0 or target_height <= 0 or source_width_ <= 0 or source_height_ <= 0:
+                continue
+            piece = surface.subsurface((source_x, source_y, source_width_, source_height_))
+            if (source_width_, source_height_) != (target_width, target_height):
+                piece = pygame.transform.scale(piece, (target_width, target_height))
+            result.blit(piece, (target_x, target_y))
+    slice_cache.put(cache_key, result)
+    return result
@@ -6,7 +6,7 @@ from typing import Callable, List, Tuple, Dict
 
 import pygame
 
-from pyggui.gui.event_handler import EventHandler
+from pyggui.gui.event_handler import EventHandler, HandlerGroup
 
 
 def get_key_pressed_dict() -> dict:
@@ -75,9 +75,10 @@ class Input:
         self._mouse_pressed: List[bool, bool] = [False, False]  # Two consecutive mouse clicks, handled in properties
         self.mouse_clicked: bool = False  # Gets set by event, above is set every frame
         self.mouse_movement: Tuple[int, int] = (0, 0)  # Movement of mouse between two consecutive calls
-        self.mouse_scroll: int = 0   # Wheel on the mouse, 1 if up -1 if down roll
-        # Events
-        self.event_types: Dict[str, Callable] = {}
+        self.mouse_scroll: int = 0   # Wheel movement on current frame, positive if up negative if down roll
+        self.event_count: int = 0  # Number of events processed in the last update
+        # Game-wide event handlers
+        self.event_handlers: HandlerGroup = HandlerGroup()
         # Initial update
         self.update()
 
@@ -112,19 +113,29 @@ class Input:
         """
         return self._mouse_pressed[0]  # Left one is the previous one as we append clicks
 
+    @property
+    def event_types(self) -> Dict[int, List[EventHandler]]:
+        """
+        Dictionary of event types along with game-wide event handlers of each type.
+
+        Returns:
+            Dict[int, List[EventHandler]]: Event type -> list of EventHandler objects
+        """
+        types = {}
+        for event_handler in self.event_handlers:
+            for event_type in event_handler.types:
+                types.setdefault(event_type, []).append(event_handler)
+        return types
+
     def add_event_handler(self, event_handler: EventHandler) -> None:
         """
-        Method adds event handler object to self, its event types are added to the event types dictionary,
-        its handlers get triggered once the type appears in the main input loop.
+        Method adds event handler object to self, its handlers get triggered once one of its event types appears in
+        the main input loop.
 
         Args:
             event_handler (EventHandler): EventHandler object to add.
         """
-        for event_type in event_handler.types:
-            if event_type in self.event_types:
-                self.event_types[event_type].append(event_handler)
-            else:
-                self.event_types[event_type] = [event_handler]
+        self.event_handlers.add(event_handler)
 
     def add_event_type_handler(self, event_type: int, handler: Callable) -> None:
         """
@@ -146,10 +157,7 @@ class Input:
         Args:
             event_handler (EventHandler): EventHandler object to remove
         """
-        for event_type in event_handler.types:
-            if event_type in self.event_types:
-                # Create new list object, add only EventHandlers that are not the passed event_handler
-                self.event_types[event_type] = [eh for eh in self.event_types[event_type] if not (eh is event_handler)]
+        self.event_handlers.remove(event_handler)
 
     def remove_event_handlers(self, event_handlers: List[EventHandler]) -> None:
         """
@@ -162,16 +170,17 @@ class Input:
         for event_handler in event_handlers:
             self.remove_event_handler(event_handler)
 
-    def __process_event_type_handlers(self, event: 'Event') -> None:
+    def __process_event_type_handlers(self, event: 'Event') -> bool:
         """
-        Method handles events set in event_types, these are added by users (pages and or items).
+        Method handles events with game-wide handlers, added by users or the game itself.
 
         Args:
             event (Event): Pygame Event object.
+
+        Returns:
+            bool: If a handler consumed the event.
         """
-        if event.type in self.event_types:  # Check if handler was added
-            for handler in self.event_types[event.type]:
-                handler.update(event=event)  # Call EventHandlers update method, pass it the event
+        return self.event_handlers.dispatch(event)
 
     def __process_events(self, event: 'Event') -> None:
         """
@@ -189,7 +198,7 @@ class Input:
             self.mouse_clicked = False
         # Mouse wheel event
         if event.type == pygame.MOUSEWHEEL:
-            self.mouse_scroll = event.y  # This attribute has to be reset outside this event loop
+            self.mouse_scroll += event.y  # Reset at the start of every update
 
     def update(self) -> bool:
         """
@@ -199,9 +208,14 @@ class Input:
         Returns:
             bool: False if game was quit, True otherwise
         """
-        for event in pygame.event.get():
-            # Process user added events first
-            self.__process_event_type_handlers(event)
+        events = pygame.event.get()
+        self.event_count = len(events)
+        self.mouse_scroll = 0
+        controller = getattr(self.game, "controller", None)  # First update runs before controller is created
+        for event in events:
+            # Dispatch top-down; game-wide handlers, then pages and their items, until consumed
+            if not self.__process_event_type_handlers(event) and controller is not None:
+                controller.dispatch_event(event)
             # Process own events
             self.__process_events(event)
             # Quit event
@@ -5,12 +5,16 @@ Module containing main Game class
 import sys
 from typing import Tuple
 import inspect
+import time
 
 import pygame
 
 from pyggui.controller import Controller
 from pyggui.input import Input
 from pyggui.window import Window
+from pyggui.helpers.frame_stats import FrameStatistics
+from pyggui.helpers.surfaces import sync_display_format
+from pyggui.gui.animation import Animator
 from pyggui.configure import pages as configure_pages
 from pyggui.configure import asset_builder as configure_asset_builder
 
@@ -26,7 +30,10 @@ class Game:
         entry_page: str = "_WelcomePage",
         assets_directory: str = None,
         fps: int = 0,
-        display: pygame.surface.Surface = None
+        display: pygame.surface.Surface = None,
+        idle_timeout: int = None,
+        idle_fps: int = 10,
+        page_cache_size: int = 64 * 1024 * 1024
     ):
         """
         Args:
@@ -35,6 +42,12 @@ class Game:
                 Defaults to directory of where this object is initialised.
             fps (int): Fps constant for game loop.
             display (pygame.surface.Surface): Pass your own surface as the main game object display.
+            idle_timeout (int): Milliseconds without any activity (events, running animations, controller.wake calls)
+                after which the game loop goes idle; it then blocks waiting for events and runs at most idle_fps
+                frames per second until activity resumes. Defaults to None, the loop never goes idle.
+            idle_fps (int): Frame rate while idle. Defaults to 10.
+            page_cache_size (int): Maximum estimated memory in bytes of surfaces held by reusable pages kept alive in
+                the controllers page cache, None for no limit. Defaults to 64MB.
         """
         pygame.init()  # Init Pygame on import time
 
@@ -54,6 +67,7 @@ class Game:
         else:
             self._display = pygame.display.set_mode(display_size, pygame.RESIZABLE)
             self._display_size = display_size
+        sync_display_format()
 
         pygame.display.set_caption("Pygame Window w/pyggui")
         self.clock = pygame.time.Clock()
@@ -61,8 +75,16 @@ class Game:
         # Attributes
         self._fps = fps
         self._dt = 0  # Change of time between seconds
+        # Frame times of the main loop, frames over the budget (set by fps cap, or 60 fps if uncapped) count as jank
+        self.frame_stats = FrameStatistics(budget=1000 / (fps or 60))
         self.paused = False  # If game is paused
         self.entry_page = entry_page
+        # Idle throttling
+        self.idle_timeout = idle_timeout
+        self.idle_fps = idle_fps
+        self._awake_until = 0  # Ticks until which the loop runs at full rate
+
+        self.page_cache_size = page_cache_size
 
         # Objects
         self.input = Input(self)
@@ -100,9 +122,9 @@ class Game:
     @property
     def fps(self) -> float:
         """
-        Current FPS the game is running at.
+        Current FPS the game is running at, averaged over the frame statistics window. 0 if no frame was run yet.
         """
-        return round(1000 / self._dt)
+        return round(self.frame_stats.fps)
 
     @fps.setter
     def fps(self, frame_rate: int) -> None:
@@ -110,21 +132,90 @@ class Game:
         Cap FPS of game at given integer value.
         """
         self._fps = int(frame_rate)
+        self.frame_stats.budget = 1000 / (self._fps or 60)
+
+    @property
+    def idle(self) -> bool:
+        """
+        If the game loop is currently idle, i.e. no activity happened for idle_timeout milliseconds.
+        """
+        if self.idle_timeout is None:
+            return False
+        return pygame.time.get_ticks() >= self._awake_until and not self.controller.busy
+
+    def wake(self, duration: int = 0) -> None:
+        """
+        Method keeps the game loop running at full rate for at least idle_timeout (or duration, if longer)
+        milliseconds from now. Should be called when something changes on screen without user input.
+
+        Args:
+            duration (int): Minimum milliseconds to stay awake for. Defaults to 0.
+        """
+        awake_for = max(duration, self.idle_timeout or 0)
+        self._awake_until = max(self._awake_until, pygame.time.get_ticks() + awake_for)
+
+    def wait_while_idle(self) -> None:
+        """
+        Method blocks until an event arrives, the idle frame interval passes or a scheduled page callback is due.
+        The awaited event is put back in the queue so Input processes it as usual.
+        """
+        timeout = int(1000 / self.idle_fps)
+        next_timer = self.controller.next_timer()
+        if next_timer is not None:
+            timeout = min(timeout, next_timer)
+        if timeout <= 0:
+            return
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
 
     def display_resize_handler(self, event) -> None:
         """
-        Handler updates the display and its size once the display window has been re-sized.
+        Handler updates the display and its size once the display window has been re-sized, then lets pages lay out
+        their items for the new size.
         """
         self._display_size = (event.w, event.h)
         self._display = pygame.display.set_mode(self.display_size, pygame.RESIZABLE)
+        sync_display_format()  # Drops cached surfaces if the re-created display has a different pixel format
+        self.controller.display_resized(self.display_size)
 
     def run(self) -> None:
         """
-        Run main game loop. Will update Window, Input and grab time passed from previous frame.
+        Run main game loop. Will update Input, Window and grab time passed from previous frame.
         Loop ends if Input.update returns False i.e. a quit event appeared.
+        Time spent in each phase of the frame is recorded into frame_stats, frame times do not include waiting for
+        the frame rate cap.
+        If idle_timeout is set, the loop waits for events between frames while idle.
         """
-        running = True
-        while running:
-            self.window.update()
-            running = self.input.update()
+        clock = time.perf_counter
+        frame_start = clock()
+        self.wake()
+        while True:
+            if self.idle and not pygame.event.peek():
+                self.wait_while_idle()
+                frame_start = clock()  # Time slept while idle is not part of the frame
+            if not self.input.update():
+                break
+            if self.input.event_count:
+                self.wake()
+            input_end = clock()
+            self.controller.update()
+            self.window.update_pages()
+            update_end = clock()
+            self.window.draw()
+            draw_end = clock()
+            if Animator.active:  # An animation advanced while drawing
+                Animator.active = False
+                self.wake()
+            self.window.present()
+            present_end = clock()
             self._dt = self.clock.tick(self._fps)
+            frame_end = clock()
+            self.frame_stats.record(
+                frame=(present_end - frame_start) * 1000,  # Waiting for the frame rate cap is not part of the frame
+                input_time=(input_end - frame_start) * 1000,
+                update=(update_end - input_end) * 1000,
+                draw=(draw_end - update_end) * 1000,
+                present=(present_end - draw_end) * 1000
+            )
+            frame_start = frame_end
@@ -21,13 +21,23 @@ class Window:
         self.display = self.game.display
         self.overlay_page = self.game.controller.overlay_page
 
-    def update(self) -> None:
+    def update_pages(self) -> None:
         """
-        Method updates and draws the current page while also updating the screen.
+        Method updates the current page and the overlay page.
         """
-        self.display.fill((0, 0, 0))
         self.game.controller.current_page.update()
         self.overlay_page.update()
+
+    def draw(self) -> None:
+        """
+        Method clears the display and draws the current page and the overlay page on it.
+        """
+        self.display.fill((0, 0, 0))
         self.game.controller.current_page.draw()
         self.overlay_page.draw()
+
+    def present(self) -> None:
+        """
+        Method updates the screen with everything drawn on the display.
+        """
         pygame.display.update()
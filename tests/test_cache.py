@@ -0,0 +1,30 @@
+from pyggui.helpers.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_items=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_lru_cache_bounded_by_size():
+    cache = LRUCache(max_items=None, max_size=10, size_function=len)
+    cache.put("a", "x" * 6)
+    cache.put("b", "x" * 6)
+    assert "a" not in cache
+    assert cache.total_size == 6
+    assert cache.pop("b") == "x" * 6
+    assert cache.total_size == 0
+
+
+def test_lru_cache_calls_on_evict_for_evicted_values_only():
+    evicted = []
+    cache = LRUCache(max_items=1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.pop("b")
+    assert evicted == [("a", 1)]
@@ -0,0 +1,125 @@
+import types
+
+import pygame
+
+from pyggui.controller import Controller
+from pyggui.gui.page import Page
+from pyggui.helpers.file_handling import ImageLoader
+
+
+class ControllerHome(Page):
+    reusable = True
+
+    def __init__(self, controller, value=None):
+        super().__init__(controller)
+        self.value = value
+        self.resets = []
+
+    def reset(self, *args, **kwargs):
+        self.resets.append((args, kwargs))
+
+    def estimate_memory(self):
+        return 10
+
+
+class ControllerOther(Page):
+    pass
+
+
+class ControllerLarge(Page):  # Pages are registered as direct subclasses of Page
+    reusable = True
+
+    def estimate_memory(self):
+        return 1000
+
+
+class PrefetchedPage(Page):
+    def __init__(self, controller, value=None):
+        super().__init__(controller)
+        self.value = value
+        self.images = [ImageLoader.load_image(path) for path in self.preload_images]
+
+
+class PrefetchedOther(Page):
+    def __init__(self, controller, value=None):
+        super().__init__(controller)
+        self.value = value
+
+
+def make_controller(page_cache_size=100):
+    pygame.display.init()
+    game = types.SimpleNamespace(
+        input=types.SimpleNamespace(), page_cache_size=page_cache_size, entry_page="ControllerOther",
+        display=pygame.display.set_mode((10, 10)), wake=lambda duration=0: None, dt=0
+    )
+    return Controller(game)
+
+
+def test_reusable_page_is_reset_instead_of_created():
+    controller = make_controller()
+    controller.redirect_to_page("ControllerHome", 1)
+    home = controller.current_page
+    controller.redirect_to_page("ControllerOther")
+    controller.redirect_to_page("ControllerHome", 2, key="value")
+    assert controller.current_page is home and home.value == 1
+    assert home.resets == [((2,), {"key": "value"})]
+
+
+def test_page_larger_than_page_cache_gets_evicted():
+    controller = make_controller(page_cache_size=100)
+    controller.redirect_to_page("ControllerHome")
+    controller.redirect_to_page("ControllerLarge")
+    assert "ControllerLarge" in controller.page_cache  # Most recently cached page is always kept
+    assert "ControllerHome" not in controller.page_cache
+    controller.redirect_to_page("ControllerHome")
+    assert "ControllerLarge" not in controller.page_cache and "ControllerHome" in controller.page_cache
+
+
+def test_cached_page_is_measured_again_when_left():
+    controller = make_controller()
+    controller.redirect_to_page("ControllerHome")
+    home = controller.current_page
+    home.estimate_memory = lambda: 40  # Page grew while shown
+    controller.redirect_to_page("ControllerOther")
+    assert controller.page_cache.total_size == 40
+
+
+def save_image(tmp_path):
+    path = str(tmp_path / "preloaded.png")
+    pygame.image.save(pygame.Surface((4, 4)), path)
+    return path
+
+
+def test_prefetched_page_uses_images_decoded_in_advance(tmp_path, monkeypatch):
+    path = save_image(tmp_path)
+    monkeypatch.setattr(PrefetchedPage, "preload_images", [path])
+    loads = []
+    load = pygame.image.load
+    monkeypatch.setattr(pygame.image, "load", lambda *args: loads.append(args) or load(*args))
+    controller = make_controller()
+    controller.prefetch_page("PrefetchedPage", 1)
+    prefetch = controller._prefetched.get("PrefetchedPage")
+    for _, future in prefetch.futures:
+        future.result()
+    controller.update()  # Constructs the page from staged images
+    assert prefetch.page is not None and not ImageLoader._staged
+    controller.redirect_to_page("PrefetchedPage", 1)
+    assert controller.current_page is prefetch.page
+    assert len(loads) == 1  # Decoded once, on the worker thread
+
+
+def test_prefetch_is_discarded_once_superseded_or_evicted(tmp_path, monkeypatch):
+    path = save_image(tmp_path)
+    monkeypatch.setattr(PrefetchedPage, "preload_images", [path])
+    monkeypatch.setattr(PrefetchedOther, "preload_images", [path])
+    unstaged = []
+    monkeypatch.setattr(ImageLoader, "unstage", staticmethod(unstaged.append))
+    monkeypatch.setattr(Controller, "max_prefetched", 1)
+    controller = make_controller()
+    controller.prefetch_page("PrefetchedPage", 1)
+    controller.prefetch_page("PrefetchedPage", 2)  # Different arguments, first prefetch is discarded
+    assert unstaged == [path]
+    controller.prefetch_page("PrefetchedOther")  # Over max_prefetched, second prefetch is evicted
+    assert unstaged == [path, path] and "PrefetchedPage" not in controller._prefetched
+    controller.redirect_to_page("PrefetchedOther", 3)  # Prefetched without arguments, discarded
+    assert unstaged == [path, path, path] and controller.current_page.value == 3
@@ -0,0 +1,20 @@
+import pygame
+
+from pyggui.gui.event_handler import EventHandler, HandlerGroup
+
+
+def test_handler_group_dispatch_order_removal_and_toggle():
+    group, calls = HandlerGroup(), []
+    second = EventHandler(pygame.KEYDOWN, lambda event: calls.append("second"))
+    first = EventHandler(pygame.KEYDOWN, lambda event: calls.append("first") or group.remove(second))
+    group.add(first)
+    group.add(second)
+    group.add(first)  # Added once
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    assert not group.dispatch(event)
+    assert calls == ["first"] and len(group) == 1  # Removed during dispatch, skipped
+    group.add(EventHandler(pygame.KEYDOWN, lambda event: True))
+    group.add(second)
+    assert group.dispatch(event) and calls == ["first", "first"]  # Consumed before second
+    group.enabled = False
+    assert not group.dispatch(event) and calls == ["first", "first"]
@@ -0,0 +1,15 @@
+from pyggui.helpers.frame_stats import FrameStatistics
+
+
+def test_frame_statistics_window():
+    stats = FrameStatistics(window_size=4, budget=20)
+    assert stats.fps == 0 and stats.percentile(99) == 0
+    for frame in (10, 30, 10, 10, 50):  # First frame falls out of the window
+        stats.record(frame=frame, input_time=1, update=2, draw=3, present=4)
+    assert stats.samples() == [30, 10, 10, 50]
+    assert stats.mean() == 25
+    assert stats.percentile(50) == 10
+    assert stats.max() == 50
+    assert stats.jank_count == 2
+    summary = stats.summary()
+    assert summary["frames"] == 4 and summary["draw"]["p99"] == 3
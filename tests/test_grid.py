@@ -0,0 +1,68 @@
+import pygame
+
+from pyggui.gui.grid import Grid
+from pyggui.gui.item import StaticItem
+
+
+def test_cells_are_created_on_access():
+    grid = Grid(position=(10, 20), rows=100, columns=100, size=(1000, 500))
+    assert grid.cells == []
+    assert grid.cell_rect(2, 3) == pygame.Rect(40, 30, 10, 5)
+    assert grid.cell_rect(-1, -1) == pygame.Rect(1000, 515, 10, 5)
+    assert grid.cells == []  # Computing rectangles creates nothing
+    cell = grid[2][3]
+    assert grid.cells == [cell] and grid.cell(2, 3) is cell
+    assert cell.rect == grid.cell_rect(2, 3)
+
+
+def test_cells_can_be_set_inserted_and_deleted():
+    grid = Grid(rows=2, columns=3, size=(90, 20))
+    item = StaticItem(size=(4, 4))
+    grid.add_item(item, 0, 0, align="left top")
+    cell = grid[0][0]
+    grid[1][1] = cell  # Moves the cell along with its item
+    assert (0, 0) not in grid._cells and grid[1][1] is cell
+    assert item.position == [30, 10]
+    other = grid[0][2]
+    grid[1].insert(0, other)  # Shifts cell into the last column
+    assert grid[1][0] is other and grid[1][2] is cell
+    assert item.position == [60, 10]
+    del grid[1][2]
+    assert (1, 2) not in grid._cells and cell.grid is None
+    grid[0].append(cell)
+    assert grid[0][0] is cell and item.position == [0, 0]
+    del grid[0]
+    assert [c.position_in_grid for c in grid.cells] == [(1, 0)]
+
+
+def test_grid_follows_display_resize():
+    pygame.display.init()
+    pygame.display.set_mode((100, 50))
+    grid = Grid(rows=2, columns=2)
+    item = StaticItem(size=(10, 10))
+    grid.add_item(item, 1, 1)
+    cell = grid[1][1]
+    assert cell.rect == pygame.Rect(50, 25, 50, 25)
+    assert item.position == [70, 32]
+    pygame.display.set_mode((200, 100))
+    grid.on_display_resize((200, 100))
+    assert grid.size == (200, 100)
+    assert grid.cell_rect(1, 1) == pygame.Rect(100, 50, 100, 50)
+    assert grid[1][1] is cell and cell.rect == grid.cell_rect(1, 1)
+    assert item.position == [145, 70]  # Re-aligned into the centre of the larger cell
+
+
+def test_events_reach_topmost_cell_first():
+    received = []
+
+    class Consumer(StaticItem):
+        def handle_event(self, event):
+            received.append(self)
+            return True
+
+    grid = Grid(rows=1, columns=2, size=(20, 10))
+    below, above = Consumer(size=(15, 10)), Consumer(size=(15, 10))
+    grid.add_item(below, 0, 0, align="left")
+    grid.add_item(above, 0, 1, align="right")  # Drawn later, overlaps the first cell
+    assert grid.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(8, 5)))
+    assert received == [above]
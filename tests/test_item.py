@@ -0,0 +1,39 @@
+import pygame
+
+from pyggui.gui.container import StaticContainer
+from pyggui.gui.item import Item, StaticItem
+
+
+def test_moving_container_moves_nested_items():
+    outer = StaticContainer(size=(100, 100))
+    inner = StaticContainer(size=(50, 50))
+    item = StaticItem(size=(5, 5))
+    inner.add_item(item, (3, 4))
+    outer.add_item(inner, (10, 10))
+    outer.move((100, 0))
+    assert inner.position == [110, 10]
+    assert item.position == [113, 14]
+
+
+def test_setting_attached_item_position_changes_offset():
+    container = StaticContainer(size=(100, 100))
+    item = StaticItem(size=(5, 5))
+    container.add_item(item, (0, 0))
+    item.position = (20, 30)
+    container.move_to((100, 100))
+    assert container.items_positions == [[20, 30]]
+    assert item.position == [120, 130]
+    assert container.bounds.size == (100, 100)
+
+
+def test_click_is_consumed_by_topmost_item():
+    class Controller:
+        display = None
+
+    container = StaticContainer(size=(100, 100))
+    below, above = Item(Controller(), size=(50, 50)), Item(Controller(), size=(50, 50))
+    container.add_item(below, (0, 0))
+    container.add_item(above, (20, 20))
+    assert container.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(30, 30)))
+    assert above.mouse_clicked and not below.mouse_clicked
+    assert not container.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(90, 90)))
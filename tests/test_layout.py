@@ -0,0 +1,33 @@
+from pyggui.gui.item import StaticItem
+from pyggui.gui.layout import FlexColumn, FlexRow
+
+
+def test_row_is_sized_from_items():
+    row = FlexRow(position=(10, 10), gap=5, padding=2, align="centre")
+    first, second = StaticItem(size=(20, 10)), StaticItem(size=(30, 20))
+    row.add_item(first)
+    row.add_item(second)
+    row.layout()
+    assert row.size == (59, 24)
+    assert first.position == [12, 17]
+    assert second.position == [37, 12]
+
+
+def test_only_changed_branch_is_laid_out_again():
+    column = FlexColumn(size=(100, 100), align="stretch")
+    header = FlexRow(justify="end")
+    label = StaticItem(size=(20, 10))
+    header.add_item(label)
+    column.add_item(header)
+    column.add_item(FlexRow(), grow=1)
+    column.layout()
+    assert header.size == (100, 10)
+    assert label.position == [80, 0]
+    column.layout()  # Nothing changed, nothing gets measured
+    assert column._measured is not None and header._arranged
+    label.size = (40, 30)
+    assert column._measured is None and not header._arranged
+    column.layout()
+    assert header.size == (100, 30)
+    assert label.position == [60, 0]
+    assert column.items[1].position == [0, 30]
@@ -0,0 +1,24 @@
+import os
+import sys
+
+from pyggui.configure.build import read_config_file
+from pyggui.configure.pages import import_all_modules, manifest_is_valid
+
+
+def test_manifest_stays_valid_after_it_is_written(tmp_path):
+    project = tmp_path / "manifest_project"
+    project.mkdir()
+    main = project / "main.py"
+    main.write_text("")
+    (project / "manifest_page.py").write_text("VALUE = 1\n")
+    sys.path.insert(0, str(project))
+    try:
+        import_all_modules(dir_path=str(project), called_from_module=str(main))
+    finally:
+        sys.path.remove(str(project))
+    manifest = read_config_file(dir_path=str(project))
+    assert manifest_is_valid(manifest, str(project))
+
+    (project / "another_page.py").write_text("")  # Added module changes the directories modification time
+    os.utime(str(project), ns=(0, 0))
+    assert not manifest_is_valid(manifest, str(project))
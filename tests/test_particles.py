@@ -0,0 +1,28 @@
+import pytest
+import pygame
+
+np = pytest.importorskip("numpy")
+
+from pyggui.gui.particles import ParticleSystem
+
+
+class FakeController:
+    display = pygame.Surface((100, 100))
+    dt_s = 0.5
+
+    def wake(self):
+        pass
+
+
+def test_particles_move_and_dead_or_culled_ones_are_removed():
+    system = ParticleSystem(FakeController(), pygame.Surface((2, 2)), capacity=10)
+    assert system.emit_arrays([(10, 10), (50, 50), (90, 90)], [(0, 0), (20, 0), (100, 0)], [1, 0.25, 1]) == 3
+    assert system.emit(20, (50, 50)) == 7  # Capacity reached
+    system.clear()
+    system.emit_arrays([(10, 10), (50, 50), (90, 90)], [(0, 0), (20, 0), (100, 0)], [2, 0.25, 1])
+    system.update()  # Second died, third left the area
+    assert system.count == 1
+    assert system.positions[0].tolist() == [10, 10]
+    system.emit_arrays([(20, 20)], [(10, 0)], 1)
+    system.update()
+    assert system.positions[:system.count].tolist() == [[10, 10], [25, 20]]
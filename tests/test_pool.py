@@ -0,0 +1,62 @@
+from pyggui.gui.pool import ItemPool
+
+
+class Toast:
+    def __init__(self):
+        self.value = None
+        self.parent = None
+
+
+def test_released_items_are_reused_and_reset():
+    created = []
+    pool = ItemPool(factory=lambda: created.append(Toast()) or created[-1],
+                    reset=lambda toast, value: setattr(toast, "value", value), max_size=1)
+    first = pool.acquire("a")
+    second = pool.acquire("b")
+    pool.release(first)
+    pool.release(first)  # Releasing twice keeps a single copy
+    pool.release(second)  # Over max_size, dropped
+    assert len(pool) == 1
+    assert pool.acquire("c") is first and first.value == "c"
+    assert len(created) == 2
+
+
+def test_released_items_are_detached_from_parent():
+    from pyggui.gui.grid import Grid
+    from pyggui.gui.item import StaticItem
+
+    grid = Grid(rows=1, columns=1, size=(10, 10))
+    item = StaticItem(size=(2, 2))
+    grid.add_item(item, 0, 0)
+    pool = ItemPool(factory=lambda: StaticItem(size=(2, 2)))
+    pool.release(item)
+    assert grid[0][0].items == [] and grid[0][0].layouts == []
+    assert item.parent is None and len(pool) == 1
+
+    orphan = Toast()
+    orphan.parent = object()  # Parent unable to remove it
+    pool.release(orphan)
+    assert len(pool) == 1
+
+
+def test_released_items_are_detached_from_containers():
+    from pyggui.gui.container import ResizableContainer, StaticContainer
+    from pyggui.gui.item import ResizableItem, StaticItem
+
+    pool = ItemPool(factory=lambda: StaticItem(size=(2, 2)))
+    static = StaticContainer(size=(10, 10))
+    kept, released = StaticItem(size=(2, 2)), StaticItem(size=(2, 2))
+    static.add_item(kept, (1, 1))
+    static.add_item(released, (5, 5))
+    pool.release(released)
+    assert static.items == [kept] and static.items_positions == [[1, 1]]
+
+    resizable = ResizableContainer(size=(10, 10))
+    kept, released = ResizableItem(size=(2, 2)), ResizableItem(size=(2, 2))
+    resizable.add_item(released, (5, 5))
+    resizable.add_item(kept, (1, 1))
+    pool.release(released)
+    assert resizable.items == [kept] and resizable.resized_items_positions == [[1, 1]]
+    resizable.resize(2)
+    assert resizable.resized_items_positions == [[2, 2]]
+    assert len(pool) == 2
@@ -0,0 +1,52 @@
+from pyggui.helpers.scheduler import Scheduler, spread_phase
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+def test_spread_phase():
+    assert [spread_phase(i, 1000) for i in range(4)] == [0, 500, 250, 750]
+
+
+def test_scheduler_runs_due_tasks():
+    clock = FakeClock()
+    scheduler = Scheduler(clock=clock)
+    calls = []
+    scheduler.call_later(50, lambda: calls.append("once"))
+    repeating = scheduler.call_every(20, lambda: calls.append("every"), phase=20)
+    clock.time = 45  # Fell behind, missed calls are skipped
+    scheduler.update()
+    assert calls == ["every"]
+    assert scheduler.next_due() == 50
+    clock.time = 200
+    scheduler.update()
+    assert calls == ["every", "once", "every"]
+    assert scheduler.next_due() == 220
+    repeating.cancel()
+    assert scheduler.next_due() is None
+
+
+def test_paused_time_does_not_count():
+    clock = FakeClock()
+    scheduler = Scheduler(clock=clock)
+    calls = []
+    scheduler.call_later(50, lambda: calls.append("once"))
+    scheduler.call_every(20, lambda: calls.append("every"), phase=20)
+    clock.time = 10
+    scheduler.pause()
+    clock.time = 1000  # Hidden, nothing runs and nothing becomes overdue
+    scheduler.update()
+    assert calls == []
+    scheduler.resume()
+    assert scheduler.next_due() == 1010
+    clock.time = 1030
+    scheduler.update()
+    assert calls == ["every"]
+    clock.time = 1040
+    scheduler.update()
+    assert calls == ["every", "once"]
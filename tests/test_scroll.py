@@ -0,0 +1,91 @@
+import types
+
+import pygame
+
+from pyggui.gui.item import StaticItem
+from pyggui.gui.scroll import ScrollContainer, ScrollList
+
+
+def make_controller(mouse_position=(0, 0)):
+    return types.SimpleNamespace(input=types.SimpleNamespace(mouse_position=mouse_position))
+
+
+def wheel(y):
+    return pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=y)
+
+
+def test_scroll_list_binds_only_visible_rows_and_recycles_them():
+    created = []
+
+    def row_factory():
+        created.append(StaticItem(size=(100, 10)))
+        return created[-1]
+
+    bound = {}
+    data = list(range(10000))
+    scroll_list = ScrollList(make_controller(), data, row_factory, lambda row, value: bound.update({id(row): value}),
+                             row_height=10, size=(100, 50), buffer=1)
+    assert scroll_list.visible_range() == (0, 6)
+    assert len(created) == 6
+    scroll_list.scroll_to_index(5000)
+    assert scroll_list.visible_range() == (4999, 5006)
+    assert len(created) == 7  # Rows were recycled, only one more was needed for the buffer above
+    row = scroll_list.rows[5000]
+    assert bound[id(row)] == 5000 and row.position == [0, 0]
+
+
+def test_scroll_list_consumes_wheel_only_while_hovered_and_scrolling():
+    controller = make_controller(mouse_position=(10, 10))
+    scroll_list = ScrollList(controller, list(range(100)), lambda: StaticItem(size=(100, 10)), lambda row, value: None,
+                             row_height=10, size=(100, 50), scroll_speed=10)
+    assert not scroll_list.handle_event(wheel(1))  # Already at the top
+    assert scroll_list.handle_event(wheel(-2))
+    assert scroll_list.scroll == 20
+    controller.input.mouse_position = (500, 500)
+    assert not scroll_list.handle_event(wheel(-1))
+    assert scroll_list.scroll == 20
+
+
+def test_scroll_container_redraws_only_exposed_and_invalidated_areas():
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    redrawn = []
+
+    class RecordingContainer(ScrollContainer):
+        def _redraw(self, area):
+            redrawn.append(pygame.Rect(area))
+            super()._redraw(area)
+
+    controller = make_controller(mouse_position=(10, 10))
+    container = RecordingContainer(controller, size=(100, 50), scroll_speed=10, smooth=False)
+    container.add_item(StaticItem(size=(100, 200)), (0, 0))
+    container.draw()
+    assert redrawn == [pygame.Rect(0, 0, 100, 50)]
+    redrawn.clear()
+    assert container.handle_event(wheel(-1))
+    container.draw()
+    assert redrawn == [pygame.Rect(0, 40, 100, 10)]  # Only the exposed strip
+    redrawn.clear()
+    container.invalidate(pygame.Rect(0, 20, 10, 10))  # Relative to content, scrolled by 10
+    container.draw()
+    assert redrawn == [pygame.Rect(0, 10, 10, 10)]
+    redrawn.clear()
+    container.invalidate()
+    container.draw()
+    assert redrawn == [pygame.Rect(0, 0, 100, 50)]
+
+
+def test_scroll_container_removes_items():
+    from pyggui.gui.pool import ItemPool
+    display = pygame.display.set_mode((100, 100))
+    container = ScrollContainer(make_controller(), size=(100, 50), smooth=False)
+    top, bottom = StaticItem(size=(100, 20)), StaticItem(size=(100, 20))
+    container.add_item(top, (0, 0))
+    container.add_item(bottom, (0, 180))
+    container.scroll = 150
+    container.draw()
+    ItemPool(factory=lambda: StaticItem(size=(1, 1))).release(bottom)
+    assert container.items == [top] and bottom.parent is None
+    assert bottom.display is display
+    assert container._drawn_scroll is None  # Fully re-drawn on next draw
+    assert container.content_height == 50 and container.scroll == 0
@@ -0,0 +1,81 @@
+import pygame
+
+from pyggui.helpers.surfaces import draw_rect, nine_slice, rect_surface, shape_cache
+
+
+def test_shapes_are_rendered_once_and_drawn_like_pygame():
+    shape_cache.clear()
+    outline = rect_surface((20, 10), (255, 255, 255), width=1)
+    assert rect_surface((20, 10), (255, 255, 255), width=1) is outline
+    assert len(shape_cache) == 1
+    cached, direct = pygame.Surface((40, 40)), pygame.Surface((40, 40))
+    for width, radius in ((1, 0), (0, 5), (3, 5)):
+        cached.fill((0, 0, 0))
+        direct.fill((0, 0, 0))
+        draw_rect(cached, (255, 0, 0), (5, 5, 30, 20), width, radius)
+        pygame.draw.rect(direct, (255, 0, 0), (5, 5, 30, 20), width, radius)
+        assert pygame.image.tostring(cached, "RGB") == pygame.image.tostring(direct, "RGB")
+
+
+def test_nine_slice_keeps_corners_and_caches_sizes():
+    source = pygame.Surface((9, 9))
+    source.fill((0, 0, 255))
+    source.fill((255, 0, 0), (0, 0, 3, 3))  # Top left corner
+    panel = nine_slice(source, (40, 20), (3, 3, 3, 3))
+    assert panel.get_size() == (40, 20)
+    assert panel.get_at((2, 2))[:3] == (255, 0, 0) and panel.get_at((3, 3))[:3] == (0, 0, 255)
+    assert nine_slice(source, (40, 20), (3, 3, 3, 3)) is panel
+
+
+def test_resizable_images_share_quantised_scales():
+    from pyggui.gui.image import ResizableImage
+    source = pygame.Surface((100, 50))
+    first, second = ResizableImage(source), ResizableImage(source)
+    first.resize(1.101)
+    second.resize(1.099)
+    assert first.current_image is second.current_image
+    assert first.current_image.get_size() == (110, 55)
+    assert first.precompute(0.9, 1.1) == 21
+
+
+def test_nine_slice_images_from_same_path_share_render(tmp_path):
+    from pyggui.gui.image import NineSliceImage
+    from pyggui.helpers.file_handling import ImageLoader
+    path = str(tmp_path / "panel.png")
+    pygame.image.save(pygame.Surface((10, 10)), path)
+    ImageLoader.cache.clear()
+    first = NineSliceImage(path, 3, size=(40, 20))
+    second = NineSliceImage(path, 3, size=(40, 20))
+    assert first.image is second.image
+    assert first.get() is second.get()
+
+
+def test_surfaces_get_converted_to_display_format():
+    from pyggui.helpers.surfaces import matches_display, to_display_format
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    odd = pygame.Surface((4, 4), depth=16)
+    assert not matches_display(odd)
+    assert matches_display(to_display_format(odd))
+    alpha = to_display_format(pygame.Surface((4, 4), pygame.SRCALPHA, depth=32))
+    assert alpha.get_flags() & pygame.SRCALPHA and matches_display(alpha)
+
+
+def test_page_converts_surfaces_of_nested_items_once():
+    import types
+    from pyggui.gui.grid import Grid
+    from pyggui.gui.image import ResizableImage
+    from pyggui.gui.page import Page
+    pygame.display.init()
+    display = pygame.display.set_mode((10, 10))
+    page = Page(types.SimpleNamespace(display=display))
+    grid = Grid(rows=1, columns=1, size=(10, 10))
+    image = ResizableImage(pygame.Surface((4, 4)))
+    image.current_image = image.resized = pygame.Surface((4, 4), depth=16)  # Shared, as after re-sizing
+    grid.add_item(image, 0, 0)
+    page.add_item(grid)
+    assert sorted(name for _, name in page.audit_surfaces()) == ["current_image", "resized"]
+    assert page.estimate_memory() == 4 * 4 * 4 + 4 * 4 * 2
+    assert page.convert_surfaces() == 2
+    assert page.audit_surfaces() == []
+    assert image.current_image is image.resized
@@ -0,0 +1,54 @@
+import pytest
+
+from pyggui.gui import tween as tween_module
+from pyggui.gui.tween import TweenEngine, ease_in_out_quad
+
+
+class Box:
+    def __init__(self):
+        self.position = [0, 0]
+        self.color = (0, 0, 0)
+
+    def move_to(self, point):
+        self.position = list(point)
+
+
+def test_tweens_reach_end_and_call_on_complete():
+    engine = TweenEngine()
+    box, done = Box(), []
+    engine.move(box, (100, 50), 100, easing="linear", on_complete=lambda: done.append(True))
+    engine.color(box, (255, 128, 0), 200)
+    engine.update(50)
+    assert box.position == [50, 25]
+    engine.update(60)
+    assert box.position == [100, 50] and done == [True]
+    assert len(engine) == 1
+    engine.update(100)
+    assert box.color == (255, 128, 0) and not engine
+
+
+def test_cancelled_tween_stops():
+    engine = TweenEngine()
+    box, done = Box(), []
+    handle = engine.move(box, (100, 0), 100, on_complete=lambda: done.append(True))
+    handle.cancel()
+    engine.update(200)
+    assert box.position == [0, 0] and not done and not engine
+
+
+def test_vectorised_update_matches_loop(monkeypatch):
+    np = pytest.importorskip("numpy")
+    assert ease_in_out_quad(np.array([0.25]))[0] == ease_in_out_quad(0.25)
+    boxes = [Box() for _ in range(40)]
+    engine = TweenEngine()
+    for i, box in enumerate(boxes):
+        engine.move(box, (i * 10, 100), 100, easing="ease_in_out_quad" if i % 2 else "linear")
+    engine.update(25)
+    vectorised = [box.position for box in boxes]
+    monkeypatch.setattr(tween_module, "np", None)
+    boxes = [Box() for _ in range(40)]
+    engine = TweenEngine()
+    for i, box in enumerate(boxes):
+        engine.move(box, (i * 10, 100), 100, easing="ease_in_out_quad" if i % 2 else "linear")
+    engine.update(25)
+    assert vectorised == [box.position for box in boxes]